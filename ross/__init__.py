@@ -1,17 +1,38 @@
 __version__ = "1.3.0"
-from plotly import io as _pio
-
-import ross.plotly_theme
+from importlib import import_module
 
 from .bearing_seal_element import *
-from .defects import *
 from .disk_element import *
 from .materials import *
 from .point_mass import *
+from .reduction import *
 from .results import *
 from .rotor_assembly import *
 from .shaft_element import *
 from .units import Q_
 from .utils import get_data_from_figure, visualize_matrix
 
-_pio.templates.default = "ross"
+# modules that are only imported when first accessed (e.g. rs.Crack)
+_lazy_attributes = {
+    "defects": "ross.defects",
+    "fluid_flow": "ross.fluid_flow",
+    "Crack": "ross.defects",
+    "Integrator": "ross.defects",
+    "MisalignmentFlex": "ross.defects",
+    "MisalignmentRigid": "ross.defects",
+    "Rubbing": "ross.defects",
+}
+
+
+def __getattr__(name):
+    if name in _lazy_attributes:
+        module = import_module(_lazy_attributes[name])
+        if name == module.__name__.split(".")[-1]:
+            return module
+        return getattr(module, name)
+
+    raise AttributeError(f"module 'ross' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_attributes))
@@ -9,18 +9,17 @@ import warnings
 from inspect import signature
 
 import numpy as np
-import toml
 from numpy.polynomial import Polynomial
-from plotly import graph_objects as go
 from scipy import interpolate as interpolate
 
 from ross.element import Element
-from ross.fluid_flow import fluid_flow as flow
-from ross.fluid_flow.fluid_flow_coefficients import (
-    calculate_stiffness_and_damping_coefficients,
-)
 from ross.units import Q_, check_units
-from ross.utils import read_table_file
+from ross.utils import LazyModule, lazy_plotly, read_table_file
+
+go = lazy_plotly("plotly.graph_objects")
+toml = LazyModule("toml")
+flow = LazyModule("ross.fluid_flow.fluid_flow")
+flow_coefficients = LazyModule("ross.fluid_flow.fluid_flow_coefficients")
 
 __all__ = [
     "BearingElement",
@@ -99,9 +98,13 @@ class BearingElement(Element):
     >>> frequency = np.linspace(0, 200, 11)
     >>> bearing0 = rs.BearingElement(n=0, kxx=kxx, kyy=kyy, cxx=cxx, cyy=cyy, frequency=frequency)
     >>> bearing0.K(frequency) # doctest: +ELLIPSIS
-    array([[[1000000., 1000000., ...
+    array([[[1000000.,       0.],
+            [      0.,  800000.]],
+    ...
     >>> bearing0.C(frequency) # doctest: +ELLIPSIS
-    array([[[200., 200., ...
+    array([[[200.,   0.],
+            [  0., 150.]],
+    ...
     """
 
     @check_units
@@ -449,6 +452,39 @@ class BearingElement(Element):
         """
         return dict(x_0=0, y_0=1)
 
+    def _coefficients_matrix(self, coefficient, frequency):
+        """Build the stiffness or damping matrix for one or more frequencies.
+
+        Each interpolated coefficient is evaluated only once for the whole
+        frequency array.
+
+        Parameters
+        ----------
+        coefficient : str
+            "k" for the stiffness matrix or "c" for the damping matrix.
+        frequency : float, array
+            The excitation frequency (rad/s).
+
+        Returns
+        -------
+        matrix : np.ndarray
+            Element matrix with shape (2, 2) (or (4, 4) if n_link is used).
+            If frequency is an array, the matrices are stacked along the first
+            axis.
+        """
+        frequency = np.asarray(frequency, dtype=float)
+        xx, xy, yx, yy = (
+            getattr(self, f"{coefficient}{direction}_interpolated")(frequency)
+            for direction in ("xx", "xy", "yx", "yy")
+        )
+
+        matrix = np.moveaxis(np.array([[xx, xy], [yx, yy]]), (0, 1), (-2, -1))
+
+        if self.n_link is not None:
+            matrix = np.block([[matrix, -matrix], [-matrix, matrix]])
+
+        return matrix
+
     def M(self):
         """Mass matrix for an instance of a bearing element.
 
@@ -467,7 +503,7 @@ class BearingElement(Element):
         array([[0., 0.],
                [0., 0.]])
         """
-        M = np.zeros_like(self.K(0))
+        M = np.zeros_like(self._coefficients_matrix("k", 0))
 
         return M
 
@@ -480,13 +516,15 @@ class BearingElement(Element):
 
         Parameters
         ----------
-        frequency : float
+        frequency : float, array
             The excitation frequency (rad/s).
 
         Returns
         -------
         K : np.ndarray
             A 2x2 matrix of floats containing the kxx, kxy, kyx, and kyy values.
+            If frequency is an array, a (len(frequency), 2, 2) stack of matrices
+            is returned.
 
         Examples
         --------
@@ -494,19 +532,10 @@ class BearingElement(Element):
         >>> bearing.K(0)
         array([[1000000.,       0.],
                [      0.,  800000.]])
+        >>> bearing.K([0, 100]).shape
+        (2, 2, 2)
         """
-        kxx = self.kxx_interpolated(frequency)
-        kyy = self.kyy_interpolated(frequency)
-        kxy = self.kxy_interpolated(frequency)
-        kyx = self.kyx_interpolated(frequency)
-
-        K = np.array([[kxx, kxy], [kyx, kyy]])
-
-        if self.n_link is not None:
-            # fmt: off
-            K = np.vstack((np.hstack([K, -K]),
-                           np.hstack([-K, K])))
-            # fmt: on
+        K = self._coefficients_matrix("k", frequency)
 
         return K
 
@@ -519,13 +548,15 @@ class BearingElement(Element):
 
         Parameters
         ----------
-        frequency : float
+        frequency : float, array
             The excitation frequency (rad/s).
 
         Returns
         -------
         C : np.ndarray
             A 2x2 matrix of floats containing the cxx, cxy, cyx, and cyy values (N*s/m).
+            If frequency is an array, a (len(frequency), 2, 2) stack of matrices
+            is returned.
 
         Examples
         --------
@@ -534,18 +565,7 @@ class BearingElement(Element):
         array([[200.,   0.],
                [  0., 150.]])
         """
-        cxx = self.cxx_interpolated(frequency)
-        cyy = self.cyy_interpolated(frequency)
-        cxy = self.cxy_interpolated(frequency)
-        cyx = self.cyx_interpolated(frequency)
-
-        C = np.array([[cxx, cxy], [cyx, cyy]])
-
-        if self.n_link is not None:
-            # fmt: off
-            C = np.vstack((np.hstack([C, -C]),
-                           np.hstack([-C, C])))
-            # fmt: on
+        C = self._coefficients_matrix("c", frequency)
 
         return C
 
@@ -567,7 +587,7 @@ class BearingElement(Element):
         array([[0., 0.],
                [0., 0.]])
         """
-        G = np.zeros_like(self.K(0))
+        G = np.zeros_like(self._coefficients_matrix("k", 0))
 
         return G
 
@@ -933,7 +953,12 @@ class BearingFluidFlow(BearingElement):
                 eccentricity=eccentricity,
                 load=load,
             )
-            K[:, i], C[:, i] = calculate_stiffness_and_damping_coefficients(fluid_flow)
+            (
+                K[:, i],
+                C[:, i],
+            ) = flow_coefficients.calculate_stiffness_and_damping_coefficients(
+                fluid_flow
+            )
 
         super().__init__(
             n,
@@ -1032,9 +1057,13 @@ class SealElement(BearingElement):
     >>> frequency = np.linspace(0, 200, 11)
     >>> seal = rs.SealElement(n=0, kxx=kxx, kyy=kyy, cxx=cxx, cyy=cyy, frequency=frequency)
     >>> seal.K(frequency) # doctest: +ELLIPSIS
-    array([[[1000000., 1000000., ...
+    array([[[1000000.,       0.],
+            [      0.,  800000.]],
+    ...
     >>> seal.C(frequency) # doctest: +ELLIPSIS
-    array([[[200., 200., ...
+    array([[[200.,   0.],
+            [  0., 150.]],
+    ...
     """
 
     @check_units
@@ -1988,6 +2017,37 @@ class BearingElement6DoF(BearingElement):
         """
         return dict(x_0=0, y_0=1, z_0=2)
 
+    def _coefficients_matrix(self, coefficient, frequency):
+        """Build the stiffness or damping matrix for one or more frequencies.
+
+        Parameters
+        ----------
+        coefficient : str
+            "k" for the stiffness matrix or "c" for the damping matrix.
+        frequency : float, array
+            The excitation frequency (rad/s).
+
+        Returns
+        -------
+        matrix : np.ndarray
+            Element matrix with shape (3, 3). If frequency is an array, the
+            matrices are stacked along the first axis.
+        """
+        frequency = np.asarray(frequency, dtype=float)
+        xx, xy, yx, yy, zz = (
+            getattr(self, f"{coefficient}{direction}_interpolated")(frequency)
+            for direction in ("xx", "xy", "yx", "yy", "zz")
+        )
+        zero = np.zeros_like(xx)
+
+        # fmt: off
+        matrix = np.array([[xx,     xy, zero],
+                           [yx,     yy, zero],
+                           [zero, zero,   zz]])
+        # fmt: on
+
+        return np.moveaxis(matrix, (0, 1), (-2, -1))
+
     def K(self, frequency):
         """Stiffness matrix for an instance of a bearing element.
 
@@ -2011,13 +2071,7 @@ class BearingElement6DoF(BearingElement):
                [      0.,  800000.,       0.],
                [      0.,       0.,  100000.]])
         """
-        kxx = self.kxx_interpolated(frequency)
-        kyy = self.kyy_interpolated(frequency)
-        kxy = self.kxy_interpolated(frequency)
-        kyx = self.kyx_interpolated(frequency)
-        kzz = self.kzz_interpolated(frequency)
-
-        K = np.array([[kxx, kxy, 0], [kyx, kyy, 0], [0, 0, kzz]])
+        K = self._coefficients_matrix("k", frequency)
 
         return K
 
@@ -2044,13 +2098,7 @@ class BearingElement6DoF(BearingElement):
                [  0., 150.,   0.],
                [  0.,   0.,  50.]])
         """
-        cxx = self.cxx_interpolated(frequency)
-        cyy = self.cyy_interpolated(frequency)
-        cxy = self.cxy_interpolated(frequency)
-        cyx = self.cyx_interpolated(frequency)
-        czz = self.czz_interpolated(frequency)
-
-        C = np.array([[cxx, cxy, 0], [cyx, cyy, 0], [0, 0, czz]])
+        C = self._coefficients_matrix("c", frequency)
 
         return C
 
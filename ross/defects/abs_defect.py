@@ -4,9 +4,12 @@ import numpy as np
 import plotly.graph_objects as go
 import scipy as sp
 
+from ross.plotly_theme import set_ross_template
 from ross.results import TimeResponseResults
 from ross.units import Q_
 
+set_ross_template()
+
 __all__ = ["Defect"]
 
 
@@ -1,10 +1,13 @@
 import inspect
 from abc import ABC, abstractmethod
 from collections import namedtuple
+from itertools import count
 from pathlib import Path
 
-import pandas as pd
-import toml
+from ross.utils import LazyModule
+
+pd = LazyModule("pandas")
+toml = LazyModule("toml")
 
 
 class Element(ABC):
@@ -12,8 +15,20 @@ class Element(ABC):
 
     This class is a general abstract class to be implemented in other files, in order to
     create specific elements for the user.
+
+    Every attribute assignment updates the element state token, which is kept
+    in a slot (outside ``__dict__``) so that it does not take part in element
+    comparisons. Rotors use this token to know when a cached global matrix
+    has to be assembled again.
     """
 
+    __slots__ = ("_state",)
+    _state_counter = count()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        object.__setattr__(self, "_state", next(Element._state_counter))
+
     def __init__(self, n, tag=None):
         self.n = n
         self.tag = tag
@@ -199,7 +214,7 @@ class Element(ABC):
         n_l                           0
         n_r                           0...
         """
-        attributes = self.__dict__
+        attributes = dict(self.__dict__)
         attributes["type"] = self.__class__.__name__
         return pd.Series(attributes)
 
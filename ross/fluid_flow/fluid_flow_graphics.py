@@ -1,7 +1,9 @@
 import numpy as np
 from plotly import graph_objects as go
 
-from ross.plotly_theme import tableau_colors
+from ross.plotly_theme import set_ross_template, tableau_colors
+
+set_ross_template()
 
 
 def plot_eccentricity(fluid_flow_object, z=0, fig=None, scale_factor=1.0, **kwargs):
@@ -6,9 +6,11 @@ some of the most common materials used in rotors.
 from pathlib import Path
 
 import numpy as np
-import toml
 
 from .units import check_units
+from .utils import LazyModule
+
+toml = LazyModule("toml")
 
 __all__ = ["Material", "steel"]
 
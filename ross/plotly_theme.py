@@ -1,6 +1,8 @@
 """Plotly theme to ROSS - Rotordynamic Open Source Sofware."""
-from plotly import graph_objects as go
-from plotly import io as pio
+from ross.utils import LazyModule
+
+go = LazyModule("plotly.graph_objects")
+pio = LazyModule("plotly.io")
 
 # tableau colors
 tableau_colors = {
@@ -15,7 +17,8 @@ tableau_colors = {
     "olive": "#bcbd22",
     "cyan": "#17becf",
 }
-pio.templates["ross"] = go.layout.Template(
+# ross template, registered in plotly by set_ross_template()
+ross_template = dict(
     layout={
         "annotationdefaults": {
             "arrowcolor": "#2a3f5f",
@@ -381,3 +384,20 @@ pio.templates["ross"] = go.layout.Template(
         ],
     },
 )
+
+
+def set_ross_template():
+    """Register the ROSS template and set it as the plotly default template.
+
+    This is called automatically before the first plot is created by ross, so
+    that plotly is only imported when it is needed.
+
+    Examples
+    --------
+    >>> set_ross_template()
+    >>> pio.templates.default
+    'ross'
+    """
+    if "ross" not in pio.templates:
+        pio.templates["ross"] = go.layout.Template(**ross_template)
+        pio.templates.default = "ross"
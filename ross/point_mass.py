@@ -6,11 +6,13 @@ import os
 from pathlib import Path
 
 import numpy as np
-import toml
-from plotly import graph_objects as go
 
 from ross.element import Element
 from ross.units import check_units
+from ross.utils import LazyModule, lazy_plotly
+
+go = lazy_plotly("plotly.graph_objects")
+toml = LazyModule("toml")
 
 __all__ = ["PointMass"]
 
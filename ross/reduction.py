@@ -0,0 +1,540 @@
+"""Model order reduction module.
+
+This module defines the ReducedModel class and the functions used to reduce a
+rotor model: Guyan static condensation, modal truncation with static correction
+and Craig-Bampton. A reduced model can be passed to Rotor.run_modal(),
+Rotor.run_freq_response(), Rotor.run_unbalance_response() and
+Rotor.run_time_response(), which solve the reduced problem and return the
+results on the rotor degrees of freedom.
+"""
+import numpy as np
+from scipy import linalg as la
+from scipy.sparse import linalg as las
+
+from ross.utils import LazyModule
+
+signal = LazyModule("scipy.signal")
+
+__all__ = ["ReducedModel", "guyan", "modal_reduction", "craig_bampton"]
+
+
+class ReducedModel:
+    """A reduced order model of a rotor.
+
+    The rotor displacements q are approximated by q = T @ q_r, where T is the
+    transformation (or basis) matrix with shape (rotor.ndof, ndof) and q_r are the
+    reduced coordinates. The reduced matrices are the projections T^T X T of the
+    rotor matrices. M, G and Kst are projected once, while K and C are projected
+    for each frequency, so that frequency dependent bearings are kept.
+
+    Instances are usually created with ross.guyan(), ross.modal_reduction() or
+    ross.craig_bampton().
+
+    Parameters
+    ----------
+    rotor : ross.Rotor
+        The full rotor model.
+    T : array
+        Transformation matrix with shape (rotor.ndof, ndof).
+    method : str
+        Name of the reduction method.
+    dofs : array, optional
+        Rotor degrees of freedom kept as physical coordinates (master or boundary
+        dofs). Default is None.
+
+    Attributes
+    ----------
+    ndof : int
+        Number of reduced coordinates.
+
+    Examples
+    --------
+    >>> import ross as rs
+    >>> rotor = rs.rotor_example()
+    >>> reduced = rs.guyan(rotor)
+    >>> reduced
+    ReducedModel(method='guyan', ndof=16, rotor_ndof=28)
+    >>> modal = rotor.run_modal(speed=0, reduced=reduced)
+    >>> modal.wn[:2]
+    array([91.79828203, 96.2909552 ])
+    """
+
+    def __init__(self, rotor, T, method, dofs=None):
+        self.rotor = rotor
+        self.T = np.asarray(T)
+        self.method = method
+        self.dofs = None if dofs is None else np.asarray(dofs, dtype=int)
+        self.ndof = self.T.shape[1]
+
+        self._M = self.project(rotor.M(sparse=True))
+        self._Kst = self.project(rotor.Kst(sparse=True))
+        self._G = self.project(rotor.G(sparse=True))
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(method={self.method!r}, ndof={self.ndof}, "
+            f"rotor_ndof={self.rotor.ndof})"
+        )
+
+    def project(self, matrix):
+        """Project a rotor matrix onto the reduced coordinates (T^T X T).
+
+        Parameters
+        ----------
+        matrix : array, scipy.sparse matrix
+            Matrix with shape (rotor.ndof, rotor.ndof).
+
+        Returns
+        -------
+        reduced_matrix : array
+            Matrix with shape (ndof, ndof).
+        """
+        return self.T.T @ np.asarray(matrix @ self.T)
+
+    def expand(self, x):
+        """Expand reduced coordinates to the rotor degrees of freedom.
+
+        Parameters
+        ----------
+        x : array
+            Array with the reduced coordinates on its first axis, with length ndof,
+            or a state vector (displacements and velocities) with length 2 * ndof.
+
+        Returns
+        -------
+        x_full : array
+            Array with rotor.ndof (or 2 * rotor.ndof) rows.
+
+        Examples
+        --------
+        >>> import ross as rs
+        >>> rotor = rs.rotor_example()
+        >>> reduced = rs.guyan(rotor)
+        >>> reduced.expand(np.ones((reduced.ndof, 3))).shape
+        (28, 3)
+        """
+        x = np.asarray(x)
+        if x.shape[0] == 2 * self.ndof:
+            return np.concatenate(
+                [self.T @ x[: self.ndof], self.T @ x[self.ndof :]], axis=0
+            )
+        return self.T @ x
+
+    def reduce(self, x):
+        """Reduced coordinates that best approximate rotor displacements.
+
+        This is the least squares solution of T @ x_r = x. For Guyan and
+        Craig-Bampton models, the master (boundary) coordinates are the rotor
+        displacements at those dofs when x is in the span of T.
+
+        Parameters
+        ----------
+        x : array
+            Array with rotor.ndof (or 2 * rotor.ndof for a state vector) rows.
+
+        Returns
+        -------
+        x_r : array
+            Array with ndof (or 2 * ndof) rows.
+        """
+        x = np.asarray(x)
+        ndof = self.rotor.ndof
+        if x.shape[0] == 2 * ndof:
+            return np.concatenate([self.reduce(x[:ndof]), self.reduce(x[ndof:])])
+        return la.lstsq(self.T, x)[0]
+
+    def M(self):
+        """Reduced mass matrix."""
+        return self._M
+
+    def K(self, frequency):
+        """Reduced stiffness matrix for a given frequency (rad/s)."""
+        return self.project(self.rotor.K(frequency, sparse=True))
+
+    def Kst(self):
+        """Reduced stiffness matrix associated with the transient motion."""
+        return self._Kst
+
+    def C(self, frequency):
+        """Reduced damping matrix for a given frequency (rad/s)."""
+        return self.project(self.rotor.C(frequency, sparse=True))
+
+    def G(self):
+        """Reduced gyroscopic matrix."""
+        return self._G
+
+    def A(self, speed=0, frequency=None):
+        """Reduced state space matrix.
+
+        Parameters
+        ----------
+        speed : float
+            Rotor speed (rad/s).
+        frequency : float, optional
+            Excitation frequency. Default is the rotor speed.
+
+        Returns
+        -------
+        A : array
+            State space matrix with shape (2 * ndof, 2 * ndof).
+        """
+        if frequency is None:
+            frequency = speed
+
+        K = self.K(frequency) + self._Kst * speed
+        C = self.C(frequency) + self._G * speed
+        Minv_KC = la.solve(self._M, np.hstack([K, C]))
+
+        Z = np.zeros((self.ndof, self.ndof))
+        I = np.eye(self.ndof)
+
+        # fmt: off
+        A = np.vstack(
+            [np.hstack([Z, I]),
+             -Minv_KC]
+        )
+        # fmt: on
+
+        return A
+
+    def _eigen(self, speed, num_modes=12, frequency=None):
+        """Eigenvalues and expanded eigenvectors of the reduced model.
+
+        The eigenvalues are sorted as in Rotor._eigen(), with the positive ones
+        first, and only the num_modes eigenvalues closest to the lowest damped
+        natural frequencies are returned, as with the sparse solver.
+
+        Returns
+        -------
+        evalues : array
+            Array with num_modes eigenvalues.
+        evectors : array
+            Array with shape (2 * rotor.ndof, num_modes).
+        """
+        if num_modes > 2 * self.ndof:
+            raise ValueError(
+                f"num_modes ({num_modes}) must not be larger than two times the "
+                f"number of reduced coordinates ({self.ndof})."
+            )
+        evalues, evectors = la.eig(self.A(speed, frequency))
+        idx = self.rotor._index(evalues)
+
+        n = num_modes // 2
+        idx = np.concatenate([idx[:n], idx[2 * self.ndof - n :]])
+
+        return evalues[idx], self.expand(evectors[:, idx])
+
+    def _dynamic_stiffness(self, speed_range, speed=None):
+        """Reduced dynamic stiffness matrices for a frequency range.
+
+        Yields
+        ------
+        Z : array
+            Matrix K(w) + w Kst - w² M + i w (C(w) + w G) in reduced coordinates,
+            with w replaced by the fixed speed in K, Kst, C and G if given.
+        """
+        for w in speed_range:
+            s = w if speed is None else speed
+            frequency = w if speed is None else speed
+            yield (
+                self.K(frequency)
+                + s * self._Kst
+                - w**2 * self._M
+                + 1j * w * (self.C(frequency) + s * self._G)
+            )
+
+    def _freq_response(self, speed_range, rows=None, cols=None, speed=None):
+        """Frequency response of the reduced model.
+
+        The transfer matrix is H = T Z_r^-1 T^T and only the requested rows and
+        columns of T are used to expand it.
+
+        Returns
+        -------
+        freq_resp : array
+            Array with shape (len(rows), len(cols), len(speed_range)).
+        """
+        ndof = self.rotor.ndof
+        rows = np.arange(ndof) if rows is None else np.asarray(rows)
+        cols = np.arange(ndof) if cols is None else np.asarray(cols)
+        T_rows = self.T[rows]
+        T_cols = self.T[cols].T
+
+        freq_resp = np.empty((len(rows), len(cols), len(speed_range)), dtype=complex)
+        for i, Z in enumerate(self._dynamic_stiffness(speed_range, speed)):
+            freq_resp[..., i] = T_rows @ la.solve(Z, T_cols)
+
+        return freq_resp
+
+    def _forced_response(self, force, speed_range):
+        """Forced response of the reduced model, expanded to the rotor dofs.
+
+        Returns
+        -------
+        forced_resp : array
+            Array with shape (rotor.ndof, len(speed_range)).
+        """
+        force = self.T.T @ np.asarray(force)[:, : len(speed_range)]
+
+        forced_resp = np.empty((self.ndof, len(speed_range)), dtype=complex)
+        for i, Z in enumerate(self._dynamic_stiffness(speed_range)):
+            forced_resp[:, i] = la.solve(Z, force[:, i])
+
+        return self.T @ forced_resp
+
+    def _lti(self, speed, frequency=None):
+        """Continuous-time linear time invariant system of the reduced model.
+
+        The inputs are the forces on the rotor dofs (B = [0; M_r^-1 T^T]) and the
+        outputs are the rotor displacements (C = [T, 0]), so that the system can
+        be used in place of Rotor._lti().
+        """
+        Z = np.zeros((self.ndof, self.rotor.ndof))
+
+        A = self.A(speed, frequency)
+        B = np.vstack([Z, la.solve(self._M, self.T.T)])
+        C = np.hstack([self.T, Z.T])
+        D = np.zeros((self.rotor.ndof, self.rotor.ndof))
+
+        return signal.lti(A, B, C, D)
+
+
+def _node_dofs(rotor, nodes):
+    """Global degrees of freedom of a list of nodes.
+
+    All the dofs of each node are returned, including the dofs of nodes that only
+    exist in point masses or bearings (n_link).
+    """
+    nodes = {int(n) for n in np.atleast_1d(nodes)}
+    dofs = set()
+    for elm in rotor.elements:
+        for name, dof in elm.dof_global_index.items():
+            if int(name.rsplit("_", 1)[1]) in nodes:
+                dofs.add(dof)
+
+    if not dofs:
+        raise ValueError(f"There are no degrees of freedom at nodes {sorted(nodes)}.")
+
+    return np.array(sorted(dofs), dtype=int)
+
+
+def _bearing_nodes(rotor):
+    """Nodes of the bearings, including their link nodes."""
+    nodes = []
+    for elm in rotor.bearing_elements:
+        nodes.append(elm.n)
+        if getattr(elm, "n_link", None) is not None:
+            nodes.append(elm.n_link)
+
+    return nodes
+
+
+def _default_nodes(rotor):
+    """Bearing and disk nodes, used as master nodes by default."""
+    return _bearing_nodes(rotor) + [elm.n for elm in rotor.disk_elements]
+
+
+def _static_modes(K, masters):
+    """Static (constraint) modes of the dofs that are not masters.
+
+    Returns the slave dofs and -K_ss^-1 K_sm, the displacement of the slave dofs
+    for unit displacements of the master dofs.
+    """
+    K = K.tocsc()
+    slaves = np.setdiff1d(np.arange(K.shape[0]), masters)
+    K_ss = K[slaves][:, slaves]
+    K_sm = K[slaves][:, masters]
+
+    return slaves, -las.splu(K_ss.tocsc()).solve(K_sm.toarray())
+
+
+def _lowest_modes(K, M, num_modes):
+    """Lowest undamped modes of the sparse pencil (K, M), mass normalized.
+
+    The modes are calculated with shift-invert about zero.
+    """
+    # the basis comes from the symmetric part of the stiffness, so that rotors
+    # with cross-coupled bearings (kxy != kyx) still have a real basis
+    K = ((K + K.T) / 2).tocsc()
+    M = M.tocsc()
+    if num_modes >= K.shape[0] - 1:
+        # arpack needs num_modes < n - 1, small problems use a dense solver
+        _, modes = la.eigh(K.toarray(), M.toarray(), subset_by_index=[0, num_modes - 1])
+        return modes
+
+    try:
+        evalues, modes = las.eigsh(K, k=num_modes, M=M, sigma=0)
+    except RuntimeError:
+        # singular stiffness (rigid body modes), shift slightly below zero
+        shift = 1e-8 * abs(K.diagonal()).max() / abs(M.diagonal()).max()
+        evalues, modes = las.eigsh(K, k=num_modes, M=M, sigma=-shift)
+
+    modes = modes[:, np.argsort(evalues)]
+    modes /= np.sqrt(np.einsum("ij,ij->j", modes, M @ modes))
+
+    return modes
+
+
+def guyan(rotor, nodes=None, frequency=0):
+    """Guyan static condensation of a rotor.
+
+    The rotor is condensed onto all the degrees of freedom of the master nodes. The
+    remaining (slave) dofs follow the static deflection caused by the master
+    dofs: q_s = -K_ss^-1 K_sm q_m. The condensation is exact for static loads on
+    the master dofs and accurate for the modes whose inertia is concentrated on
+    them.
+
+    Parameters
+    ----------
+    rotor : ross.Rotor
+        The rotor to be reduced.
+    nodes : list, optional
+        Master nodes (e.g. bearings, disks and probes).
+        Default is the bearing and disk nodes.
+    frequency : float, optional
+        Frequency (rad/s) at which the stiffness matrix used for the condensation
+        is evaluated. Default is 0.
+
+    Returns
+    -------
+    reduced : ross.ReducedModel
+        Reduced model whose coordinates are the displacements of the master dofs.
+
+    Examples
+    --------
+    >>> import ross as rs
+    >>> rotor = rs.rotor_example()
+    >>> reduced = rs.guyan(rotor, nodes=[0, 2, 3, 4, 6])
+    >>> reduced.dofs
+    array([ 0,  1,  2,  3,  8,  9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 24,
+           25, 26, 27])
+    """
+    masters = _node_dofs(rotor, _default_nodes(rotor) if nodes is None else nodes)
+    slaves, static_modes = _static_modes(rotor.K(frequency, sparse=True), masters)
+
+    T = np.zeros((rotor.ndof, len(masters)))
+    T[masters, np.arange(len(masters))] = 1.0
+    T[slaves] = static_modes
+
+    return ReducedModel(rotor, T, "guyan", masters)
+
+
+def modal_reduction(
+    rotor, num_modes=12, nodes=None, static_correction=True, frequency=0
+):
+    """Modal truncation of a rotor.
+
+    The rotor is projected onto its lowest undamped and non-gyroscopic modes,
+    from the eigenvalue problem K(frequency) v = w² M v. With static correction,
+    the static response to unit loads on the dofs of the given nodes is added to
+    the basis (after removing the part already spanned by the modes), so that the
+    static deflection under loads on those nodes is exact.
+
+    Parameters
+    ----------
+    rotor : ross.Rotor
+        The rotor to be reduced.
+    num_modes : int, optional
+        Number of modes kept. Default is 12.
+    nodes : list, optional
+        Nodes where loads are applied, used for the static correction (e.g.
+        unbalance and bearing nodes). Default is the bearing and disk nodes.
+    static_correction : bool, optional
+        If True, the static correction vectors are added to the basis.
+        Default is True.
+    frequency : float, optional
+        Frequency (rad/s) at which the stiffness matrix is evaluated.
+        Default is 0.
+
+    Returns
+    -------
+    reduced : ross.ReducedModel
+        Reduced model whose basis is mass normalized (T^T M T = I).
+
+    Examples
+    --------
+    >>> import ross as rs
+    >>> rotor = rs.rotor_example()
+    >>> reduced = rs.modal_reduction(rotor, num_modes=8, nodes=[3])
+    >>> reduced.ndof
+    12
+    >>> np.allclose(reduced.M(), np.eye(reduced.ndof))
+    True
+    """
+    K = rotor.K(frequency, sparse=True)
+    M = rotor.M(sparse=True)
+    modes = _lowest_modes(K, M, num_modes)
+
+    if static_correction:
+        dofs = _node_dofs(rotor, _default_nodes(rotor) if nodes is None else nodes)
+        loads = np.zeros((rotor.ndof, len(dofs)))
+        loads[dofs, np.arange(len(dofs))] = 1.0
+        try:
+            residual = las.splu(K.tocsc()).solve(loads)
+        except RuntimeError:
+            # singular stiffness (rigid body modes), use a slightly shifted
+            # stiffness, the basis is still a valid Ritz basis.
+            shift = 1e-8 * abs(K.diagonal()).max() / abs(M.diagonal()).max()
+            residual = las.splu((K + shift * M).tocsc()).solve(loads)
+
+        # remove the modal part and mass normalize the residual vectors
+        residual -= modes @ (modes.T @ (M @ residual))
+        w, v = la.eigh(residual.T @ (M @ residual))
+        keep = w > 1e-10 * w.max()
+        residual = residual @ (v[:, keep] / np.sqrt(w[keep]))
+        modes = np.hstack([modes, residual])
+
+    return ReducedModel(rotor, modes, "modal")
+
+
+def craig_bampton(rotor, num_modes=12, nodes=None, frequency=0):
+    """Craig-Bampton reduction of a rotor.
+
+    The boundary dofs (all the dofs of the boundary nodes) are kept as physical
+    coordinates and the interior dofs are described by the static constraint modes
+    of the boundary dofs and by the lowest fixed interface modes, calculated with
+    the boundary dofs clamped.
+
+    Parameters
+    ----------
+    rotor : ross.Rotor
+        The rotor to be reduced.
+    num_modes : int, optional
+        Number of fixed interface modes. Default is 12.
+    nodes : list, optional
+        Boundary nodes. Default is the bearing nodes.
+    frequency : float, optional
+        Frequency (rad/s) at which the stiffness matrix is evaluated.
+        Default is 0.
+
+    Returns
+    -------
+    reduced : ross.ReducedModel
+        Reduced model whose first coordinates are the boundary dofs displacements,
+        followed by the fixed interface modal coordinates.
+
+    Examples
+    --------
+    >>> import ross as rs
+    >>> rotor = rs.rotor_example()
+    >>> reduced = rs.craig_bampton(rotor, num_modes=8)
+    >>> reduced.ndof
+    16
+    """
+    boundary = _node_dofs(rotor, _bearing_nodes(rotor) if nodes is None else nodes)
+    K = rotor.K(frequency, sparse=True)
+    interior, static_modes = _static_modes(K, boundary)
+
+    M = rotor.M(sparse=True).tocsc()
+    K_ii = K.tocsc()[interior][:, interior]
+    M_ii = M[interior][:, interior]
+    num_modes = min(num_modes, len(interior))
+    fixed_modes = _lowest_modes(K_ii, M_ii, num_modes)
+
+    nb = len(boundary)
+    T = np.zeros((rotor.ndof, nb + num_modes))
+    T[boundary, np.arange(nb)] = 1.0
+    T[np.ix_(interior, np.arange(nb))] = static_modes
+    T[np.ix_(interior, np.arange(nb, nb + num_modes))] = fixed_modes
+
+    return ReducedModel(rotor, T, "craig_bampton", boundary)
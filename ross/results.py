@@ -9,15 +9,16 @@ from collections.abc import Iterable
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
-import toml
-from plotly import graph_objects as go
-from plotly.subplots import make_subplots
 from scipy import linalg as la
 
 from ross.plotly_theme import tableau_colors
 from ross.units import Q_, check_units
-from ross.utils import intersection
+from ross.utils import LazyModule, intersection, lazy_plotly
+
+go = lazy_plotly("plotly.graph_objects")
+plotly_subplots = lazy_plotly("plotly.subplots")
+pd = LazyModule("pandas")
+toml = LazyModule("toml")
 
 __all__ = [
     "Orbit",
@@ -742,14 +743,38 @@ class CriticalSpeedResults(Results):
         Damping ratio for each critical speed.
     whirl_direction : array
         Whirl direction for each critical speed. Can be forward, backward or mixed.
+    iterations : array, optional
+        Number of iterations for the undamped (first column) and damped (second
+        column) values of each critical speed.
+    eigen_solves : int, optional
+        Number of eigenvalue problems solved.
+    eigen_time : float, optional
+        Time (s) spent solving the eigenvalue problems.
+    total_time : float, optional
+        Total time (s) of the analysis.
     """
 
-    def __init__(self, _wn, _wd, log_dec, damping_ratio, whirl_direction):
+    def __init__(
+        self,
+        _wn,
+        _wd,
+        log_dec,
+        damping_ratio,
+        whirl_direction,
+        iterations=None,
+        eigen_solves=None,
+        eigen_time=None,
+        total_time=None,
+    ):
         self._wn = _wn
         self._wd = _wd
         self.log_dec = log_dec
         self.damping_ratio = damping_ratio
         self.whirl_direction = whirl_direction
+        self.iterations = iterations
+        self.eigen_solves = eigen_solves
+        self.eigen_time = eigen_time
+        self.total_time = total_time
 
     def wn(self, frequency_units="rad/s"):
         """Convert units for undamped critical speeds.
@@ -1544,14 +1569,22 @@ class FrequencyResponseResults(Results):
     ----------
     freq_resp : array
         Array with the frequency response (displacement).
-    velc_resp : array
+    velc_resp : array, None
         Array with the frequency response (velocity).
-    accl_resp : array
+        If None, it is calculated from freq_resp when requested.
+    accl_resp : array, None
         Array with the frequency response (acceleration).
+        If None, it is calculated from freq_resp when requested.
     speed_range : array
         Array with the speed range in rad/s.
     number_dof : int
         Number of degrees of freedom per node.
+    inp : array, optional
+        Global degrees of freedom of the first axis of freq_resp, if the response
+        was calculated only for some of them. Default is None (all).
+    out : array, optional
+        Global degrees of freedom of the second axis of freq_resp, if the response
+        was calculated only for some of them. Default is None (all).
 
     Returns
     -------
@@ -1559,18 +1592,93 @@ class FrequencyResponseResults(Results):
         Plotly figure with Amplitude vs Frequency and Phase vs Frequency plots.
     """
 
-    def __init__(self, freq_resp, velc_resp, accl_resp, speed_range, number_dof):
+    def __init__(
+        self,
+        freq_resp,
+        velc_resp,
+        accl_resp,
+        speed_range,
+        number_dof,
+        inp=None,
+        out=None,
+    ):
         self.freq_resp = freq_resp
-        self.velc_resp = velc_resp
-        self.accl_resp = accl_resp
+        self._velc_resp = velc_resp
+        self._accl_resp = accl_resp
         self.speed_range = speed_range
         self.number_dof = number_dof
+        self.inp = inp
+        self.out = out
 
         if self.number_dof == 4:
             self.dof_dict = {"0": "x", "1": "y", "2": "α", "3": "β"}
         elif self.number_dof == 6:
             self.dof_dict = {"0": "x", "1": "y", "2": "z", "4": "α", "5": "β", "6": "θ"}
 
+    @property
+    def velc_resp(self):
+        """Frequency response (velocity)."""
+        if self._velc_resp is None:
+            return 1j * np.asarray(self.speed_range) * self.freq_resp
+        return self._velc_resp
+
+    @property
+    def accl_resp(self):
+        """Frequency response (acceleration)."""
+        if self._accl_resp is None:
+            return -(np.asarray(self.speed_range) ** 2) * self.freq_resp
+        return self._accl_resp
+
+    def _response(self, inp, out, kind="freq"):
+        """Frequency response for an input and output pair.
+
+        Only the requested pair is calculated for the velocity and acceleration
+        responses.
+
+        Parameters
+        ----------
+        inp : int
+            Input.
+        out : int
+            Output.
+        kind : str, optional
+            "freq", "velc" or "accl" for the displacement, velocity or acceleration
+            responses. Default is "freq".
+
+        Returns
+        -------
+        response : array
+            Complex response for each frequency.
+        """
+        i = self._dof_index(inp, self.inp)
+        o = self._dof_index(out, self.out)
+        speed_range = np.asarray(self.speed_range)
+
+        if kind == "velc":
+            if self._velc_resp is not None:
+                return self._velc_resp[i, o, :]
+            return 1j * speed_range * self.freq_resp[i, o, :]
+        if kind == "accl":
+            if self._accl_resp is not None:
+                return self._accl_resp[i, o, :]
+            return -(speed_range**2) * self.freq_resp[i, o, :]
+
+        return self.freq_resp[i, o, :]
+
+    @staticmethod
+    def _dof_index(dof, dofs):
+        """Position of a global degree of freedom in the stored response."""
+        if dofs is None:
+            return dof
+
+        idx = np.flatnonzero(np.asarray(dofs) == dof)
+        if len(idx) == 0:
+            raise ValueError(
+                f"The response was not calculated for dof {dof}. "
+                f"Available dofs are {list(dofs)}."
+            )
+        return idx[0]
+
     def plot_magnitude(
         self,
         inp,
@@ -1629,13 +1737,13 @@ class FrequencyResponseResults(Results):
         dummy_var = Q_(1, amplitude_units)
         y_label = "Magnitude"
         if dummy_var.check("[length]/[force]"):
-            mag = np.abs(self.freq_resp)
+            mag = np.abs(self._response(inp, out, "freq"))
             mag = Q_(mag, "m/N").to(amplitude_units).m
         elif dummy_var.check("[speed]/[force]"):
-            mag = np.abs(self.velc_resp)
+            mag = np.abs(self._response(inp, out, "velc"))
             mag = Q_(mag, "m/s/N").to(amplitude_units).m
         elif dummy_var.check("[acceleration]/[force]"):
-            mag = np.abs(self.accl_resp)
+            mag = np.abs(self._response(inp, out, "accl"))
             mag = Q_(mag, "m/s**2/N").to(amplitude_units).m
         else:
             raise ValueError(
@@ -1649,7 +1757,7 @@ class FrequencyResponseResults(Results):
         fig.add_trace(
             go.Scatter(
                 x=frequency_range,
-                y=mag[inp, out, :],
+                y=mag,
                 mode="lines",
                 line=dict(color=list(tableau_colors)[idx]),
                 name=f"inp: node {inpn} | dof: {idof}<br>out: node {outn} | dof: {odof}",
@@ -1728,11 +1836,11 @@ class FrequencyResponseResults(Results):
 
         dummy_var = Q_(1, amplitude_units)
         if dummy_var.check("[length]/[force]"):
-            phase = np.angle(self.freq_resp[inp, out, :])
+            phase = np.angle(self._response(inp, out, "freq"))
         elif dummy_var.check("[speed]/[force]"):
-            phase = np.angle(self.velc_resp[inp, out, :])
+            phase = np.angle(self._response(inp, out, "velc"))
         elif dummy_var.check("[acceleration]/[force]"):
-            phase = np.angle(self.accl_resp[inp, out, :])
+            phase = np.angle(self._response(inp, out, "accl"))
         else:
             raise ValueError(
                 "Not supported unit. Options are '[length]/[force]', '[speed]/[force]', '[acceleration]/[force]'"
@@ -1835,19 +1943,19 @@ class FrequencyResponseResults(Results):
 
         dummy_var = Q_(1, amplitude_units)
         if dummy_var.check("[length]/[force]"):
-            mag = np.abs(self.freq_resp[inp, out, :])
+            mag = np.abs(self._response(inp, out, "freq"))
             mag = Q_(mag, "m/N").to(amplitude_units).m
-            phase = np.angle(self.freq_resp[inp, out, :])
+            phase = np.angle(self._response(inp, out, "freq"))
             y_label = "Displacement"
         elif dummy_var.check("[speed]/[force]"):
-            mag = np.abs(self.velc_resp[inp, out, :])
+            mag = np.abs(self._response(inp, out, "velc"))
             mag = Q_(mag, "m/s/N").to(amplitude_units).m
-            phase = np.angle(self.velc_resp[inp, out, :])
+            phase = np.angle(self._response(inp, out, "velc"))
             y_label = "Velocity"
         elif dummy_var.check("[acceleration]/[force]"):
-            mag = np.abs(self.accl_resp[inp, out, :])
+            mag = np.abs(self._response(inp, out, "accl"))
             mag = Q_(mag, "m/s**2/N").to(amplitude_units).m
-            phase = np.angle(self.accl_resp[inp, out, :])
+            phase = np.angle(self._response(inp, out, "accl"))
             y_label = "Acceleration"
         else:
             raise ValueError(
@@ -1998,7 +2106,7 @@ class FrequencyResponseResults(Results):
         )
 
         if fig is None:
-            fig = make_subplots(
+            fig = plotly_subplots.make_subplots(
                 rows=2,
                 cols=2,
                 specs=[[{}, {"type": "polar", "rowspan": 2}], [{}, None]],
@@ -2620,7 +2728,7 @@ class ForcedResponseResults(Results):
         )
         # fmt: on
 
-        subplots = make_subplots(
+        subplots = plotly_subplots.make_subplots(
             rows=2,
             cols=2,
             specs=[[{}, {"type": "polar", "rowspan": 2}], [{}, None]],
@@ -3362,7 +3470,7 @@ class ForcedResponseResults(Results):
             **bm_kwargs,
         )
 
-        subplots = make_subplots(
+        subplots = plotly_subplots.make_subplots(
             rows=2,
             cols=2,
             specs=[[{}, {"type": "scene", "rowspan": 2}], [{}, None]],
@@ -3556,7 +3664,7 @@ class StaticResults(Results):
         col = cols = 1
         row = rows = 1
         if fig is None:
-            fig = make_subplots(
+            fig = plotly_subplots.make_subplots(
                 rows=rows,
                 cols=cols,
                 subplot_titles=["Free-Body Diagram"],
@@ -3924,7 +4032,7 @@ class SummaryResults(Results):
             "Bearing force": list(self.brg_forces.values()),
         }
 
-        fig = make_subplots(
+        fig = plotly_subplots.make_subplots(
             rows=2,
             cols=2,
             specs=[
@@ -4047,6 +4155,8 @@ class ConvergenceResults(Results):
         Array with the n'th natural frequency in each iteraction
     error_arr : array
         Array with the relative error in each iteraction
+    extrapolated : float, optional
+        Natural frequency obtained with Richardson extrapolation.
 
     Returns
     -------
@@ -4054,10 +4164,11 @@ class ConvergenceResults(Results):
         The figure object with the plot.
     """
 
-    def __init__(self, el_num, eigv_arr, error_arr):
+    def __init__(self, el_num, eigv_arr, error_arr, extrapolated=None):
         self.el_num = el_num
         self.eigv_arr = eigv_arr
         self.error_arr = error_arr
+        self.extrapolated = extrapolated
 
     def plot(self, fig=None, **kwargs):
         """Plot convergence results.
@@ -4081,7 +4192,7 @@ class ConvergenceResults(Results):
             The figure object with the plot.
         """
         if fig is None:
-            fig = make_subplots(
+            fig = plotly_subplots.make_subplots(
                 rows=1,
                 cols=2,
                 subplot_titles=["Frequency Evaluation", "Relative Error Evaluation"],
@@ -4151,8 +4262,13 @@ class TimeResponseResults(Results):
         Time values for the output.
     yout : array
         System response.
-    xout : array
-        Time evolution of the state vector.
+    xout : array, optional
+        Time evolution of the state vector. None if only some dofs are stored.
+        Default is None.
+    dofs : array, optional
+        Global degrees of freedom stored in yout, one per column. yout may be a
+        memory map, which is read only for the dofs that are plotted.
+        Default is None (all dofs are stored).
 
     Returns
     -------
@@ -4160,11 +4276,24 @@ class TimeResponseResults(Results):
         The figure object with the plot.
     """
 
-    def __init__(self, rotor, t, yout, xout):
+    def __init__(self, rotor, t, yout, xout=None, dofs=None):
         self.t = t
         self.yout = yout
         self.xout = xout
         self.rotor = rotor
+        self.dofs = dofs
+
+    def _response(self, dof):
+        """Displacement of a global dof for all time steps."""
+        if self.dofs is None:
+            return self.yout[:, dof]
+
+        column = np.searchsorted(self.dofs, dof)
+        if column == len(self.dofs) or self.dofs[column] != dof:
+            raise ValueError(
+                f"The response of dof {dof} was not stored. Stored dofs: {self.dofs}."
+            )
+        return np.asarray(self.yout[:, column])
 
     def plot_1d(
         self,
@@ -4214,17 +4343,11 @@ class TimeResponseResults(Results):
         fig : Plotly graph_objects.Figure()
             The figure object with the plot.
         """
-        nodes = self.rotor.nodes
-        link_nodes = self.rotor.link_nodes
-        ndof = self.rotor.number_dof
-
         if fig is None:
             fig = go.Figure()
 
         for i, p in enumerate(probe):
-            fix_dof = (p[0] - nodes[-1] - 1) * ndof // 2 if p[0] in link_nodes else 0
-            dofx = ndof * p[0] - fix_dof
-            dofy = ndof * p[0] + 1 - fix_dof
+            dofx, dofy = self.rotor._node_xy_dofs(p[0])
 
             angle = Q_(p[1], probe_units).to("rad").m
 
@@ -4234,7 +4357,7 @@ class TimeResponseResults(Results):
                  [np.cos(angle), + np.sin(angle)]]
             )
 
-            _probe_resp = operator @ np.vstack((self.yout[:, dofx], self.yout[:, dofy]))
+            _probe_resp = operator @ np.vstack((self._response(dofx), self._response(dofy)))
             probe_resp = (
                 _probe_resp[0] * np.cos(angle) ** 2 +
                 _probe_resp[1] * np.sin(angle) ** 2
@@ -4290,21 +4413,15 @@ class TimeResponseResults(Results):
         fig : Plotly graph_objects.Figure()
             The figure object with the plot.
         """
-        nodes = self.rotor.nodes
-        link_nodes = self.rotor.link_nodes
-        ndof = self.rotor.number_dof
-
-        fix_dof = (node - nodes[-1] - 1) * ndof // 2 if node in link_nodes else 0
-        dofx = ndof * node - fix_dof
-        dofy = ndof * node + 1 - fix_dof
+        dofx, dofy = self.rotor._node_xy_dofs(node)
 
         if fig is None:
             fig = go.Figure()
 
         fig.add_trace(
             go.Scatter(
-                x=Q_(self.yout[:, dofx], "m").to(displacement_units).m,
-                y=Q_(self.yout[:, dofy], "m").to(displacement_units).m,
+                x=Q_(self._response(dofx), "m").to(displacement_units).m,
+                y=Q_(self._response(dofy), "m").to(displacement_units).m,
                 mode="lines",
                 name="Orbit",
                 legendgroup="Orbit",
@@ -4358,12 +4475,18 @@ class TimeResponseResults(Results):
             fig = go.Figure()
 
         for n in nodes:
+            if (
+                self.dofs is not None
+                and not np.isin([ndof * n, ndof * n + 1], self.dofs).all()
+            ):
+                # only the stored nodes are plotted
+                continue
             x_pos = np.ones(self.yout.shape[0]) * nodes_pos[n]
             fig.add_trace(
                 go.Scatter3d(
                     x=Q_(x_pos, "m").to(rotor_length_units).m,
-                    y=Q_(self.yout[:, ndof * n], "m").to(displacement_units).m,
-                    z=Q_(self.yout[:, ndof * n + 1], "m").to(displacement_units).m,
+                    y=Q_(self._response(ndof * n), "m").to(displacement_units).m,
+                    z=Q_(self._response(ndof * n + 1), "m").to(displacement_units).m,
                     mode="lines",
                     line=dict(color=tableau_colors["blue"]),
                     name="Mean",
@@ -4710,11 +4833,15 @@ class Level1Results(Results):
         Stiffness array used in the calculation.
     log_dec : array
         Calculated log dec array for each cross coupling.
+    q0 : float, optional
+        Cross coupled stiffness where the log dec is zero. None if the log dec
+        does not change sign within the stiffness range.
     """
 
-    def __init__(self, stiffness_range, log_dec):
+    def __init__(self, stiffness_range, log_dec, q0=None):
         self.stiffness_range = stiffness_range
         self.log_dec = log_dec
+        self.q0 = q0
 
     def plot(self, fig=None, **kwargs):
         """Plot level 1 stability analysis.
@@ -4754,6 +4881,19 @@ class Level1Results(Results):
             )
         )
 
+        if self.q0 is not None:
+            fig.add_trace(
+                go.Scatter(
+                    x=[self.q0],
+                    y=[0.0],
+                    mode="markers",
+                    marker=dict(size=10),
+                    name="Q0",
+                    showlegend=False,
+                    hovertemplate="Q0: %{x:.2e}",
+                )
+            )
+
         fig.update_xaxes(
             title_text="Applied Cross Coupled Stiffness", exponentformat="power"
         )
@@ -1,23 +1,23 @@
 import inspect
+import os
 import sys
+import time
 import warnings
-from collections import Counter
+from collections import Counter, OrderedDict
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from copy import copy, deepcopy
 from itertools import chain, cycle
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
-import toml
-from plotly import express as px
-from plotly import graph_objects as go
-from scipy import io as sio
 from scipy import linalg as la
-from scipy import signal as signal
+from scipy import sparse as sp
 from scipy.interpolate import UnivariateSpline
-from scipy.optimize import newton
+from scipy.optimize import brentq, linear_sum_assignment, newton
 from scipy.sparse import linalg as las
+from scipy.sparse.csgraph import reverse_cuthill_mckee
 
 from ross.bearing_seal_element import (
     BallBearingElement,
@@ -28,9 +28,8 @@ from ross.bearing_seal_element import (
     RollerBearingElement,
     SealElement,
 )
-from ross.defects import Crack, MisalignmentFlex, MisalignmentRigid, Rubbing
 from ross.disk_element import DiskElement, DiskElement6DoF
-from ross.materials import steel
+from ross.materials import Material, steel
 from ross.point_mass import PointMass
 from ross.results import (
     CampbellResults,
@@ -46,13 +45,163 @@ from ross.results import (
     UCSResults,
 )
 from ross.shaft_element import ShaftElement, ShaftElement6DoF
-from ross.units import Q_, check_units
-from ross.utils import intersection
+from ross.units import Q_, check_units, unchecked
+from ross.utils import LazyModule, intersection, lazy_plotly
+
+go = lazy_plotly("plotly.graph_objects")
+pd = LazyModule("pandas")
+toml = LazyModule("toml")
+sio = LazyModule("scipy.io")
+signal = LazyModule("scipy.signal")
+defects = LazyModule("ross.defects")
 
 __all__ = ["Rotor", "CoAxialRotor", "rotor_example", "coaxrotor_example"]
 
-# set Plotly palette of colors
-colors = px.colors.qualitative.Dark24
+# rotor shipped once to each process of a pool (see Rotor._map_speed_range)
+_worker_rotor = None
+
+
+def _init_worker(rotor):
+    global _worker_rotor
+    _worker_rotor = rotor
+
+
+def _call_worker(method, *args):
+    return getattr(_worker_rotor, method)(*args)
+
+
+class _ProjectedForce:
+    """Rows of a force array projected onto reduced coordinates, on access."""
+
+    def __init__(self, F, T):
+        self.F = F
+        self.T = T
+
+    def __getitem__(self, n):
+        return np.asarray(self.F[n]) @ self.T
+
+
+class _StateOperator(las.LinearOperator):
+    """State space matrix of a rotor in factored form (see Rotor.A()).
+
+    A = [[0, I], [-M^-1 K, -M^-1 C]] is applied with the sparse LU factorization
+    of M, so M^-1 K and M^-1 C, which are dense, are never formed. solve()
+    applies the inverse of A with a sparse LU factorization of K, for
+    shift-invert about zero.
+    """
+
+    def __init__(self, M, K, C):
+        self.n = M.shape[0]
+        super().__init__(dtype=np.dtype(float), shape=(2 * self.n, 2 * self.n))
+        self.K = K.tocsc()
+        self.C = C.tocsc()
+        self.M = M.tocsc()
+        self.M_lu = las.splu(self.M)
+        self.K_lu = None
+
+    @staticmethod
+    def _lu_solve(lu, b):
+        if np.iscomplexobj(b):
+            return lu.solve(np.ascontiguousarray(b.real)) + 1j * lu.solve(
+                np.ascontiguousarray(b.imag)
+            )
+        return lu.solve(np.ascontiguousarray(b, dtype=float))
+
+    def _matmat(self, X):
+        u, v = X[: self.n], X[self.n :]
+        return np.vstack([v, -self._lu_solve(self.M_lu, self.K @ u + self.C @ v)])
+
+    def _matvec(self, x):
+        return self._matmat(x.reshape(-1, 1)).ravel()
+
+    def solve(self, B):
+        """Solve A X = B."""
+        if self.K_lu is None:
+            self.K_lu = las.splu(self.K)
+        b_u, b_v = B[: self.n], B[self.n :]
+        u = -self._lu_solve(self.K_lu, self.M @ b_v + self.C @ b_u)
+        return np.concatenate([u, b_u])
+
+
+class _CrossCoupledPencil:
+    """Pencil of a rotor with a cross coupled stiffness q added at a node.
+
+    The cross coupled stiffness adds K[x, y] += q and K[y, x] -= q, so the pencil
+    (P, Q) of the rotor (see Rotor._pencil()) changes by a rank 2 update:
+
+        P(q) = P + U (q D) V^T
+
+    Shifted systems P(q) - sigma Q are solved for any value of q with a single
+    sparse LU factorization of P - sigma Q (Sherman-Morrison-Woodbury formula),
+    and eigenpairs are tracked along q by shifted inverse iteration.
+    """
+
+    def __init__(self, rotor, n, speed):
+        self.P, self.Q = rotor._pencil(speed)
+        x, y = rotor._node_xy_dofs(n)
+        self.rows = [rotor.ndof + x, rotor.ndof + y]
+        self.cols = [y, x]
+        self.d = np.array([-1.0, 1.0])
+        self.xdofs = rotor.number_dof * np.asarray(rotor.nodes)
+        self.sigma = None
+
+    def update(self, q):
+        """Sparse pencil matrix P(q)."""
+        return self.P + sp.csc_matrix(
+            (q * self.d, (self.rows, self.cols)), shape=self.P.shape
+        )
+
+    def factorize(self, sigma):
+        """Factorize P - sigma Q and the Woodbury correction terms."""
+        self.sigma = sigma
+        self.lu = las.splu((self.P - sigma * self.Q).tocsc())
+        U = np.zeros((self.P.shape[0], 2), dtype=complex)
+        U[self.rows, [0, 1]] = 1.0
+        self.Z = self.lu.solve(U)
+        self.VZ = self.Z[self.cols]
+
+    def solve(self, q, b):
+        """Solve (P(q) - sigma Q) x = b."""
+        x = self.lu.solve(b)
+        qd = q * self.d
+        S = np.eye(2) + qd[:, np.newaxis] * self.VZ
+        return x - self.Z @ np.linalg.solve(S, qd * x[self.cols])
+
+    def backward(self, evector):
+        """Check if a mode is backward, with the criterion of ModalResults."""
+        u, v = evector[self.xdofs], evector[self.xdofs + 1]
+        forward, backward = np.abs(u + 1j * v), np.abs(u - 1j * v)
+        with np.errstate(invalid="ignore"):
+            kappa = (forward - backward) / (forward + backward)
+
+        return all(kappa <= 1e-3) and not all(kappa >= -1e-3)
+
+    def track(self, q, evalue, evector, rtol=1e-9, maxiter=30):
+        """Eigenpair of P(q) closest to a previous eigenpair.
+
+        Inverse iteration starts from evector with the current shift. If the
+        iteration is slow, the shift has drifted away from the eigenvalue, and the
+        pencil is factorized again at the new eigenvalue.
+        """
+        if self.sigma is None:
+            self.factorize(evalue)
+
+        for i in range(maxiter):
+            evector = self.solve(q, self.Q @ evector)
+            evector /= np.linalg.norm(evector)
+            Px = self.P @ evector
+            Px[self.rows] += q * self.d * evector[self.cols]
+            Qx = self.Q @ evector
+            evalue = np.vdot(Qx, Px) / np.vdot(Qx, Qx)
+            if np.linalg.norm(Px - evalue * Qx) <= rtol * np.linalg.norm(Px):
+                break
+            if i == maxiter // 2:
+                self.factorize(evalue)
+
+        if i > 3:
+            self.factorize(evalue)
+
+        return evalue, evector
 
 
 class Rotor(object):
@@ -212,133 +361,86 @@ class Rotor(object):
         self.number_dof = self._check_number_dof()
 
         ####################################################
-        # Rotor summary
+        # Rotor topology
         ####################################################
-        columns = [
-            "type",
-            "n",
-            "n_link",
-            "L",
-            "node_pos",
-            "node_pos_r",
-            "idl",
-            "odl",
-            "idr",
-            "odr",
-            "i_d",
-            "o_d",
-            "beam_cg",
-            "axial_cg_pos",
-            "y_pos",
-            "material",
-            "rho",
-            "volume",
-            "m",
-            "tag",
-        ]
-
-        df_shaft = pd.DataFrame([el.summary() for el in self.shaft_elements])
-        df_disks = pd.DataFrame([el.summary() for el in self.disk_elements])
-        df_bearings = pd.DataFrame(
-            [
-                el.summary()
-                for el in self.bearing_elements
-                if not (isinstance(el, SealElement))
-            ]
-        )
-        df_seals = pd.DataFrame(
-            [
-                el.summary()
-                for el in self.bearing_elements
-                if (isinstance(el, SealElement))
-            ]
-        )
-        df_point_mass = pd.DataFrame([el.summary() for el in self.point_mass_elements])
-
-        nodes_pos_l = np.zeros(len(df_shaft.n_l))
-        nodes_pos_r = np.zeros(len(df_shaft.n_l))
-        axial_cg_pos = np.zeros(len(df_shaft.n_l))
-
-        for i, sh in enumerate(self.shaft_elements):
-            if i == 0:
-                nodes_pos_r[i] = nodes_pos_r[i] + df_shaft.loc[i, "L"]
-                axial_cg_pos[i] = sh.beam_cg + nodes_pos_l[i]
-                sh.axial_cg_pos = axial_cg_pos[i]
-                continue
-            if df_shaft.loc[i, "n_l"] == df_shaft.loc[i - 1, "n_l"]:
-                nodes_pos_l[i] = nodes_pos_l[i - 1]
-                nodes_pos_r[i] = nodes_pos_r[i - 1]
-            else:
-                nodes_pos_l[i] = nodes_pos_r[i - 1]
-                nodes_pos_r[i] = nodes_pos_l[i] + df_shaft.loc[i, "L"]
-            axial_cg_pos[i] = sh.beam_cg + nodes_pos_l[i]
-            sh.axial_cg_pos = axial_cg_pos[i]
-
-        df_shaft["nodes_pos_l"] = nodes_pos_l
-        df_shaft["nodes_pos_r"] = nodes_pos_r
-        df_shaft["axial_cg_pos"] = axial_cg_pos
-
-        df = pd.concat(
-            [df_shaft, df_disks, df_bearings, df_point_mass, df_seals], sort=True
-        )
-        df = df.sort_values(by="n_l")
-        df = df.reset_index(drop=True)
-        df["shaft_number"] = np.zeros(len(df))
-
-        df_shaft["shaft_number"] = np.zeros(len(df_shaft))
-        df_disks["shaft_number"] = np.zeros(len(df_disks))
-        df_bearings["shaft_number"] = np.zeros(len(df_bearings))
-        df_seals["shaft_number"] = np.zeros(len(df_seals))
-        df_point_mass["shaft_number"] = np.zeros(len(df_point_mass))
-
-        self.df_disks = df_disks
-        self.df_bearings = df_bearings
-        self.df_shaft = df_shaft
-        self.df_point_mass = df_point_mass
-        self.df_seals = df_seals
+        shaft_n_l = np.array([sh.n_l for sh in self.shaft_elements])
+        shaft_n_r = np.array([sh.n_r for sh in self.shaft_elements])
+        shaft_L = np.array([sh.L for sh in self.shaft_elements], dtype=float)
+
+        # shaft elements with the same left node (e.g. layers of a section)
+        # share the same axial positions
+        first_in_node = np.r_[True, shaft_n_l[1:] != shaft_n_l[:-1]]
+        node_index = np.cumsum(first_in_node) - 1
+        nodes_pos_r = np.cumsum(shaft_L[first_in_node])
+        nodes_pos_l = np.r_[0.0, nodes_pos_r[:-1]]
+
+        self._shaft_nodes_pos_l = nodes_pos_l[node_index]
+        self._shaft_nodes_pos_r = nodes_pos_r[node_index]
+        for sh, pos_l in zip(self.shaft_elements, self._shaft_nodes_pos_l):
+            sh.axial_cg_pos = sh.beam_cg + pos_l
 
         # check consistence for disks and bearings location
-        if len(df_point_mass) > 0:
-            max_loc_point_mass = df_point_mass.n.max()
-        else:
-            max_loc_point_mass = 0
-        max_location = max(df_shaft.n_r.max(), max_loc_point_mass)
-        if df.n_l.max() > max_location:
+        max_location = max([shaft_n_r.max()] + [p.n for p in point_mass_elements])
+        max_elements_location = max(
+            [elm.n for elm in chain(disk_elements, bearing_elements)], default=0
+        )
+        if max_elements_location > max_location:
             raise ValueError("Trying to set disk or bearing outside shaft")
 
         # nodes axial position and diameter
-        nodes_pos = list(df_shaft.groupby("n_l")["nodes_pos_l"].max())
-        nodes_pos.append(df_shaft["nodes_pos_r"].iloc[-1])
+        nodes_pos = list(nodes_pos_l) + [nodes_pos_r[-1]]
         self.nodes_pos = nodes_pos
         self.nodes = list(range(len(self.nodes_pos)))
 
-        nodes_i_d = []
-        for n in self.nodes:
-            nodes_i_d.append(
-                self.df_shaft[
-                    (self.df_shaft.n_l == n) | (self.df_shaft.n_r == n)
-                ].i_d.min()
-            )
-        self.nodes_i_d = nodes_i_d
-
-        nodes_o_d = []
-        for n in self.nodes:
-            nodes_o_d.append(
-                self.df_shaft[
-                    (self.df_shaft.n_l == n) | (self.df_shaft.n_r == n)
-                ].o_d.max()
-            )
-        self.nodes_o_d = nodes_o_d
-
-        shaft_elements_length = list(df_shaft.groupby("n_l")["L"].min())
+        n_nodes = max(len(self.nodes), shaft_n_r.max() + 1)
+        shaft_i_d = np.array([sh.i_d for sh in self.shaft_elements])
+        shaft_o_d = np.array([sh.o_d for sh in self.shaft_elements])
+        nodes_i_d = np.full(n_nodes, np.inf)
+        nodes_o_d = np.full(n_nodes, -np.inf)
+        for shaft_nodes in (shaft_n_l, shaft_n_r):
+            np.minimum.at(nodes_i_d, shaft_nodes, shaft_i_d)
+            np.maximum.at(nodes_o_d, shaft_nodes, shaft_o_d)
+        nodes_i_d[np.isinf(nodes_i_d)] = np.nan
+        nodes_o_d[np.isinf(nodes_o_d)] = np.nan
+        self.nodes_i_d = list(nodes_i_d[: len(self.nodes)])
+        self.nodes_o_d = list(nodes_o_d[: len(self.nodes)])
+
+        shaft_elements_length = list(
+            np.minimum.reduceat(shaft_L, np.flatnonzero(first_in_node))
+        )
         self.shaft_elements_length = shaft_elements_length
 
         self.L = nodes_pos[-1]
 
-        if "n_link" in df.columns:
-            self.link_nodes = list(df["n_link"].dropna().unique().astype(int))
-        else:
-            self.link_nodes = []
+        self.link_nodes = sorted(
+            {
+                int(elm.n_link)
+                for elm in self.elements
+                if getattr(elm, "n_link", None) is not None
+            }
+        )
+
+        # bearings axial position
+        # bearings on shaft nodes take the node position. Bearings on nodes
+        # added with n_link take the position of the element they are linked to.
+        bearings_z_pos = {}
+        nodes_z_pos = dict(enumerate(self.nodes_pos))
+        unresolved = list(self.bearing_elements)
+        while unresolved:
+            remaining = []
+            for b in unresolved:
+                if b.n in nodes_z_pos:
+                    bearings_z_pos[b.tag] = nodes_z_pos[b.n]
+                    if b.n_link is not None:
+                        nodes_z_pos.setdefault(b.n_link, nodes_z_pos[b.n])
+                else:
+                    remaining.append(b)
+            if len(remaining) == len(unresolved):
+                raise ValueError(
+                    f"The following bearing is not connected to the rotor. Check n_link. {remaining[0]}"
+                )
+            unresolved = remaining
+        self._bearings_z_pos = bearings_z_pos
 
         # rotor mass can also be calculated with self.M()[::4, ::4].sum()
         self.m_disks = np.sum([disk.m for disk in self.disk_elements])
@@ -359,6 +461,7 @@ class Rotor(object):
         self.Ip = Ip_sh + Ip_dsk
 
         self._v0 = None  # used to call eigs
+        self._modal_cache = None  # see Rotor.enable_modal_cache()
 
         # number of dofs
         self.ndof = int(
@@ -404,51 +507,89 @@ class Rotor(object):
                     )
 
             elm.dof_global_index = global_dof_mapping
-            df.at[
-                df.loc[df.tag == elm.tag].index[0], "dof_global_index"
-            ] = elm.dof_global_index
+
+        self._set_assembly_indexes()
+
+    _dataframes = (
+        "df",
+        "df_shaft",
+        "df_disks",
+        "df_bearings",
+        "df_seals",
+        "df_point_mass",
+    )
+
+    def __getattr__(self, name):
+        # the dataframes are only used by summary() and plot_rotor(), so they are
+        # built on the first access instead of in __init__.
+        if name in Rotor._dataframes and "shaft_elements" in self.__dict__:
+            self._build_dataframes()
+            return self.__dict__[name]
+
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def _build_dataframes(self):
+        """Build the dataframes with the rotor elements data.
+
+        This method sets self.df, with all the rotor elements, and self.df_shaft,
+        self.df_disks, self.df_bearings, self.df_seals and self.df_point_mass.
+        """
+        df_shaft = pd.DataFrame([el.summary() for el in self.shaft_elements])
+        df_disks = pd.DataFrame([el.summary() for el in self.disk_elements])
+        df_bearings = pd.DataFrame(
+            [
+                el.summary()
+                for el in self.bearing_elements
+                if not (isinstance(el, SealElement))
+            ]
+        )
+        df_seals = pd.DataFrame(
+            [
+                el.summary()
+                for el in self.bearing_elements
+                if (isinstance(el, SealElement))
+            ]
+        )
+        df_point_mass = pd.DataFrame([el.summary() for el in self.point_mass_elements])
+
+        df_shaft["nodes_pos_l"] = self._shaft_nodes_pos_l
+        df_shaft["nodes_pos_r"] = self._shaft_nodes_pos_r
+        df_shaft["axial_cg_pos"] = [sh.axial_cg_pos for sh in self.shaft_elements]
+
+        df = pd.concat(
+            [df_shaft, df_disks, df_bearings, df_point_mass, df_seals], sort=True
+        )
+        df = df.sort_values(by="n_l")
+        df = df.reset_index(drop=True)
+        df["shaft_number"] = np.zeros(len(df))
+
+        df_shaft["shaft_number"] = np.zeros(len(df_shaft))
+        df_disks["shaft_number"] = np.zeros(len(df_disks))
+        df_bearings["shaft_number"] = np.zeros(len(df_bearings))
+        df_seals["shaft_number"] = np.zeros(len(df_seals))
+        df_point_mass["shaft_number"] = np.zeros(len(df_point_mass))
+
+        dof_global_index = {elm.tag: elm.dof_global_index for elm in self.elements}
+        df["dof_global_index"] = [dof_global_index[tag] for tag in df.tag]
+
+        # row of each element in df
+        rows = {tag: i for i, tag in zip(df.index, df.tag)}
 
         # define positions for disks
-        for disk in disk_elements:
-            z_pos = nodes_pos[disk.n]
-            y_pos = nodes_o_d[disk.n]
-            df.loc[df.tag == disk.tag, "nodes_pos_l"] = z_pos
-            df.loc[df.tag == disk.tag, "nodes_pos_r"] = z_pos
-            df.loc[df.tag == disk.tag, "y_pos"] = y_pos
+        for disk in self.disk_elements:
+            z_pos = self.nodes_pos[disk.n]
+            y_pos = self.nodes_o_d[disk.n]
+            df.loc[rows[disk.tag], ["nodes_pos_l", "nodes_pos_r", "y_pos"]] = [
+                z_pos,
+                z_pos,
+                y_pos,
+            ]
 
         # define positions for bearings
-        # check if there are bearings without location
-        bearings_no_zloc = {
-            b
-            for b in bearing_elements
-            if pd.isna(df.loc[df.tag == b.tag, "nodes_pos_l"]).all()
-        }
-        # cycle while there are bearings without a z location
-        for b in cycle(self.bearing_elements):
-            if bearings_no_zloc:
-                if b in bearings_no_zloc:
-                    # first check if b.n is on list, if not, check for n_link
-                    node_l = df.loc[(df.n_l == b.n) & (df.tag != b.tag), "nodes_pos_l"]
-                    node_r = df.loc[(df.n_r == b.n) & (df.tag != b.tag), "nodes_pos_r"]
-                    if len(node_l) == 0 and len(node_r) == 0:
-                        node_l = df.loc[
-                            (df.n_link == b.n) & (df.tag != b.tag), "nodes_pos_l"
-                        ]
-                        if len(node_l) == 0:
-                            raise ValueError(
-                                f"The following bearing is not connected to the rotor. Check n_link. {b}"
-                            )
-                        node_r = node_l
-                    if len(node_l):
-                        df.loc[df.tag == b.tag, "nodes_pos_l"] = node_l.values[0]
-                        df.loc[df.tag == b.tag, "nodes_pos_r"] = node_l.values[0]
-                        bearings_no_zloc.discard(b)
-                    elif len(node_r):
-                        df.loc[df.tag == b.tag, "nodes_pos_l"] = node_r.values[0]
-                        df.loc[df.tag == b.tag, "nodes_pos_r"] = node_r.values[0]
-                        bearings_no_zloc.discard(b)
-            else:
-                break
+        for tag, z_pos in self._bearings_z_pos.items():
+            df.loc[rows[tag], ["nodes_pos_l", "nodes_pos_r"]] = [z_pos, z_pos]
 
         # TODO fix this so that we don't have to add here every custom bearing class
         classes = [
@@ -463,6 +604,7 @@ class Rotor(object):
         dfb = df[df.type.isin(classes)]
         z_positions = [pos for pos in dfb["nodes_pos_l"]]
         z_positions = list(dict.fromkeys(z_positions))
+        mean_od = np.mean(self.nodes_o_d)
         for z_pos in z_positions:
             dfb_z_pos = dfb[dfb.nodes_pos_l == z_pos]
             dfb_z_pos = dfb_z_pos.sort_values(by="n_l")
@@ -502,27 +644,34 @@ class Rotor(object):
                     )
                     / 2
                 )
-            mean_od = np.mean(nodes_o_d)
             # use a 0.5 factor here based on plot experience for real machines
             scale_size = 0.5 * dfb["scale_factor"] * mean_od
             y_pos_sup = y_pos + 2 * scale_size
 
             for t in dfb_z_pos.tag:
-                df.loc[df.tag == t, "y_pos"] = y_pos
-                df.loc[df.tag == t, "y_pos_sup"] = y_pos_sup
-                y_pos += mean_od * df["scale_factor"][df.tag == t].values[0]
-                y_pos_sup += mean_od * df["scale_factor"][df.tag == t].values[0]
+                row = rows[t]
+                df.loc[row, "y_pos"] = y_pos
+                df.loc[row, "y_pos_sup"] = y_pos_sup[row]
+                y_pos += mean_od * df.at[row, "scale_factor"]
+                y_pos_sup += mean_od * df.at[row, "scale_factor"]
 
         # define position for point mass elements
         dfb = df[df.type.isin(classes)]
-        for p in point_mass_elements:
+        for p in self.point_mass_elements:
             z_pos = dfb[dfb.n_l == p.n]["nodes_pos_l"].values[0]
             y_pos = dfb[dfb.n_l == p.n]["y_pos"].values[0]
-            df.loc[df.tag == p.tag, "nodes_pos_l"] = z_pos
-            df.loc[df.tag == p.tag, "nodes_pos_r"] = z_pos
-            df.loc[df.tag == p.tag, "y_pos"] = y_pos
+            df.loc[rows[p.tag], ["nodes_pos_l", "nodes_pos_r", "y_pos"]] = [
+                z_pos,
+                z_pos,
+                y_pos,
+            ]
 
         self.df = df
+        self.df_shaft = df_shaft
+        self.df_disks = df_disks
+        self.df_bearings = df_bearings
+        self.df_seals = df_seals
+        self.df_point_mass = df_point_mass
 
     def _check_number_dof(self):
         """Verify the consistency of degrees of freedom.
@@ -564,33 +713,371 @@ class Rotor(object):
 
         return int(number_dof)
 
-    def __eq__(self, other):
-        """Equality method for comparasions.
+    def _set_assembly_indexes(self):
+        """Precompute the indexes used to assemble the global matrices.
+
+        The global dofs of each element are expanded into the row and column
+        indexes of every entry of the element matrix (COO triplets). This is done
+        only once, so that assembling a global matrix is reduced to concatenating
+        the element matrices.
+        """
+        self._elements_dofs = [
+            np.array(list(elm.dof_global_index.values()), dtype=int)
+            for elm in self.elements
+        ]
+
+        position = {id(elm): i for i, elm in enumerate(self.elements)}
+
+        # elements with frequency dependent coefficients are assembled on every
+        # call, the remaining ones are assembled once and cached.
+        takes_frequency = {}
+        for elm in self.elements:
+            if type(elm) not in takes_frequency:
+                takes_frequency[type(elm)] = any(
+                    "frequency" in inspect.signature(matrix).parameters
+                    for matrix in (elm.K, elm.C)
+                )
+        frequency_dependent = [takes_frequency[type(elm)] for elm in self.elements]
+
+        groups = {
+            "all": range(len(self.elements)),
+            "shaft": [position[id(sh)] for sh in self.shaft_elements],
+            "constant": [i for i, f in enumerate(frequency_dependent) if not f],
+            "frequency": [i for i, f in enumerate(frequency_dependent) if f],
+        }
+
+        self._assembly_indexes = {}
+        for group, elements_position in groups.items():
+            dofs = [self._elements_dofs[i] for i in elements_position]
+            rows = [np.repeat(d, len(d)) for d in dofs]
+            cols = [np.tile(d, len(d)) for d in dofs]
+            rows = np.concatenate(rows) if rows else np.array([], dtype=int)
+            cols = np.concatenate(cols) if cols else np.array([], dtype=int)
+            self._assembly_indexes[group] = (list(elements_position), rows, cols)
+
+        self.clear_cache()
+
+    def _assemble(self, element_matrices, group="all", sparse=False, nfreq=None):
+        """Assemble a global matrix from the element matrices.
 
         Parameters
         ----------
-        other : obj
-            parameter for comparasion
+        element_matrices : list
+            List with one matrix for each element in the group, in the same order
+            used in self.elements. If nfreq is given, each item is a stack of
+            element matrices with shape (nfreq, n, n).
+        group : str, optional
+            Group of elements being assembled ("all", "shaft", "constant" or
+            "frequency").
+            Default is "all".
+        sparse : bool, optional
+            If True, a scipy.sparse.csr_matrix is returned.
+            Default is False.
+        nfreq : int, optional
+            Number of frequencies in a batch assembly. If given, a
+            (nfreq, ndof, ndof) array (or a list of nfreq sparse matrices) is
+            returned.
+            Default is None.
 
         Returns
         -------
-        True if other is equal to the reference parameter.
-        False if not.
+        global_matrix : np.ndarray, scipy.sparse.csr_matrix, list
+            Global matrix with shape (ndof, ndof).
         """
-        if self.elements == other.elements and self.parameters == other.parameters:
-            return True
-        else:
-            return False
+        _, rows, cols = self._assembly_indexes[group]
 
-    @check_units
-    def run_modal(self, speed, num_modes=12, sparse=True):
-        """Run modal analysis.
+        if nfreq is not None:
+            data = np.hstack(
+                [np.reshape(m, (nfreq, -1)) for m in element_matrices]
+                or [np.zeros((nfreq, 0))]
+            )
+            if sparse:
+                return [
+                    sp.csr_matrix((d, (rows, cols)), shape=(self.ndof, self.ndof))
+                    for d in data
+                ]
 
-        Method to calculate eigenvalues and eigvectors for a given rotor system.
-        Tthe natural frequencies and dampings ratios are calculated for a given
-        rotor speed. It means that for each speed input there's a different set of
-        eigenvalues and eigenvectors, hence, different natural frequencies and damping
-        ratios are returned.
+            # sum the entries of all frequencies at once with a scatter matrix
+            scatter = sp.csr_matrix(
+                (np.ones(len(rows)), (rows * self.ndof + cols, np.arange(len(rows)))),
+                shape=(self.ndof**2, len(rows)),
+            )
+
+            return (scatter @ data.T).T.reshape((nfreq, self.ndof, self.ndof))
+
+        data = np.concatenate([np.ravel(m) for m in element_matrices] or [[]])
+
+        if sparse:
+            return sp.csr_matrix((data, (rows, cols)), shape=(self.ndof, self.ndof))
+
+        global_matrix = np.bincount(
+            rows * self.ndof + cols, weights=data, minlength=self.ndof**2
+        )
+
+        return global_matrix.reshape((self.ndof, self.ndof))
+
+    def _group_elements(self, group):
+        """Return the elements that belong to an assembly group."""
+        elements_position = self._assembly_indexes[group][0]
+
+        return [self.elements[i] for i in elements_position]
+
+    def _cached_matrix(self, name, assemble, sparse=False):
+        """Return a copy of a cached global matrix.
+
+        The matrix is assembled with assemble(sparse) on the first call and kept
+        until one of the rotor elements is modified. If only the sparse matrix is
+        cached, the dense matrix is obtained from it instead of being assembled.
+
+        Parameters
+        ----------
+        name : str
+            Name used to store the matrix.
+        assemble : callable
+            Function that receives the sparse flag and returns the global matrix.
+        sparse : bool, optional
+            If True, the sparse version of the matrix is returned.
+            Default is False.
+
+        Returns
+        -------
+        matrix : np.ndarray, scipy.sparse.csr_matrix
+            Copy of the cached matrix.
+        """
+        states = self._elements_state()
+        if states != self._cache_states:
+            self._matrix_cache = {}
+            self._cache_states = states
+
+        key = (name, sparse)
+        if key not in self._matrix_cache:
+            if not sparse and (name, True) in self._matrix_cache:
+                return self._matrix_cache[name, True].toarray()
+            self._matrix_cache[key] = assemble(sparse)
+
+        return self._matrix_cache[key].copy()
+
+    def clear_cache(self):
+        """Clear the cached global matrices.
+
+        The frequency independent global matrices (M, G, Kst and the shaft, disk
+        and point mass contributions to K and C) are assembled only once and
+        reused in the following calls. The cache is discarded automatically when
+        an attribute of one of the rotor elements is changed, but changes that
+        are not made directly on the elements (e.g. editing the material of a
+        shaft element in place) are not tracked. In that case this method should
+        be called before running a new analysis.
+
+        Examples
+        --------
+        >>> from ross.materials import Material
+        >>> rotor = rotor_example()
+        >>> M = rotor.M()
+        >>> rotor.shaft_elements[0].material = Material("Steel", rho=15620, E=211e9, G_s=81.2e9)
+        >>> np.allclose(rotor.M(), M)
+        False
+        >>> rotor.shaft_elements[0].material.rho = 7810
+        >>> np.allclose(rotor.M(), M)
+        False
+        >>> rotor.clear_cache()
+        >>> np.allclose(rotor.M(), M)
+        True
+        """
+        self._matrix_cache = {}
+        self._cache_states = None
+        if self._modal_cache is not None:
+            self._modal_cache["entries"].clear()
+            self._modal_cache["nbytes"] = 0
+
+    def _elements_state(self):
+        """Fingerprint of the rotor elements.
+
+        Tuple with the state token of each element, which changes every time
+        an element attribute is set.
+        """
+        return tuple(getattr(elm, "_state", None) for elm in self.elements)
+
+    def _prime_cache(self, shaft_prototypes):
+        """Assemble the cached global matrices with shared shaft element matrices.
+
+        The shaft element matrices are calculated only once for each prototype
+        element, and the sparse global matrices are stored as if they had been
+        assembled by _cached_matrix(). Dense matrices are obtained from them when
+        requested, so they are not stored (e.g. in rotors pickled back from the
+        processes of convergence()).
+
+        Parameters
+        ----------
+        shaft_prototypes : list
+            Element with the same matrices as each shaft element, in the order of
+            self.shaft_elements.
+        """
+        prototype = dict(zip(map(id, self.shaft_elements), shaft_prototypes))
+        memo = {}
+
+        def matrix(elm, name):
+            proto = prototype.get(id(elm))
+            if proto is None:
+                return getattr(elm, name)()
+            if (id(proto), name) not in memo:
+                memo[id(proto), name] = getattr(proto, name)()
+            return memo[id(proto), name]
+
+        groups = {"M": "all", "G": "all", "K": "constant", "C": "constant"}
+        if self.number_dof == 6:
+            groups["Kst"] = "shaft"
+
+        self._matrix_cache = {}
+        self._cache_states = self._elements_state()
+        for name, group in groups.items():
+            global_matrix = self._assemble(
+                [matrix(elm, name) for elm in self._group_elements(group)],
+                group=group,
+                sparse=True,
+            )
+            self._matrix_cache[name, True] = global_matrix
+
+    def enable_modal_cache(self, maxsize=32, max_bytes=None):
+        """Keep the results of run_modal() in a least recently used cache.
+
+        Analyses such as run_critical_speed(), run_ucs() and run_freq_response()
+        call run_modal() several times, often for the same speed. With the cache
+        enabled, the results are stored with the run_modal() arguments and the
+        fingerprint of the rotor elements, and a shallow copy of the stored
+        ModalResults is returned when run_modal() is called again with the same
+        arguments. The copies share their arrays (evalues, evectors, ...) with the
+        cache, so they are read-only: they must not be modified in place. The
+        cache is discarded when one of the rotor elements is modified or when
+        clear_cache() is called.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of results kept in the cache. Default is 32.
+        max_bytes : int, optional
+            Maximum memory (in bytes) of the arrays of the cached results. The
+            least recently used results are discarded to satisfy both limits.
+            Default is None (no memory limit).
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> rotor.enable_modal_cache(maxsize=8)
+        >>> modal = rotor.run_modal(speed=0)
+        >>> rotor.run_modal(speed=0).evectors is modal.evectors
+        True
+        >>> info = rotor.modal_cache_info()
+        >>> info["hits"], info["misses"], info["size"]
+        (1, 1, 1)
+        """
+        self._modal_cache = {
+            "entries": OrderedDict(),
+            "maxsize": maxsize,
+            "max_bytes": max_bytes,
+            "states": self._elements_state(),
+            "hits": 0,
+            "misses": 0,
+            "nbytes": 0,
+        }
+
+    def disable_modal_cache(self):
+        """Disable and discard the run_modal() cache (see enable_modal_cache())."""
+        self._modal_cache = None
+
+    def modal_cache_info(self):
+        """Statistics of the run_modal() cache (see enable_modal_cache()).
+
+        Returns
+        -------
+        info : dict, None
+            Dictionary with the number of hits and misses, the number of stored
+            results (size), the memory used by them in bytes (nbytes) and the
+            cache limits (maxsize and max_bytes). None if the cache is disabled.
+        """
+        if self._modal_cache is None:
+            return None
+
+        cache = self._modal_cache
+        return {
+            "hits": cache["hits"],
+            "misses": cache["misses"],
+            "size": len(cache["entries"]),
+            "nbytes": cache["nbytes"],
+            "maxsize": cache["maxsize"],
+            "max_bytes": cache["max_bytes"],
+        }
+
+    def _modal_cache_get(self, key):
+        """Return the cached results for key or None (see enable_modal_cache())."""
+        cache = self._modal_cache
+        states = self._elements_state()
+        if states != cache["states"]:
+            cache["entries"].clear()
+            cache["nbytes"] = 0
+            cache["states"] = states
+
+        if key in cache["entries"]:
+            cache["hits"] += 1
+            cache["entries"].move_to_end(key)
+            return copy(cache["entries"][key][0])
+
+        cache["misses"] += 1
+        return None
+
+    def _modal_cache_put(self, key, results):
+        """Store results for key, discarding the least recently used ones."""
+        cache = self._modal_cache
+        nbytes = sum(
+            value.nbytes
+            for value in vars(results).values()
+            if isinstance(value, np.ndarray)
+        )
+        if cache["max_bytes"] is not None and nbytes > cache["max_bytes"]:
+            return
+
+        cache["entries"][key] = (copy(results), nbytes)
+        cache["nbytes"] += nbytes
+        while len(cache["entries"]) > cache["maxsize"] or (
+            cache["max_bytes"] is not None and cache["nbytes"] > cache["max_bytes"]
+        ):
+            _, (_, old_nbytes) = cache["entries"].popitem(last=False)
+            cache["nbytes"] -= old_nbytes
+
+    def __eq__(self, other):
+        """Equality method for comparasions.
+
+        Parameters
+        ----------
+        other : obj
+            parameter for comparasion
+
+        Returns
+        -------
+        True if other is equal to the reference parameter.
+        False if not.
+        """
+        if self.elements == other.elements and self.parameters == other.parameters:
+            return True
+        else:
+            return False
+
+    @check_units
+    def run_modal(
+        self,
+        speed,
+        num_modes=12,
+        sparse=True,
+        pencil=False,
+        freq_band=None,
+        reduced=None,
+    ):
+        """Run modal analysis.
+
+        Method to calculate eigenvalues and eigvectors for a given rotor system.
+        Tthe natural frequencies and dampings ratios are calculated for a given
+        rotor speed. It means that for each speed input there's a different set of
+        eigenvalues and eigenvectors, hence, different natural frequencies and damping
+        ratios are returned.
         This method will return a ModalResults object which stores all data generated
         and also provides so methods for plotting.
 
@@ -615,6 +1102,30 @@ class Rotor(object):
             If False, scipy.linalg.eig() is used to calculate all the eigenvalues and
             eigenvectors.
             Default is True.
+        pencil : bool, optional
+            If True (and sparse=True), the eigenvalue problem is solved on the sparse
+            pencil built from M, K, C and G with a shift-invert on its sparse LU
+            factorization, instead of on the state space matrix A. The inverse of M
+            is never formed and the cost scales with the matrices bandwidth, which
+            is faster for large models.
+            Default is False.
+        freq_band : tuple, pint.Quantity, optional
+            Tuple (wmin, wmax) with a band of damped natural frequencies (rad/s).
+            If given, only the modes with damped natural frequency within the band
+            are calculated, using several shifts on the sparse pencil. In this case
+            num_modes is the number of eigenvalues calculated for each shift and
+            the number of modes returned depends on the band. The shifts lie on the
+            imaginary axis, so heavily damped modes are not guaranteed to be
+            found. A warning is issued when such modes are detected in the band,
+            and a larger num_modes extends the coverage (see Rotor._eigs_band()).
+            Default is None.
+        reduced : ross.ReducedModel, optional
+            Reduced model of this rotor (see ross.guyan(), ross.modal_reduction()
+            and ross.craig_bampton()). If given, all the eigenvalues of the
+            reduced state space matrix are calculated, the num_modes lowest ones
+            are kept and the eigenvectors are expanded to the rotor dofs. The
+            arguments sparse, pencil and freq_band are not used.
+            Default is None.
 
         Returns
         -------
@@ -631,6 +1142,15 @@ class Rotor(object):
         array([91.79655318, 96.28899977])
         >>> modal.wd[:2]
         array([91.79655318, 96.28899977])
+        >>> modal = rotor.run_modal(speed=0, pencil=True)
+        >>> modal.wn[:2]
+        array([91.79655318, 96.28899977])
+        >>> modal = rotor.run_modal(speed=0, freq_band=(500, 1500))
+        >>> modal.wd
+        array([ 722.89787495,  765.00042916, 1069.65959978, 1103.62898273])
+        >>> modal = rotor.run_modal(speed=0, reduced=rs.craig_bampton(rotor))
+        >>> modal.wn[:2]
+        array([91.79656836, 96.28901486])
         >>> # Plotting 3D mode shape
         >>> mode1 = 0  # First mode
         >>> fig = modal.plot_mode_3d(mode1)
@@ -638,8 +1158,67 @@ class Rotor(object):
         >>> mode2 = 1  # Second mode
         >>> fig = modal.plot_mode_2d(mode2)
         """
-        evalues, evectors = self._eigen(speed, num_modes=num_modes, sparse=sparse)
-        wn_len = num_modes // 2
+        if reduced is not None:
+            self._check_reduced(reduced)
+            evalues, evectors = reduced._eigen(speed, num_modes)
+            return self._modal_results(speed, evalues, evectors, num_modes // 2)
+
+        if self._modal_cache is not None:
+            band = None if freq_band is None else tuple(np.ravel(freq_band))
+            key = (float(speed), num_modes, sparse, pencil, band)
+            modal_results = self._modal_cache_get(key)
+            if modal_results is not None:
+                return modal_results
+
+        evalues, evectors = unchecked(self._eigen)(
+            speed,
+            num_modes=num_modes,
+            sparse=sparse,
+            pencil=pencil,
+            freq_band=freq_band,
+        )
+        wn_len = num_modes // 2 if freq_band is None else len(evalues) // 2
+        modal_results = self._modal_results(speed, evalues, evectors, wn_len)
+
+        if self._modal_cache is not None:
+            self._modal_cache_put(key, modal_results)
+
+        return modal_results
+
+    def _check_reduced(self, reduced):
+        """Check that a reduced model was created from this rotor."""
+        if reduced.rotor is not self and reduced.rotor != self:
+            raise ValueError("The reduced model was not created from this rotor.")
+
+    def _check_response_method(self, method, modes=None, reduced=None):
+        """Check the method, modes and reduced model of a response analysis."""
+        if method not in ("modal", "direct"):
+            raise ValueError(
+                f"method can be 'modal' or 'direct'. {method} is not valid."
+            )
+        if method == "direct" and modes is not None:
+            raise ValueError("modes can not be selected with method='direct'.")
+        if reduced is not None:
+            self._check_reduced(reduced)
+            if modes is not None:
+                raise ValueError("modes can not be selected with a reduced model.")
+
+    def _modal_results(self, speed, evalues, evectors, wn_len):
+        """Create a ModalResults object from sorted eigenvalues and eigenvectors.
+
+        Parameters
+        ----------
+        speed : float
+            Rotor speed in rad/s.
+        evalues, evectors : array
+            Eigenvalues and eigenvectors, with the positive eigenvalues first.
+        wn_len : int
+            Number of natural frequencies.
+
+        Returns
+        -------
+        results : ross.ModalResults
+        """
         wn = (np.absolute(evalues))[:wn_len]
         wd = (np.imag(evalues))[:wn_len]
         damping_ratio = (-np.real(evalues) / np.absolute(evalues))[:wn_len]
@@ -666,17 +1245,16 @@ class Rotor(object):
     def run_critical_speed(self, speed_range=None, num_modes=12, rtol=0.005):
         """Calculate the critical speeds and damping ratios for the rotor model.
 
-        This function runs an iterative method over "run_modal()" to minimize
-        (using scipy.optimize.newton) the error between the rotor speed and the rotor
-        critical speeds (rotor speed - critical speed).
+        The critical speeds are the roots of speed - wn(speed) and speed - wd(speed)
+        for each mode, with the natural frequencies sorted as in run_modal().
+        All the modes are solved simultaneously with secant iterations that start
+        from the natural frequencies at speed = 0 (no gyroscopic effect). Each
+        eigenvalue problem gives the natural frequencies of every mode, so the
+        solution at a given speed is shared by all the iterations that need it
+        (see Rotor._solve_critical_speeds()).
 
-        Differently from run_modal(), this function doesn't take a speed input because
-        it iterates over the natural frequencies calculated in the last iteration.
-        The initial value is considered to be the undamped natural frequecies for
-        speed = 0 (no gyroscopic effect).
-
-        Once the error is within an acceptable range defined by "rtol", it returns the
-        approximated critical speed.
+        Once the change between iterations is within an acceptable range defined
+        by "rtol", it returns the approximated critical speed.
 
         With the critical speeds calculated, the function uses the results to
         calculate the log dec and damping ratios for each critical speed.
@@ -691,10 +1269,11 @@ class Rotor(object):
             If sparse=True, it determines the number of eigenvalues and eigenvectors
             to be calculated. It must be smaller than Rotor.ndof - 1. It is not
             possible to compute all eigenvectors of a matrix with ARPACK.
-            If speed_range is not None, num_modes is overrided.
+            If speed_range is not None, num_modes is overrided by the number of
+            modes needed to cover the range.
             Default is 12.
         rtol : float, optional
-            Tolerance (relative) for termination. Applied to scipy.optimize.newton.
+            Tolerance (relative) for termination.
             Default is 0.005 (0.5%).
 
         Returns
@@ -727,50 +1306,196 @@ class Rotor(object):
         Retrieving whirl directions
         >>> results.whirl_direction # doctest: +ELLIPSIS
         array([...
-        """
-        num_modes = (self.ndof - 4) * 2 if speed_range is not None else num_modes
 
-        modal = self.run_modal(0, num_modes)
-        _wn = modal.wn
-        _wd = modal.wd
-        wn = np.zeros_like(_wn)
-        wd = np.zeros_like(_wd)
+        Number of iterations for wn and wd of each critical speed
+        >>> results.iterations.shape
+        (4, 2)
+        """
+        start_time = time.perf_counter()
+        eigen_solves = 0
+        if speed_range is not None:
+            num_modes, eigen_solves = self._critical_speed_num_modes(speed_range[1])
 
-        for i in range(len(wn)):
-            wn_func = lambda s: (s - self.run_modal(s, num_modes).wn[i])
-            wn[i] = newton(func=wn_func, x0=_wn[i], rtol=rtol)
+        wn, wd, iterations, solves, eigen_time = self._solve_critical_speeds(
+            num_modes, rtol
+        )
+        eigen_solves += solves
 
-        for i in range(len(wd)):
-            wd_func = lambda s: (s - self.run_modal(s, num_modes).wd[i])
-            wd[i] = newton(func=wd_func, x0=_wd[i], rtol=rtol)
+        # mode index of each critical speed, only the ones in the speed range
+        # are post-processed
+        modes = np.arange(len(wd))
+        if speed_range is not None:
+            vmin, vmax = speed_range
+            modes = modes[(wd >= vmin) & (wd <= vmax)]
+            wn = wn[modes]
+            wd = wd[modes]
+            iterations = iterations[modes]
 
         log_dec = np.zeros_like(wn)
         damping_ratio = np.zeros_like(wn)
         whirl_direction = list(np.zeros_like(wn))
-        for i, s in enumerate(wd):
+        for i, (mode, s) in enumerate(zip(modes, wd)):
+            eigen_start = time.perf_counter()
             modal = self.run_modal(s, num_modes)
-            log_dec[i] = modal.log_dec[i]
-            damping_ratio[i] = modal.damping_ratio[i]
-            whirl_direction[i] = modal.whirl_direction()[i]
+            eigen_time += time.perf_counter() - eigen_start
+            eigen_solves += 1
+            log_dec[i] = modal.log_dec[mode]
+            damping_ratio[i] = modal.damping_ratio[mode]
+            whirl_direction[i] = modal.whirl_direction()[mode]
 
         whirl_direction = np.array(whirl_direction)
-        if speed_range is not None:
-            vmin, vmax = speed_range
-            idx = np.where((wd >= vmin) & (wd <= vmax))
-            wn = wn[idx]
-            wd = wd[idx]
-            log_dec = log_dec[idx]
-            damping_ratio = damping_ratio[idx]
-            whirl_direction = whirl_direction[idx]
 
-        return CriticalSpeedResults(wn, wd, log_dec, damping_ratio, whirl_direction)
+        return CriticalSpeedResults(
+            wn,
+            wd,
+            log_dec,
+            damping_ratio,
+            whirl_direction,
+            iterations=iterations,
+            eigen_solves=eigen_solves,
+            eigen_time=eigen_time,
+            total_time=time.perf_counter() - start_time,
+        )
+
+    def _solve_critical_speeds(self, num_modes=12, rtol=0.005, maxiter=50):
+        """Solve speed = wn(speed) and speed = wd(speed) for all the modes.
+
+        A secant iteration (as in scipy.optimize.newton) is carried out for each
+        root, with all the roots advanced together. The natural frequencies of
+        every mode are stored for each speed at which the eigenvalue problem is
+        solved, so it is solved only once for each speed, no matter how many
+        roots request it (e.g. speed = 0 for the first iterate of all the modes,
+        or the wn and wd iterations of lightly damped modes).
+
+        Parameters
+        ----------
+        num_modes : int, optional
+            The number of eigenvalues calculated for each speed.
+            Default is 12.
+        rtol : float, optional
+            Tolerance (relative) for termination. Default is 0.005.
+        maxiter : int, optional
+            Maximum number of iterations. Default is 50.
+
+        Returns
+        -------
+        wn, wd : array
+            Undamped and damped critical speeds.
+        iterations : array
+            Array with shape (num_modes // 2, 2) with the number of iterations
+            for wn and wd of each mode.
+        eigen_solves : int
+            Number of eigenvalue problems solved.
+        eigen_time : float
+            Time (s) spent solving the eigenvalue problems.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> wn, wd, iterations, eigen_solves, eigen_time = rotor._solve_critical_speeds()
+        >>> np.round(wd)
+        array([ 92.,  96., 271., 300., 636., 867.])
+        """
+        n = num_modes // 2
+        frequencies = {}  # wn and wd of all modes for each solved speed
+        eigen_time = 0.0
+
+        def residual(x, active):
+            """speed - frequency for each active root, with x as the speeds."""
+            nonlocal eigen_time
+            for speed in np.unique(x[active]):
+                if speed not in frequencies:
+                    eigen_start = time.perf_counter()
+                    evalues, _ = unchecked(self._eigen)(speed, num_modes=num_modes)
+                    eigen_time += time.perf_counter() - eigen_start
+                    frequencies[speed] = np.concatenate(
+                        [np.absolute(evalues)[:n], np.imag(evalues)[:n]]
+                    )
+            q = np.zeros_like(x)
+            for j in np.flatnonzero(active):
+                q[j] = x[j] - frequencies[x[j]][j]
+            return q
+
+        # start from the frequencies at speed = 0, with the second point chosen
+        # as in scipy.optimize.newton
+        active = np.ones(2 * n, dtype=bool)
+        p0 = -residual(np.zeros(2 * n), active)
+        p1 = p0 * (1 + 1e-4) + np.where(p0 >= 0, 1e-4, -1e-4)
+        q0 = residual(p0, active)
+        q1 = residual(p1, active)
+
+        x = np.zeros(2 * n)
+        iterations = np.zeros(2 * n, dtype=int)
+        for _ in range(maxiter):
+            iterations[active] += 1
+            with np.errstate(divide="ignore", invalid="ignore"):
+                p = np.where(q1 == q0, (p1 + p0) / 2, p1 - q1 * (p1 - p0) / (q1 - q0))
+
+            done = active & ((q1 == q0) | (abs(p - p1) < 1.48e-8 + rtol * abs(p)))
+            x[done] = p[done]
+            active &= ~done
+            if not active.any():
+                break
 
-    def convergence(self, n_eigval=0, err_max=1e-02):
+            p0[active], q0[active] = p1[active], q1[active]
+            p1[active] = p[active]
+            q1[active] = residual(p1, active)[active]
+        else:
+            raise RuntimeError(
+                f"Failed to converge after {maxiter} iterations, value is {p}."
+            )
+
+        iterations = iterations.reshape(2, n).T
+
+        return x[:n], x[n:], iterations, len(frequencies), eigen_time
+
+    def _critical_speed_num_modes(self, max_speed):
+        """Number of modes needed to find the critical speeds up to max_speed.
+
+        The number of modes is doubled, starting from 12, until the highest
+        calculated natural frequency is above 1.5 * max_speed both at speed = 0
+        and at speed = max_speed. It is limited to (ndof - 4) * 2.
+
+        Returns
+        -------
+        num_modes : int
+            Number of modes (eigenvalues).
+        eigen_solves : int
+            Number of eigenvalue problems solved.
+        """
+        num_modes_max = (self.ndof - 4) * 2
+        num_modes = 12
+        eigen_solves = 0
+        while num_modes < num_modes_max:
+            wd_max = []
+            for speed in (0.0, max_speed):
+                evalues, _ = unchecked(self._eigen)(speed, num_modes=num_modes)
+                wd_max.append(np.imag(evalues[num_modes // 2 - 1]))
+                eigen_solves += 1
+            if min(wd_max) > 1.5 * max_speed:
+                break
+            num_modes *= 2
+
+        return min(num_modes, num_modes_max), eigen_solves
+
+    def convergence(self, n_eigval=0, err_max=1e-02, richardson=True, n_jobs=None):
         """Run convergence analysis.
 
         Function to analyze the eigenvalues convergence through the number of
         shaft elements. Every new run doubles the number os shaft elements.
 
+        The refined rotors are returned in the results and the rotor itself is
+        not modified. Each refinement level splits every shaft element in equal
+        sub-elements, and the matrices of identical sub-elements are calculated
+        only once (see Rotor._refined_rotor()).
+
+        With richardson=True, the natural frequency is extrapolated from the last
+        three levels with Richardson extrapolation, using the observed order of
+        convergence, and the analysis stops as soon as the error estimated for
+        the last level is below err_max. This usually saves the finest (and most
+        expensive) levels, since the relative change between two levels
+        overestimates the error of the finer one.
+
         Parameters
         ----------
         n_eigval : int
@@ -779,6 +1504,15 @@ class Rotor(object):
         err_max : float
             Maximum allowable convergence error.
             Default is 1e-02
+        richardson : bool, optional
+            If True, the analysis stops when the error estimated with Richardson
+            extrapolation is below err_max. If False, it stops when the relative
+            change between two levels is below err_max.
+            Default is True.
+        n_jobs : int, optional
+            Number of processes. If greater than 1 (or -1, for all the CPUs),
+            consecutive refinement levels (up to 3) are calculated concurrently.
+            Default is None.
 
         Returns
         -------
@@ -790,6 +1524,11 @@ class Rotor(object):
                 Array with the n'th natural frequency in each iteraction
             error_arr : array
                 Array with the relative error in each iteraction
+            extrapolated : float
+                Natural frequency extrapolated with Richardson extrapolation
+                (None if it could not be calculated).
+            rotors : list
+                Refined rotor in each iteraction.
 
         Example
         -------
@@ -806,92 +1545,384 @@ class Rotor(object):
         >>> bearing0 = BearingElement(0, kxx=1e6, kyy=8e5, cxx=2e3)
         >>> bearing1 = BearingElement(6, kxx=1e6, kyy=8e5, cxx=2e3)
         >>> rotor0 = Rotor(shaft_elem, [disk0, disk1], [bearing0, bearing1])
-        >>> len(rotor0.shaft_elements)
-        6
         >>> convergence = rotor0.convergence(n_eigval=0, err_max=1e-08)
         >>> len(rotor0.shaft_elements)
-        96
+        6
+        >>> [len(rotor.shaft_elements) for rotor in convergence.rotors]
+        [12, 24, 48]
 
         Plotting convergence graphics
         >>> fig = convergence.plot()
         """
-        el_num = np.array([len(self.shaft_elements)])
-        eigv_arr = np.array([])
-        error_arr = np.array([0])
-
-        modal = self.run_modal(speed=0)
-        eigv_arr = np.append(eigv_arr, modal.wn[n_eigval])
-
-        # this value is up to start the loop while
-        error = 1.0e10
-        nel_r = 2
-
-        while error > err_max:
-            shaft_elem = []
-            disk_elem = []
-            brgs_elem = []
-
-            for shaft in self.shaft_elements:
-                le = shaft.L / nel_r
-                odl = shaft.odl
-                odr = shaft.odr
-                idl = shaft.idl
-                idr = shaft.idr
-
-                # loop to double the number of element
-                for j in range(nel_r):
-                    odr = ((nel_r - j - 1) * odl + (j + 1) * odr) / nel_r
-                    idr = ((nel_r - j - 1) * idl + (j + 1) * idr) / nel_r
-                    odl = ((nel_r - j) * odl + j * odr) / nel_r
-                    idl = ((nel_r - j) * idl + j * idr) / nel_r
-                    shaft_elem.append(
-                        ShaftElement(
-                            L=le,
-                            idl=idl,
-                            odl=odl,
-                            idr=idr,
-                            odr=odr,
-                            material=shaft.material,
-                            shear_effects=shaft.shear_effects,
-                            rotary_inertia=shaft.rotary_inertia,
-                            gyroscopic=shaft.gyroscopic,
-                        )
+        if n_jobs == -1:
+            n_jobs = os.cpu_count()
+        # each level doubles the number of elements, deeper levels are wasted
+        # if the analysis converges
+        batch = 1 if n_jobs is None else min(max(n_jobs, 1), 3)
+
+        el_num = [len(self.shaft_elements)]
+        eigv_arr = [self.run_modal(speed=0).wn[n_eigval]]
+        error_arr = [0]
+        rotors = []
+        extrapolated = None
+
+        # the pool is kept for all the refinement levels
+        with self._process_pool(batch) as executor:
+            nel_r = 2
+            converged = False
+            while not converged:
+                nel_r_range = nel_r * 2 ** np.arange(batch)
+                levels = chain.from_iterable(
+                    self._map_speed_range(
+                        "_convergence_levels",
+                        nel_r_range,
+                        batch,
+                        n_eigval,
+                        executor=executor,
                     )
+                )
 
-            for DiskEl in self.disk_elements:
-                aux_DiskEl = deepcopy(DiskEl)
-                aux_DiskEl.n = nel_r * DiskEl.n
-                disk_elem.append(aux_DiskEl)
+                for rotor, wn in levels:
+                    rotors.append(rotor)
+                    el_num.append(len(rotor.shaft_elements))
+                    eigv_arr.append(wn)
+
+                    error = abs(1 - eigv_arr[-1] / eigv_arr[-2])
+                    error_arr.append(100 * error)
+
+                    # richardson extrapolation with the observed order
+                    if len(eigv_arr) > 2:
+                        step, last_step = np.diff(eigv_arr[-3:])
+                        with np.errstate(divide="ignore", invalid="ignore"):
+                            ratio = step / last_step
+                        if ratio > 1:
+                            extrapolated = float(eigv_arr[-1] + last_step / (ratio - 1))
+                            if richardson:
+                                error = min(error, abs(1 - eigv_arr[-1] / extrapolated))
+
+                    if error <= err_max:
+                        converged = True
+                        break
+
+                nel_r = 2 * nel_r_range[-1]
+
+        results = ConvergenceResults(
+            np.array(el_num[1:]),
+            np.array(eigv_arr[1:]),
+            np.array(error_arr[1:]),
+            extrapolated,
+        )
+        results.rotors = rotors
 
-            for Brg_SealEl in self.bearing_elements:
-                aux_Brg_SealEl = deepcopy(Brg_SealEl)
-                aux_Brg_SealEl.n = nel_r * Brg_SealEl.n
-                brgs_elem.append(aux_Brg_SealEl)
+        return results
 
-            aux_rotor = Rotor(shaft_elem, disk_elem, brgs_elem)
-            aux_modal = aux_rotor.run_modal(speed=0)
+    def _convergence_levels(self, nel_r_range, n_eigval=0):
+        """Refined rotors and natural frequency for each refinement level.
 
-            eigv_arr = np.append(eigv_arr, aux_modal.wn[n_eigval])
-            el_num = np.append(el_num, len(shaft_elem))
+        Parameters
+        ----------
+        nel_r_range : array
+            Number of sub-elements for each shaft element, one per level.
+        n_eigval : int, optional
+            Index of the natural frequency. Default is 0.
 
-            error = abs(1 - eigv_arr[-1] / eigv_arr[-2])
+        Returns
+        -------
+        levels : list
+            List with a (rotor, wn) tuple for each level.
+        """
+        levels = []
+        for nel_r in nel_r_range:
+            rotor = self._refined_rotor(int(nel_r))
+            levels.append((rotor, rotor.run_modal(speed=0).wn[n_eigval]))
 
-            error_arr = np.append(error_arr, 100 * error)
-            nel_r *= 2
+        return levels
 
-        self.__dict__ = aux_rotor.__dict__
-        self.error_arr = error_arr
+    @staticmethod
+    def _split_shaft_element(elm, nel, prototypes):
+        """Split a shaft element in equal sub-elements.
 
-        results = ConvergenceResults(el_num[1:], eigv_arr[1:], error_arr[1:])
+        The sub-elements have the same properties as the element, with linear
+        interpolation of the diameters. Sub-elements with the same geometry and
+        material are the same object, which is stored in prototypes.
 
-        return results
+        Parameters
+        ----------
+        elm : ross.ShaftElement, ross.ShaftElement6DoF
+            Shaft element.
+        nel : int
+            Number of sub-elements.
+        prototypes : dict
+            Sub-elements already created, updated in place.
+
+        Returns
+        -------
+        sub_elements : list
+            List with the nel sub-elements, from left to right (with n=None).
+        """
+        args_list = list(inspect.signature(elm.__init__).parameters)
+        args = {arg: getattr(elm, arg) for arg in args_list}
+        args.update(n=None, tag=None)
+
+        sub_elements = []
+        for j in range(nel):
+            sub_args = dict(
+                args,
+                L=elm.L / nel,
+                idl=elm.idl + (elm.idr - elm.idl) * j / nel,
+                odl=elm.odl + (elm.odr - elm.odl) * j / nel,
+                idr=elm.idl + (elm.idr - elm.idl) * (j + 1) / nel,
+                odr=elm.odl + (elm.odr - elm.odl) * (j + 1) / nel,
+            )
+            key = (elm.__class__,) + tuple(
+                (v.rho, v.E, v.G_s) if isinstance(v, Material) else v
+                for v in sub_args.values()
+            )
+            if key not in prototypes:
+                prototypes[key] = elm.__class__(**sub_args)
+            sub_elements.append(prototypes[key])
+
+        return sub_elements
+
+    def _refined_rotor(self, splits):
+        """Rotor with the shaft elements split in equal sub-elements.
+
+        Each shaft element is replaced by sub-elements with the same properties,
+        with linear interpolation of the diameters (see
+        Rotor._split_shaft_element()). Disks, bearings and point
+        masses are (shallow) copied to the new node numbers, and the rotor is
+        left unchanged. Sub-elements with the same geometry and material (e.g.
+        all the sub-elements of a cylindrical element) share their element
+        matrices, which are calculated only once and assembled directly in the
+        matrix cache of the new rotor.
+
+        Parameters
+        ----------
+        splits : int, array
+            Number of sub-elements for each node interval of the shaft
+            (elements with the same left node, e.g. layers of a section, are split
+            together). If an int is given, all intervals are split equally.
 
-    def M(self):
+        Returns
+        -------
+        rotor : ross.Rotor
+            Refined rotor.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> refined = rotor._refined_rotor(2)
+        >>> len(rotor.shaft_elements), len(refined.shaft_elements)
+        (6, 12)
+        >>> refined.disk_elements[0].n, refined.disk_elements[0].n_l
+        (4, 4)
+        >>> np.allclose(refined.M(), rotor._refined_rotor(2).M())
+        True
+        """
+        n_last = self.nodes[-1]
+        splits = np.broadcast_to(splits, (n_last,)).astype(int)
+        # new number of each node of the shaft, link nodes are shifted
+        nodes_map = np.r_[0, np.cumsum(splits)]
+
+        def new_node(n):
+            if n is None:
+                return None
+            if n <= n_last:
+                return int(nodes_map[n])
+            return int(n + nodes_map[-1] - n_last)
+
+        shaft_elements = []
+        prototypes = {}
+        for elm in self.shaft_elements:
+            sub_elements = self._split_shaft_element(elm, splits[elm.n_l], prototypes)
+            for j, prototype in enumerate(sub_elements):
+                sub_elm = copy(prototype)
+                sub_elm.n = new_node(elm.n_l) + j
+                shaft_elements.append((sub_elm, prototype))
+
+        # same order as Rotor.shaft_elements
+        shaft_elements.sort(key=lambda pair: pair[0].n)
+        shaft_elements, shaft_prototypes = zip(*shaft_elements)
+
+        other_elements = []
+        for elements in (
+            self.disk_elements,
+            self.bearing_elements,
+            self.point_mass_elements,
+        ):
+            new_elements = []
+            for elm in elements:
+                new_elm = copy(elm)
+                new_elm.n = new_node(elm.n)
+                if hasattr(elm, "n_l"):
+                    # disks store their node also as n_l and n_r
+                    new_elm.n_l = new_elm.n_r = new_elm.n
+                if getattr(elm, "n_link", None) is not None:
+                    new_elm.n_link = new_node(elm.n_link)
+                new_elements.append(new_elm)
+            other_elements.append(new_elements)
+
+        rotor = Rotor(list(shaft_elements), *other_elements)
+        rotor._prime_cache(shaft_prototypes)
+
+        return rotor
+
+    def adaptive_refinement(
+        self, modes=None, speed=0, rtol=1e-4, fraction=0.5, max_iter=20
+    ):
+        """Refine the shaft mesh where it matters for the given modes.
+
+        Instead of splitting every shaft element (see Rotor.convergence()), only
+        the elements with the largest error contribution are split in two, and
+        the process is repeated until the natural frequencies of the given modes
+        converge. Elements far from the regions of high modal strain and kinetic
+        energy are left coarse, so the refined rotor has much fewer degrees of
+        freedom than a uniform refinement with the same accuracy.
+
+        The error contribution of each element is the decrease of the modal
+        strain energy minus the modal kinetic energy (the Rayleigh quotient
+        numerator) obtained when the element alone is split in two, with the
+        mode shape kept at the element ends (see Rotor._refinement_indicator()).
+        The sum of the contributions estimates the change of the natural
+        frequencies if every element were split, from which the error is
+        estimated. In each iteration, the elements with the largest
+        contributions that add up to "fraction" of the total are split.
+
+        Parameters
+        ----------
+        modes : list, optional
+            Indexes of the natural frequencies (as in run_modal().wn) used in the
+            refinement. Default is [0].
+        speed : float, optional
+            Rotor speed (rad/s) for the modal analysis. Default is 0.
+        rtol : float, optional
+            Relative error of the natural frequencies. Default is 1e-4.
+        fraction : float, optional
+            Fraction of the estimated error that is refined in each iteration.
+            Default is 0.5.
+        max_iter : int, optional
+            Maximum number of iterations. Default is 20.
+
+        Returns
+        -------
+        rotor : ross.Rotor
+            Refined rotor. The rotor itself is not modified.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> refined = rotor.adaptive_refinement(modes=[0, 2], rtol=1e-5)
+        >>> len(rotor.shaft_elements), len(refined.shaft_elements)
+        (6, 10)
+        """
+        if modes is None:
+            modes = [0]
+
+        rotor = self
+        for _ in range(max_iter):
+            modal = rotor.run_modal(speed=speed)
+            eta, error = rotor._refinement_indicator(modal, modes)
+            if np.max(error) <= rtol:
+                return rotor
+
+            # smallest set of intervals with the given fraction of the error
+            eta = eta.sum(axis=1)
+            order = np.argsort(eta)[::-1]
+            num_marked = np.searchsorted(np.cumsum(eta[order]), fraction * eta.sum())
+            marked = order[: num_marked + 1]
+            splits = np.ones(len(eta), dtype=int)
+            splits[marked] = 2
+            rotor = rotor._refined_rotor(splits)
+
+        warnings.warn(
+            f"Adaptive refinement did not converge in {max_iter} iterations, "
+            f"estimated error: {np.max(error):.2e}."
+        )
+
+        return rotor
+
+    def _refinement_indicator(self, modal, modes):
+        """Error contribution of each shaft node interval to the given modes.
+
+        For a mode with natural frequency wn and mode shape phi, the element
+        contribution to the numerator of the Rayleigh quotient is
+        phi_e^H (K_e - wn**2 M_e) phi_e. When the element is split in two and the
+        mid node is free (with phi_e kept at the element ends), the mid node dofs
+        are condensed and the numerator decreases. The decrease, divided by
+        2 wn**2 phi^H M phi, estimates the relative change of wn obtained by
+        splitting the element.
+
+        Parameters
+        ----------
+        modal : ross.ModalResults
+            Modal results of the rotor.
+        modes : list
+            Indexes of the natural frequencies.
+
+        Returns
+        -------
+        eta : array
+            Array with shape (number of node intervals, len(modes)) with the
+            estimated relative change of each natural frequency when the interval
+            is split.
+        error : array
+            Estimated relative error of each natural frequency.
+        """
+        nd = self.number_dof
+        mid = np.arange(nd, 2 * nd)
+        ends = np.r_[0:nd, 2 * nd : 3 * nd]
+
+        # matrices of the element halves, shared by identical elements
+        prototypes = {}
+        matrices = {}
+        for elm in self.shaft_elements:
+            left, right = self._split_shaft_element(elm, 2, prototypes)
+            matrices[id(elm)] = (
+                elm.K(),
+                elm.M(),
+                left.K(),
+                left.M(),
+                right.K(),
+                right.M(),
+            )
+
+        M = self.M(sparse=True)
+        eta = np.zeros((len(self.nodes) - 1, len(modes)))
+        for j, mode in enumerate(modes):
+            phi = modal.evectors[: self.ndof, mode]
+            lam = modal.wn[mode] ** 2
+            norm = lam * np.real(np.vdot(phi, M @ phi))
+
+            for i, elm in enumerate(self.shaft_elements):
+                K, M_e, K_l, M_l, K_r, M_r = matrices[id(elm)]
+                p = phi[self._elements_dofs[i]]
+
+                D = np.zeros((3 * nd, 3 * nd))
+                D[: 2 * nd, : 2 * nd] += K_l - lam * M_l
+                D[nd:, nd:] += K_r - lam * M_r
+                D_condensed = D[np.ix_(ends, ends)] - D[np.ix_(ends, mid)] @ la.solve(
+                    D[np.ix_(mid, mid)], D[np.ix_(mid, ends)]
+                )
+
+                decrease = np.vdot(p, (K - lam * M_e) @ p) - np.vdot(p, D_condensed @ p)
+                eta[elm.n_l, j] += abs(np.real(decrease)) / norm / 2
+
+        # the change when all the intervals are split is a fraction
+        # 1 - 2**-p of the error, with p = 2 for timoshenko elements
+        return eta, eta.sum(axis=0) / (1 - 2**-2)
+
+    def M(self, sparse=False):
         """Mass matrix for an instance of a rotor.
 
+        Parameters
+        ----------
+        sparse : bool, optional
+            If True, the matrix is returned as a scipy.sparse.csr_matrix.
+            Default is False.
+
         Returns
         -------
-        M0 : np.ndarray
+        M0 : np.ndarray, scipy.sparse.csr_matrix
             Mass matrix for the rotor.
 
         Examples
@@ -902,27 +1933,37 @@ class Rotor(object):
                [ 0.        ,  1.42050794, -0.04931719,  0.        ],
                [ 0.        , -0.04931719,  0.00231392,  0.        ],
                [ 0.04931719,  0.        ,  0.        ,  0.00231392]])
+        >>> rotor.M(sparse=True) # doctest: +ELLIPSIS
+        <28x28 sparse matrix of type '<class 'numpy.float64'>'...
         """
-        M0 = np.zeros((self.ndof, self.ndof))
-
-        for elm in self.elements:
-            dofs = list(elm.dof_global_index.values())
-            M0[np.ix_(dofs, dofs)] += elm.M()
+        M0 = self._cached_matrix(
+            "M",
+            lambda sparse: self._assemble(
+                [elm.M() for elm in self.elements], sparse=sparse
+            ),
+            sparse=sparse,
+        )
 
         return M0
 
-    def K(self, frequency):
+    def K(self, frequency, sparse=False):
         """Stiffness matrix for an instance of a rotor.
 
         Parameters
         ----------
-        frequency : float, optional
-            Excitation frequency.
+        frequency : float, array
+            Excitation frequency. If an array is given, the matrices for all the
+            frequencies are assembled at once.
+        sparse : bool, optional
+            If True, the matrix is returned as a scipy.sparse.csr_matrix.
+            Default is False.
 
         Returns
         -------
-        K0 : np.ndarray
-            Stiffness matrix for the rotor.
+        K0 : np.ndarray, scipy.sparse.csr_matrix, list
+            Stiffness matrix for the rotor. If frequency is an array, a
+            (len(frequency), ndof, ndof) array is returned (or a list of sparse
+            matrices if sparse is True).
 
         Examples
         --------
@@ -932,24 +1973,45 @@ class Rotor(object):
                [ 0., 46., -6.,  0.],
                [ 0., -6.,  1.,  0.],
                [ 6.,  0.,  0.,  1.]])
+        >>> rotor.K([0, 100, 200]).shape
+        (3, 28, 28)
         """
-        K0 = np.zeros((self.ndof, self.ndof))
+        K0 = self._cached_matrix(
+            "K",
+            lambda sparse: self._assemble(
+                [elm.K() for elm in self._group_elements("constant")],
+                group="constant",
+                sparse=sparse,
+            ),
+            sparse=sparse,
+        )
+        nfreq = np.size(frequency) if np.ndim(frequency) else None
+        K_frequency = self._assemble(
+            [unchecked(elm.K)(frequency) for elm in self._group_elements("frequency")],
+            group="frequency",
+            sparse=sparse,
+            nfreq=nfreq,
+        )
 
-        for elm in self.elements:
-            dofs = list(elm.dof_global_index.values())
-            try:
-                K0[np.ix_(dofs, dofs)] += elm.K(frequency)
-            except TypeError:
-                K0[np.ix_(dofs, dofs)] += elm.K()
+        if sparse and nfreq is not None:
+            return [K0 + Kf for Kf in K_frequency]
+
+        K0 = K0 + K_frequency
 
         return K0
 
-    def Kst(self):
+    def Kst(self, sparse=False):
         """Dynamic stiffness matrix for an instance of a rotor.
 
+        Parameters
+        ----------
+        sparse : bool, optional
+            If True, the matrix is returned as a scipy.sparse.csr_matrix.
+            Default is False.
+
         Returns
         -------
-        Kst0 : np.ndarray
+        Kst0 : np.ndarray, scipy.sparse.csr_matrix
             Dynamic stiffness matrix for the rotor.
             This matris IS OMEGA dependent
             Only useable to the 6 DoF model.
@@ -965,31 +2027,41 @@ class Rotor(object):
                [     0.,    479.,      0.,    160.,      0.,      0.],
                [     0.,      0.,      0.,      0.,      0.,      0.]])
         """
-
-        Kst0 = np.zeros((self.ndof, self.ndof))
-
         if self.number_dof == 6:
-            for elm in self.shaft_elements:
-                dofs = list(elm.dof_global_index.values())
-                try:
-                    Kst0[np.ix_(dofs, dofs)] += elm.Kst()
-                except TypeError:
-                    Kst0[np.ix_(dofs, dofs)] += elm.Kst()
+            Kst0 = self._cached_matrix(
+                "Kst",
+                lambda sparse: self._assemble(
+                    [elm.Kst() for elm in self.shaft_elements],
+                    group="shaft",
+                    sparse=sparse,
+                ),
+                sparse=sparse,
+            )
+        elif sparse:
+            Kst0 = sp.csr_matrix((self.ndof, self.ndof))
+        else:
+            Kst0 = np.zeros((self.ndof, self.ndof))
 
         return Kst0
 
-    def C(self, frequency):
+    def C(self, frequency, sparse=False):
         """Damping matrix for an instance of a rotor.
 
         Parameters
         ----------
-        frequency : float
-            Excitation frequency.
+        frequency : float, array
+            Excitation frequency. If an array is given, the matrices for all the
+            frequencies are assembled at once.
+        sparse : bool, optional
+            If True, the matrix is returned as a scipy.sparse.csr_matrix.
+            Default is False.
 
         Returns
         -------
-        C0 : np.ndarray
-            Damping matrix for the rotor.
+        C0 : np.ndarray, scipy.sparse.csr_matrix, list
+            Damping matrix for the rotor. If frequency is an array, a
+            (len(frequency), ndof, ndof) array is returned (or a list of sparse
+            matrices if sparse is True).
 
         Examples
         --------
@@ -1000,23 +2072,42 @@ class Rotor(object):
                [0., 0., 0., 0.],
                [0., 0., 0., 0.]])
         """
-        C0 = np.zeros((self.ndof, self.ndof))
+        C0 = self._cached_matrix(
+            "C",
+            lambda sparse: self._assemble(
+                [elm.C() for elm in self._group_elements("constant")],
+                group="constant",
+                sparse=sparse,
+            ),
+            sparse=sparse,
+        )
+        nfreq = np.size(frequency) if np.ndim(frequency) else None
+        C_frequency = self._assemble(
+            [unchecked(elm.C)(frequency) for elm in self._group_elements("frequency")],
+            group="frequency",
+            sparse=sparse,
+            nfreq=nfreq,
+        )
 
-        for elm in self.elements:
-            dofs = list(elm.dof_global_index.values())
-            try:
-                C0[np.ix_(dofs, dofs)] += elm.C(frequency)
-            except TypeError:
-                C0[np.ix_(dofs, dofs)] += elm.C()
+        if sparse and nfreq is not None:
+            return [C0 + Cf for Cf in C_frequency]
+
+        C0 = C0 + C_frequency
 
         return C0
 
-    def G(self):
+    def G(self, sparse=False):
         """Gyroscopic matrix for an instance of a rotor.
 
+        Parameters
+        ----------
+        sparse : bool, optional
+            If True, the matrix is returned as a scipy.sparse.csr_matrix.
+            Default is False.
+
         Returns
         -------
-        G0 : np.ndarray
+        G0 : np.ndarray, scipy.sparse.csr_matrix
             Gyroscopic matrix for the rotor.
 
         Examples
@@ -1028,15 +2119,17 @@ class Rotor(object):
                [ 0.00022681,  0.        ,  0.        ,  0.0001524 ],
                [ 0.        ,  0.00022681, -0.0001524 ,  0.        ]])
         """
-        G0 = np.zeros((self.ndof, self.ndof))
-
-        for elm in self.elements:
-            dofs = list(elm.dof_global_index.values())
-            G0[np.ix_(dofs, dofs)] += elm.G()
+        G0 = self._cached_matrix(
+            "G",
+            lambda sparse: self._assemble(
+                [elm.G() for elm in self.elements], sparse=sparse
+            ),
+            sparse=sparse,
+        )
 
         return G0
 
-    def A(self, speed=0, frequency=None):
+    def A(self, speed=0, frequency=None, sparse=False):
         """State space matrix for an instance of a rotor.
 
         Parameters
@@ -1046,10 +2139,19 @@ class Rotor(object):
             Default is 0.
         frequency : float, optional
             Excitation frequency. Default is rotor speed.
+        sparse : bool, optional
+            If True, the global matrices are assembled in sparse format, the mass
+            matrix is factorized with a sparse LU decomposition and the state
+            space matrix is returned in factored form, as a
+            scipy.sparse.linalg.LinearOperator. Products with A use the LU
+            factors, so the dense blocks M^-1 K and M^-1 C are never formed.
+            Eigenvalues of large models are best calculated on the sparse pencil
+            (see Rotor._pencil()).
+            Default is False.
 
         Returns
         -------
-        A : np.ndarray
+        A : np.ndarray, scipy.sparse.linalg.LinearOperator
             State space matrix for the rotor.
 
         Examples
@@ -1062,10 +2164,21 @@ class Rotor(object):
                [    -0.,   -174.],
                [    -0.,  10723.],
                [-10719.,     -0.]])
+        >>> A = rotor.A(sparse=True)
+        >>> x = np.ones(A.shape[1])
+        >>> np.allclose(A @ x, rotor.A() @ x)
+        True
         """
         if frequency is None:
             frequency = speed
 
+        if sparse:
+            M = self.M(sparse=True)
+            K = self.K(frequency, sparse=True) + self.Kst(sparse=True) * speed
+            C = self.C(frequency, sparse=True) + self.G(sparse=True) * speed
+
+            return _StateOperator(M, K, C)
+
         Z = np.zeros((self.ndof, self.ndof))
         I = np.eye(self.ndof)
 
@@ -1180,6 +2293,80 @@ class Rotor(object):
 
         return speed_range
 
+    @staticmethod
+    def _adaptive_range(
+        response, max_frequency, tol=0.1, initial_points=51, max_points=1000
+    ):
+        """Create a frequency array refined where the response changes quickly.
+
+        The response is calculated on a coarse grid from 0 to max_frequency and
+        the intervals where it changes faster than tol are bisected until no
+        interval needs refinement or max_points is reached. The change in an
+        interval is |H(w1) - H(w0)| / max(|H(w0)|, |H(w1)|), which accounts for
+        both magnitude and phase, and the largest value among all the stored
+        responses is used. Magnitudes smaller than 1% of the maximum of each
+        response (or 1e-6 of the maximum of all the responses, which discards
+        numerical noise) are not refined, and neither are intervals narrower than
+        1e-4 * max_frequency. Resonance peaks are resolved without calculating
+        the critical speeds, and the responses calculated while refining are
+        returned with the frequencies.
+
+        Parameters
+        ----------
+        response : callable
+            Function that receives an array of frequencies and returns an array
+            with the responses, with the frequencies in the last axis.
+        max_frequency : float
+            Maximum frequency (rad/s).
+        tol : float, optional
+            Maximum change of the response in an interval. Default is 0.1.
+        initial_points : int, optional
+            Number of points of the coarse grid. Default is 51.
+        max_points : int, optional
+            Maximum number of points. Default is 1000.
+
+        Returns
+        -------
+        frequencies : array
+            Sorted frequencies.
+        responses : array
+            Responses for each frequency.
+
+        Examples
+        --------
+        >>> w, H = Rotor._adaptive_range(lambda w: 1 / (1e4 - w**2 + 2j * w), 200)
+        >>> len(w) < 200
+        True
+        >>> np.round(w[np.argmax(abs(H))])
+        100.0
+        """
+        frequencies = np.linspace(0, max_frequency, initial_points)
+        responses = response(frequencies)
+        min_width = max_frequency * 1e-4
+
+        while len(frequencies) < max_points:
+            H = np.abs(responses).reshape(-1, len(frequencies))
+            dH = np.abs(np.diff(responses, axis=-1)).reshape(-1, len(frequencies) - 1)
+            floor = np.maximum(1e-2 * H.max(axis=-1, keepdims=True), 1e-6 * H.max())
+            with np.errstate(divide="ignore", invalid="ignore"):
+                change = dH / np.maximum(np.maximum(H[:, :-1], H[:, 1:]), floor)
+            change = np.nan_to_num(change).max(axis=0)
+
+            idx = np.flatnonzero((change > tol) & (np.diff(frequencies) > min_width))
+            if len(idx) == 0:
+                break
+            # refine the intervals with the largest changes first
+            idx = idx[np.argsort(change[idx])[::-1][: max_points - len(frequencies)]]
+
+            new_frequencies = (frequencies[idx] + frequencies[idx + 1]) / 2
+            frequencies = np.concatenate([frequencies, new_frequencies])
+            responses = np.concatenate([responses, response(new_frequencies)], axis=-1)
+            order = np.argsort(frequencies)
+            frequencies = frequencies[order]
+            responses = responses[..., order]
+
+        return frequencies, responses
+
     @staticmethod
     def _index(eigenvalues):
         """Generate indexes to sort eigenvalues and eigenvectors.
@@ -1217,75 +2404,475 @@ class Rotor(object):
         positive = [i for i in ind[len(a) // 2 :]]
         negative = [i for i in ind[: len(a) // 2]]
 
-        idx = np.array([positive, negative]).flatten()
+        idx = np.array([positive, negative], dtype=int).flatten()
 
         return idx
 
+    @staticmethod
+    def _mac(u, v):
+        """Modal assurance criterion between two sets of vectors.
+
+        Parameters
+        ----------
+        u : array
+            Array with shape (n, nu), with one vector per column.
+        v : array
+            Array with shape (n, nv), with one vector per column.
+
+        Returns
+        -------
+        mac : array
+            Array with shape (nu, nv) and values between 0 (orthogonal vectors) and
+            1 (parallel vectors).
+
+        Examples
+        --------
+        >>> u = np.array([[1, 0], [0, 1j]])
+        >>> Rotor._mac(u, 2j * u)
+        array([[1., 0.],
+               [0., 1.]])
+        """
+        uv = np.absolute(u.conj().T @ v) ** 2
+        uu = np.sum(np.absolute(u) ** 2, axis=0)
+        vv = np.sum(np.absolute(v) ** 2, axis=0)
+
+        return uv / np.outer(uu, vv)
+
     @check_units
     def _eigen(
-        self, speed, num_modes=12, frequency=None, sorted_=True, A=None, sparse=True
+        self,
+        speed,
+        num_modes=12,
+        frequency=None,
+        sorted_=True,
+        A=None,
+        sparse=True,
+        pencil=False,
+        freq_band=None,
     ):
         """Calculate eigenvalues and eigenvectors.
 
-        This method will return the eigenvalues and eigenvectors of the
-        state space matrix A, sorted by the index method which considers
-        the imaginary part (wd) of the eigenvalues for sorting.
-        To avoid sorting use sorted_=False
+        This method will return the eigenvalues and eigenvectors of the
+        state space matrix A, sorted by the index method which considers
+        the imaginary part (wd) of the eigenvalues for sorting.
+        To avoid sorting use sorted_=False
+
+        Parameters
+        ----------
+        speed : float, pint.Quantity
+            Rotor speed. Default unit is rad/s.
+        frequency: float, pint.Quantity
+            Excitation frequency. Default units is rad/s.
+        sorted_ : bool, optional
+            Sort considering the imaginary part (wd)
+            Default is True
+        A : np.array, scipy.sparse matrix, optional
+            Matrix for which eig will be calculated.
+            Defaul is the rotor A matrix.
+            A sparse matrix is factorized with a sparse LU decomposition by
+            arpack, and the factored form returned by rotor.A(sparse=True) is
+            inverted with a sparse LU decomposition of the stiffness.
+        sparse : bool, optional
+            If sparse, eigenvalues will be calculated with arpack.
+            Default is True.
+        pencil : bool, optional
+            If True, the eigenvalues are calculated from the linearized pencil
+            (see Rotor._pencil()) with a shift-invert on its sparse LU
+            factorization, so that A and the inverse of M are never formed.
+            Only used if sparse is True and A is None.
+            Default is False.
+        freq_band : tuple, pint.Quantity, optional
+            Tuple (wmin, wmax). If given, only the eigenvalues with damped natural
+            frequency (imaginary part) within the band are returned, together with
+            their complex conjugates (see Rotor._eigs_band()). In this case
+            num_modes is the number of eigenvalues calculated for each shift.
+            Default is None.
+
+        Returns
+        -------
+        evalues: array
+            An array with the eigenvalues
+        evectors array
+            An array with the eigenvectors
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> evalues, evectors = rotor._eigen(0)
+        >>> evalues[0].imag # doctest: +ELLIPSIS
+        91.796...
+        >>> evalues, evectors = rotor._eigen(0, pencil=True)
+        >>> evalues[0].imag # doctest: +ELLIPSIS
+        91.796...
+        """
+        if freq_band is not None:
+            P, Q = self._pencil(speed, frequency)
+            evalues, evectors = self._eigs_band(P, Q, freq_band, num_modes)
+        elif pencil and sparse and A is None:
+            P, Q = self._pencil(speed, frequency)
+            evalues, evectors = self._eigs_pencil(P, Q, num_modes)
+        else:
+            if A is None:
+                A = self.A(speed=speed, frequency=frequency)
+
+            if sparse is True:
+                OPinv = None
+                if isinstance(A, _StateOperator):
+                    # shift-invert about zero with the factored form of A
+                    OPinv = las.LinearOperator(A.shape, matvec=A.solve, dtype=A.dtype)
+                try:
+                    evalues, evectors = las.eigs(
+                        A,
+                        k=num_modes,
+                        sigma=0,
+                        ncv=2 * num_modes,
+                        which="LM",
+                        v0=self._v0,
+                        OPinv=OPinv,
+                    )
+                    # store v0 as a linear combination of the previously
+                    # calculated eigenvectors to use in the next call to eigs
+                    self._v0 = np.real(sum(evectors.T))
+                except (las.ArpackError, RuntimeError):
+                    # RuntimeError: singular stiffness in the factored form of A
+                    evalues, evectors = la.eig(self._dense(A))
+            else:
+                evalues, evectors = la.eig(self._dense(A))
+
+        if sorted_ is False:
+            return evalues, evectors
+
+        idx = self._index(evalues)
+
+        return evalues[idx], evectors[:, idx]
+
+    def _pencil(self, speed, frequency=None):
+        """Sparse linearized pencil of the rotor.
+
+        The second order system M q'' + (C + G speed) q' + (K + Kst speed) q = 0 is
+        written as the generalized eigenvalue problem P x = lambda Q x, with
+        x = [q, q'] and
+
+            P = [[0, I], [-(K + Kst speed), -(C + G speed)]]
+            Q = [[I, 0], [0, M]]
+
+        which has the same eigenvalues and eigenvectors as the state space matrix
+        A = Q^-1 P, but keeps the sparsity of the global matrices.
+
+        Parameters
+        ----------
+        speed : float
+            Rotor speed in rad/s.
+        frequency : float, optional
+            Excitation frequency in rad/s. Default is the rotor speed.
+
+        Returns
+        -------
+        P, Q : scipy.sparse.csc_matrix
+            Matrices of the pencil.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> P, Q = rotor._pencil(0)
+        >>> A = rotor.A(0)
+        >>> np.allclose(Q @ A, P.toarray(), atol=1e-6)
+        True
+        """
+        if frequency is None:
+            frequency = speed
+
+        M = self.M(sparse=True)
+        K = self.K(frequency, sparse=True) + self.Kst(sparse=True) * speed
+        C = self.C(frequency, sparse=True) + self.G(sparse=True) * speed
+        I = sp.identity(self.ndof, format="csc")
+
+        P = sp.bmat([[None, I], [-K, -C]], format="csc")
+        Q = sp.block_diag([I, M], format="csc")
+
+        return P, Q
+
+    def _eigs_pencil(self, P, Q, num_modes=12, sigma=0.0):
+        """Eigenvalues of the pencil (P, Q) closest to a shift.
+
+        The eigenvalues of (P - sigma Q)^-1 Q, which are 1 / (lambda - sigma), are
+        calculated with arpack. The operator is applied with a single sparse LU
+        factorization of P - sigma Q. If the shifted pencil is singular or arpack
+        does not converge, all eigenvalues are calculated with scipy.linalg.eig().
+
+        Parameters
+        ----------
+        P, Q : scipy.sparse matrix
+            Matrices of the pencil (see Rotor._pencil()).
+        num_modes : int, optional
+            Number of eigenvalues to be calculated. Default is 12.
+        sigma : float, complex, optional
+            Shift. The eigenvalues closest to sigma are returned. Default is 0.
+
+        Returns
+        -------
+        evalues : array
+            Unsorted eigenvalues.
+        evectors : array
+            Unsorted eigenvectors.
+        """
+        try:
+            lu = las.splu((P - sigma * Q).tocsc())
+        except RuntimeError:
+            return la.eig(P.toarray(), Q.toarray())
+
+        OP = las.LinearOperator(
+            P.shape, matvec=lambda x: lu.solve(Q @ x), dtype=lu.U.dtype
+        )
+        try:
+            mu, evectors = las.eigs(
+                OP, k=num_modes, ncv=2 * num_modes, which="LM", v0=self._v0
+            )
+        except las.ArpackError:
+            return la.eig(P.toarray(), Q.toarray())
+
+        # store v0 as a linear combination of the calculated eigenvectors
+        self._v0 = np.real(sum(evectors.T))
+
+        return sigma + 1 / mu, evectors
+
+    def _eigs_band(self, P, Q, freq_band, num_modes=12):
+        """Eigenvalues of the pencil (P, Q) within a frequency band.
+
+        The band is sliced with shifts sigma = 1j * w placed on the imaginary axis.
+        For each shift the num_modes eigenvalues closest to sigma are calculated
+        with Rotor._eigs_pencil(). All eigenvalues within a radius r smaller than
+        the distance to the farthest one have been found. The radius is taken
+        halfway to the farthest eigenvalue, so that no eigenvalue lies on the
+        border of the circle. Each shift covers the part [w - h, w + h] of the
+        band, with h = r * sqrt(3) / 2, where the circle contains all the
+        eigenvalues with real part down to -r / 2. The remaining parts are
+        covered with new shifts until the whole band has been sliced.
+        Since the shifts are on the imaginary axis, the method targets lightly
+        damped modes, which are the modes of interest for rotors. Modes whose
+        real part is below the smallest -r / 2 of the shifts may be missed. A
+        warning is issued if such heavily damped modes are seen by any shift, but
+        modes that no shift reaches can not be detected.
+
+        Parameters
+        ----------
+        P, Q : scipy.sparse matrix
+            Matrices of the pencil (see Rotor._pencil()).
+        freq_band : tuple
+            Tuple (wmin, wmax) with the damped natural frequencies band (rad/s).
+        num_modes : int, optional
+            Number of eigenvalues calculated for each shift. Default is 12.
+
+        Returns
+        -------
+        evalues : array
+            Unsorted eigenvalues with imaginary part within the band, followed by
+            their complex conjugates.
+        evectors : array
+            Unsorted eigenvectors.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> P, Q = rotor._pencil(0)
+        >>> evalues, evectors = rotor._eigs_band(P, Q, (250, 1000))
+        >>> np.round(np.sort(evalues.imag[evalues.imag > 0]))
+        array([275., 297., 723., 765.])
+        """
+        wmin, wmax = freq_band
+        num_modes = min(num_modes, P.shape[0] - 2)
+
+        evalues = []
+        evectors = []
+        bands = [(wmin, wmax)]
+        half_width = 0
+        # all the eigenvalues with real part above -depth are found
+        depth = np.inf
+        band_real = []
+        while bands:
+            lower, upper = bands.pop()
+            # start next to the previous shift coverage, assuming similar density
+            w = min(lower + half_width, upper)
+            _evalues, _evectors = self._eigs_pencil(P, Q, num_modes, sigma=1j * w)
+            distance = np.absolute(_evalues - 1j * w)
+            farthest = np.max(distance)
+            inner = distance[distance < farthest * (1 - 1e-6)]
+            radius = (np.max(inner, initial=0) + farthest) / 2
+            half_width = radius * np.sqrt(3) / 2
+            depth = min(depth, radius / 2)
+
+            found = (
+                (distance < radius)
+                & (_evalues.imag >= max(lower, w - half_width))
+                & (_evalues.imag <= min(upper, w + half_width))
+            )
+            evalues.append(_evalues[found])
+            evectors.append(_evectors[:, found])
+            band_real.append(
+                _evalues.real[(_evalues.imag >= wmin) & (_evalues.imag <= wmax)]
+            )
+
+            # parts of the band that are not covered yet
+            if w + half_width < upper:
+                bands.append((w + half_width, upper))
+            if w - half_width > lower:
+                bands.append((lower, w - half_width))
+
+        evalues = np.concatenate(evalues)
+        if np.any(np.concatenate(band_real) < -depth):
+            warnings.warn(
+                f"Heavily damped modes were found in the band {freq_band}. Modes "
+                f"with real part below {-depth:.4g} may be missing, increase "
+                f"num_modes to cover them.",
+                UserWarning,
+            )
+        evectors = np.hstack(evectors)
+        positive = evalues.imag > 0
+
+        evalues = np.concatenate([evalues[positive], evalues[positive].conj()])
+        evectors = np.hstack([evectors[:, positive], evectors[:, positive].conj()])
+
+        return evalues, evectors
+
+    def _track_modes(self, speed_range, frequencies=6, tol=1e-10, max_iter=10):
+        """Calculate the modes along a speed range keeping their identity.
+
+        The modes at the first speed are calculated with Rotor._eigs_pencil(). At
+        each following speed, the eigenvalues are predicted by a linear
+        extrapolation from the previous speeds and each mode is refined with
+        inverse iterations on the sparse LU factorization of the pencil shifted to
+        the predicted eigenvalue, starting from the previous eigenvector.
+        The refined modes are matched to the previous ones with the modal
+        assurance criterion (MAC), so that each mode is followed along the speed
+        range, also where modes cross or veer. If the refinement does not
+        converge, or two modes converge to the same one, the modes are calculated
+        with arpack and matched in the same way.
 
         Parameters
         ----------
-        speed : float, pint.Quantity
-            Rotor speed. Default unit is rad/s.
-        frequency: float, pint.Quantity
-            Excitation frequency. Default units is rad/s.
-        sorted_ : bool, optional
-            Sort considering the imaginary part (wd)
-            Default is True
-        A : np.array, optional
-            Matrix for which eig will be calculated.
-            Defaul is the rotor A matrix.
-        sparse : bool, optional
-            If sparse, eigenvalues will be calculated with arpack.
-            Default is True.
+        speed_range : array
+            Array with the speed range in rad/s.
+        frequencies : int, optional
+            Number of modes to be tracked. Default is 6.
+        tol : float, optional
+            Relative tolerance for the eigenvalues. Default is 1e-10.
+        max_iter : int, optional
+            Maximum number of inverse iterations for each mode. Default is 10.
 
-        Returns
-        -------
-        evalues: array
-            An array with the eigenvalues
-        evectors array
-            An array with the eigenvectors
+        Yields
+        ------
+        results : ross.ModalResults
+            Modal results for each speed, with the modes in the same order for all
+            speeds.
 
         Examples
         --------
         >>> rotor = rotor_example()
-        >>> evalues, evectors = rotor._eigen(0)
-        >>> evalues[0].imag # doctest: +ELLIPSIS
-        91.796...
+        >>> speed_range = np.linspace(0, 400, 5)
+        >>> wd = [modal.wd for modal in rotor._track_modes(speed_range, 4)]
+        >>> np.round(wd[-1])
+        array([ 92.,  96., 268., 303.])
         """
-        if A is None:
-            A = self.A(speed=speed, frequency=frequency)
+        for i, speed in enumerate(speed_range):
+            P, Q = self._pencil(speed)
+            if i == 0:
+                evalues, evectors = self._eigs_pencil(P, Q, 2 * frequencies)
+                idx = self._index(evalues)[:frequencies]
+                evalues, evectors = evalues[idx], evectors[:, idx]
+            else:
+                prediction = evalues
+                if i > 1:
+                    step = (speed - speed_range[i - 1]) / (
+                        speed_range[i - 1] - speed_range[i - 2]
+                    )
+                    prediction = evalues + (evalues - previous) * step
+                previous = evalues
+                evalues, evectors = self._refine_modes(
+                    P, Q, prediction, evectors, tol, max_iter
+                )
+
+            yield self._modal_results(
+                speed,
+                np.concatenate([evalues, evalues.conj()]),
+                np.hstack([evectors, evectors.conj()]),
+                frequencies,
+            )
+
+    def _refine_modes(self, P, Q, evalues, evectors, tol=1e-10, max_iter=10):
+        """Refine modes of a pencil from an approximation of the eigenpairs.
+
+        Parameters
+        ----------
+        P, Q : scipy.sparse matrix
+            Matrices of the pencil (see Rotor._pencil()).
+        evalues : array
+            Approximated eigenvalues, used as shifts.
+        evectors : array
+            Approximated eigenvectors, one per column, used as starting vectors
+            and to match the refined modes.
+        tol : float, optional
+            Relative tolerance for the eigenvalues. Default is 1e-10.
+        max_iter : int, optional
+            Maximum number of inverse iterations for each mode. Default is 10.
 
-        if sparse is True:
+        Returns
+        -------
+        evalues : array
+            Eigenvalues matched to each one of the approximated eigenpairs.
+        evectors : array
+            Eigenvectors matched to each one of the approximated eigenpairs.
+        """
+        n_modes = len(evalues)
+        _evalues = np.zeros(n_modes, dtype=complex)
+        _evectors = np.zeros(evectors.shape, dtype=complex)
+        converged = True
+        for j, (sigma, x) in enumerate(zip(evalues, evectors.T)):
             try:
-                evalues, evectors = las.eigs(
-                    A, k=num_modes, sigma=0, ncv=2 * num_modes, which="LM", v0=self._v0
-                )
-                # store v0 as a linear combination of the previously
-                # calculated eigenvectors to use in the next call to eigs
-                self._v0 = np.real(sum(evectors.T))
-            except las.ArpackError:
-                evalues, evectors = la.eig(A)
-        else:
-            evalues, evectors = la.eig(A)
+                lu = las.splu((P - sigma * Q).tocsc())
+            except RuntimeError:
+                converged = False
+                break
 
-        if sorted_ is False:
-            return evalues, evectors
+            evalue = sigma
+            x = x / la.norm(x)
+            for _ in range(max_iter):
+                y = lu.solve(Q @ x)
+                previous, evalue = evalue, sigma + 1 / np.vdot(x, y)
+                x = y / la.norm(y)
+                if abs(evalue - previous) <= tol * abs(evalue):
+                    break
+            else:
+                converged = False
+                break
 
-        idx = self._index(evalues)
+            _evalues[j], _evectors[:, j] = evalue, x
 
-        return evalues[idx], evectors[:, idx]
+        if converged:
+            mac = self._mac(evectors, _evectors)
+            _, idx = linear_sum_assignment(-mac)
+            # each mode must converge to a distinct one
+            if np.all(
+                self._mac(_evectors, _evectors)[np.triu_indices(n_modes, 1)] < 0.99
+            ):
+                return _evalues[idx], _evectors[:, idx]
+
+        _evalues, _evectors = self._eigs_pencil(P, Q, 2 * n_modes + 4)
+        upper = _evalues.imag >= 0
+        _evalues, _evectors = _evalues[upper], _evectors[:, upper]
+        _, idx = linear_sum_assignment(-self._mac(evectors, _evectors))
 
-    def _lti(self, speed, frequency=None):
+        return _evalues[idx], _evectors[:, idx]
+
+    @staticmethod
+    def _dense(matrix):
+        """Return a dense array for a matrix that might be in sparse format."""
+        if sp.issparse(matrix):
+            return matrix.toarray()
+        if isinstance(matrix, las.LinearOperator):
+            return matrix @ np.eye(matrix.shape[1])
+        return matrix
+
+    def _lti(self, speed, frequency=None, sparse=False):
         """Continuous-time linear time invariant system.
 
         This method is used to create a Continuous-time linear
@@ -1300,6 +2887,12 @@ class Rotor(object):
         frequency: float, optional
             Excitation frequency.
             Default is rotor speed.
+        sparse : bool, optional
+            If True, the global matrices are assembled in sparse format and the
+            mass matrix is factorized only once with a sparse LU decomposition.
+            The system matrices are dense, since this is required by
+            scipy.signal.lti.
+            Default is False.
 
         Returns
         -------
@@ -1313,6 +2906,8 @@ class Rotor(object):
         >>> B = rotor._lti(speed=0).B
         >>> C = rotor._lti(speed=0).C
         >>> D = rotor._lti(speed=0).D
+        >>> np.allclose(rotor._lti(speed=0, sparse=True).B, B)
+        True
         """
         Z = np.zeros((self.ndof, self.ndof))
         I = np.eye(self.ndof)
@@ -1321,6 +2916,22 @@ class Rotor(object):
         B2 = I
         if frequency is None:
             frequency = speed
+
+        if sparse:
+            # observation matrices only use displacements (Ca = 0), so the
+            # factorization of M is needed only for the state matrices.
+            M_lu = las.splu(self.M(sparse=True).tocsc())
+            K = self.K(frequency, sparse=True) + self.Kst(sparse=True) * speed
+            C = self.C(frequency, sparse=True) + self.G(sparse=True) * speed
+            Minv = M_lu.solve(np.hstack([-K.toarray(), -C.toarray(), B2]))
+
+            A = np.vstack([np.hstack([Z, I]), Minv[:, : 2 * self.ndof]])
+            B = np.vstack([Z, Minv[:, 2 * self.ndof :]])
+            C = np.hstack([I, Z])
+            D = Z
+
+            return signal.lti(A, B, C, D)
+
         A = self.A(speed=speed, frequency=frequency)
         # fmt: off
         B = np.vstack([Z,
@@ -1366,17 +2977,60 @@ class Rotor(object):
         >>> speed = 100.0
         >>> H = rotor.transfer_matrix(speed=speed)
         """
-        lti = self._lti(speed=speed)
-        B = lti.B
-        C = lti.C
-        D = lti.D
+        H = self._transfer_function(speed, [speed], frequency=frequency, modes=modes)
+
+        return H[..., 0]
+
+    def _transfer_function(
+        self, speed, frequencies, frequency=None, modes=None, rows=None, cols=None
+    ):
+        """Transfer matrices for a fixed rotor speed.
+
+        The state space matrix is decomposed only once, with its left and right
+        eigenvectors, and the transfer matrix
+
+            H(w) = C psi diag(1 / (i w - lambda)) psi_L^H B + D
+
+        is evaluated for all the excitation frequencies w in a single vectorized
+        operation. The left eigenvectors are normalized so that psi_L^H psi = I,
+        which avoids the inversion of psi.
+
+        Parameters
+        ----------
+        speed : float
+            Rotor speed (rad/s).
+        frequencies : array
+            Excitation frequencies (rad/s).
+        frequency : float, optional
+            Frequency used to evaluate the bearing coefficients.
+            Default is the rotor speed.
+        modes : list, optional
+            List with modes used to calculate the matrix.
+            (all modes will be used if a list is not given).
+        rows : list, array, optional
+            Rows of the transfer matrix (global index). Default is all.
+        cols : list, array, optional
+            Columns of the transfer matrix (global index). Default is all.
 
-        # calculate eigenvalues and eigenvectors using la.eig to get
-        # left and right eigenvectors.
+        Returns
+        -------
+        H : array
+            Array with shape (len(rows), len(cols), len(frequencies)).
 
-        evals, psi = self._eigen(speed=speed, frequency=frequency, sparse=False)
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> H = rotor._transfer_function(100.0, np.linspace(0, 500, 11))
+        >>> H.shape
+        (28, 28, 11)
+        """
+        rows = np.arange(self.ndof) if rows is None else np.asarray(rows)
+        cols = np.arange(self.ndof) if cols is None else np.asarray(cols)
 
-        psi_inv = la.inv(psi)
+        lti = self._lti(speed=speed, frequency=frequency)
+        evals, psi_l, psi = la.eig(lti.A, left=True, right=True)
+        idx = self._index(evals)
+        evals, psi, psi_l = evals[idx], psi[:, idx], psi_l[:, idx]
 
         if modes is not None:
             n = self.ndof  # n dof -> number of modes
@@ -1385,15 +3039,19 @@ class Rotor(object):
             idx = np.zeros((2 * m), int)
             idx[0:m] = modes  # modes
             idx[m:] = range(2 * n)[-m:]  # conjugates (see how evalues are ordered)
-            evals = evals[np.ix_(idx)]
-            psi = psi[np.ix_(range(2 * n), idx)]
-            psi_inv = psi_inv[np.ix_(idx, range(2 * n))]
+            evals, psi, psi_l = evals[idx], psi[:, idx], psi_l[:, idx]
 
-        diag = np.diag([1 / (1j * speed - lam) for lam in evals])
+        # normalize the left eigenvectors so that psi_l^H @ psi = I. The product
+        # is diagonal, or block diagonal for repeated eigenvalues (e.g. rigid
+        # body modes), so it is well conditioned even if psi is not.
+        psi_l_h = psi_l.conj().T
+        right = la.solve(psi_l_h @ psi, psi_l_h @ lti.B[:, cols])
+        left = (lti.C @ psi)[rows]
+        diag = 1 / (1j * np.asarray(frequencies)[:, np.newaxis] - evals)
 
-        H = C @ psi @ diag @ psi_inv @ B + D
+        H = (left * diag[:, np.newaxis, :]) @ right + lti.D[np.ix_(rows, cols)]
 
-        return H
+        return np.moveaxis(H, 0, -1)
 
     def run_freq_response(
         self,
@@ -1403,6 +3061,14 @@ class Rotor(object):
         num_modes=12,
         num_points=10,
         rtol=0.005,
+        n_jobs=None,
+        method="modal",
+        inp=None,
+        out=None,
+        speed=None,
+        adaptive=False,
+        adaptive_tol=0.1,
+        reduced=None,
     ):
         """Frequency response for a mdof system.
 
@@ -1444,6 +3110,51 @@ class Rotor(object):
             Tolerance (relative) for termination. Applied to scipy.optimize.newton to
             calculate the approximated critical speeds.
             Default is 0.005 (0.5%).
+        n_jobs : int, optional
+            Number of processes used to calculate the speed range, which is split
+            in contiguous chunks. The rotor is sent once to each process and the
+            results are the same as the ones calculated in a single process.
+            If -1, all the CPUs are used.
+            Default is None (a single process).
+        method : str, optional
+            Method used to calculate the frequency response:
+            "modal" - the transfer matrix is obtained from the eigenvalues and
+            eigenvectors of the state space matrix (see Rotor.transfer_matrix()).
+            "direct" - the dynamic stiffness matrix
+            K(w) + w Kst - w² M + i w (C(w) + w G) is assembled in sparse format and
+            solved with a sparse LU factorization for each frequency. This avoids
+            the dense eigenvalue problem and is faster for large models. The modes
+            argument can not be used with this method.
+            Default is "modal".
+        inp, out : int, list, optional
+            Global degrees of freedom for which the response is stored. If given,
+            results.freq_resp[i, j] holds the response that would be in
+            freq_resp[inp[i], out[j]] if all degrees of freedom were stored, and
+            the stored array has shape (len(inp), len(out), len(speed_range)).
+            Default is None (all degrees of freedom).
+        speed : float, optional
+            Fixed rotor speed (rad/s). If given, speed_range holds the excitation
+            frequencies and the rotor runs at this speed for all of them, as in an
+            impact test. The bearing coefficients are evaluated at this speed, so
+            the result is exact for frequency independent bearings. With
+            method="modal", the state space matrix is decomposed only once.
+            Default is None (the excitation frequency is equal to the rotor speed).
+        adaptive : bool, optional
+            If True and speed_range is None, the frequencies are chosen adaptively
+            from 0 to 1.5 times the highest natural frequency: a coarse grid is
+            bisected where the stored responses change faster than adaptive_tol
+            (see Rotor._adaptive_range()). This resolves the resonance peaks with
+            few points and without calculating the critical speeds.
+            Default is False.
+        adaptive_tol : float, optional
+            Maximum relative change of the response between adjacent frequencies
+            when adaptive is True. Default is 0.1.
+        reduced : ross.ReducedModel, optional
+            Reduced model of this rotor (see ross.guyan(), ross.modal_reduction()
+            and ross.craig_bampton()). If given, the reduced dynamic stiffness
+            matrix is solved for each frequency, whatever the method, and the
+            transfer matrix is expanded only on the inp and out dofs.
+            Default is None.
 
         Returns
         -------
@@ -1479,6 +3190,36 @@ class Rotor(object):
         >>> abs(response.freq_resp) # doctest: +ELLIPSIS
         array([[[2.00154633e-07, 2.02422522e-07, 2.09522044e-07, ...
 
+        Solving the dynamic stiffness matrix directly:
+        >>> response = rotor.run_freq_response(speed_range=speed, method="direct")
+        >>> abs(response.freq_resp) # doctest: +ELLIPSIS
+        array([[[1.00000000e-06, 1.00261725e-06, 1.01076952e-06, ...
+
+        Exciting the rotor running at a fixed speed:
+        >>> response = rotor.run_freq_response(speed_range=speed, speed=500.0)
+        >>> response.freq_resp.shape
+        (28, 28, 101)
+
+        Storing only the degrees of freedom of interest:
+        >>> response = rotor.run_freq_response(
+        ...     speed_range=speed, method="direct", inp=[13, 14], out=13
+        ... )
+        >>> response.freq_resp.shape
+        (2, 1, 101)
+
+        Choosing the frequencies adaptively:
+        >>> response = rotor.run_freq_response(adaptive=True, inp=13, out=13)
+        >>> len(response.speed_range) < 1000
+        True
+
+        Using a reduced model:
+        >>> reduced = rs.guyan(rotor, nodes=[0, 2, 3, 4, 6])
+        >>> response = rotor.run_freq_response(
+        ...     speed_range=speed, inp=13, out=13, reduced=reduced
+        ... )
+        >>> abs(response.freq_resp) # doctest: +ELLIPSIS
+        array([[[1.71382967e-06, 1.73399988e-06, 1.79752551e-06, ...
+
         Plotting frequency response function:
         >>> fig = response.plot(inp=13, out=13)
 
@@ -1492,37 +3233,225 @@ class Rotor(object):
         Plotting acceleration response
         >>> fig = response.plot(inp=13, out=13, amplitude_units="m/s**2/N")
         """
-        if speed_range is None:
-            if not cluster_points:
-                modal = self.run_modal(0)
-                speed_range = np.linspace(0, max(modal.evalues.imag) * 1.5, 1000)
+        self._check_response_method(method, modes, reduced)
+
+        if inp is not None:
+            inp = np.atleast_1d(inp)
+        if out is not None:
+            out = np.atleast_1d(out)
+
+        def freq_response(frequencies, executor=None):
+            return np.concatenate(
+                self._map_speed_range(
+                    "_freq_response",
+                    frequencies,
+                    n_jobs,
+                    modes,
+                    method,
+                    inp,
+                    out,
+                    speed,
+                    reduced,
+                    executor=executor,
+                ),
+                axis=-1,
+            )
+
+        if speed_range is None and (adaptive or not cluster_points):
+            modal = self.run_modal(0 if speed is None else speed, reduced=reduced)
+            max_frequency = max(modal.evalues.imag) * 1.5
+            self._check_frequency_array([0, max_frequency])
+            if adaptive:
+                # the pool is kept for all the refinement passes
+                with self._process_pool(n_jobs) as executor:
+                    speed_range, freq_resp = self._adaptive_range(
+                        lambda w: freq_response(w, executor),
+                        max_frequency,
+                        adaptive_tol,
+                    )
             else:
+                speed_range = np.linspace(0, max_frequency, 1000)
+                freq_resp = freq_response(speed_range)
+        else:
+            if speed_range is None:
                 speed_range = self._clustering_points(
                     num_modes, num_points, modes, rtol
                 )
+            self._check_frequency_array(speed_range)
+            freq_resp = freq_response(speed_range)
 
-        self._check_frequency_array(speed_range)
-
-        freq_resp = np.empty((self.ndof, self.ndof, len(speed_range)), dtype=complex)
-        velc_resp = np.empty((self.ndof, self.ndof, len(speed_range)), dtype=complex)
-        accl_resp = np.empty((self.ndof, self.ndof, len(speed_range)), dtype=complex)
-
-        for i, speed in enumerate(speed_range):
-            H = self.transfer_matrix(speed=speed, modes=modes)
-            freq_resp[..., i] = H
-            velc_resp[..., i] = 1j * speed * H
-            accl_resp[..., i] = -(speed**2) * H
-
+        # velocity and acceleration are calculated from freq_resp when accessed
         results = FrequencyResponseResults(
             freq_resp=freq_resp,
-            velc_resp=velc_resp,
-            accl_resp=accl_resp,
+            velc_resp=None,
+            accl_resp=None,
             speed_range=speed_range,
             number_dof=self.number_dof,
+            inp=inp,
+            out=out,
         )
 
         return results
 
+    def _freq_response(
+        self,
+        speed_range,
+        modes=None,
+        method="modal",
+        inp=None,
+        out=None,
+        speed=None,
+        reduced=None,
+    ):
+        """Transfer matrices for a speed range (see Rotor.run_freq_response()).
+
+        Returns
+        -------
+        freq_resp : array
+            Array with shape (len(inp), len(out), len(speed_range)).
+        """
+        if reduced is not None:
+            return reduced._freq_response(speed_range, rows=inp, cols=out, speed=speed)
+        if method == "direct":
+            return self._freq_response_direct(
+                speed_range, rows=inp, cols=out, speed=speed
+            )
+        if speed is not None:
+            return self._transfer_function(
+                speed, speed_range, modes=modes, rows=inp, cols=out
+            )
+
+        rows = np.arange(self.ndof) if inp is None else inp
+        cols = np.arange(self.ndof) if out is None else out
+
+        freq_resp = np.empty((len(rows), len(cols), len(speed_range)), dtype=complex)
+        for i, speed in enumerate(speed_range):
+            H = self.transfer_matrix(speed=speed, modes=modes)
+            freq_resp[..., i] = H[np.ix_(rows, cols)]
+
+        return freq_resp
+
+    def _freq_response_direct(self, speed_range, rows=None, cols=None, speed=None):
+        """Frequency response from the dynamic stiffness matrix.
+
+        For each frequency w (equal to the rotor speed), the dynamic stiffness
+        matrix Z = K(w) + w Kst - w² M + i w (C(w) + w G) is assembled in sparse
+        format and factorized with a sparse LU decomposition. Only the requested
+        columns of H = Z^-1 are solved for and only the requested rows are stored.
+        If a fixed rotor speed is given, it replaces w in K, Kst, C and G.
+
+        Parameters
+        ----------
+        speed_range : array
+            Array with the frequencies (rad/s).
+        rows : list, array, optional
+            Rows of the transfer matrix (global index). Default is all.
+        cols : list, array, optional
+            Columns of the transfer matrix (global index). Default is all.
+        speed : float, optional
+            Fixed rotor speed (rad/s). Default is None (equal to the frequency).
+
+        Returns
+        -------
+        freq_resp : array
+            Array with shape (len(rows), len(cols), len(speed_range)).
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> speed_range = np.array([0.0, 100.0])
+        >>> H = rotor._freq_response_direct(speed_range, rows=[13, 14], cols=[13])
+        >>> H.shape
+        (2, 1, 2)
+        >>> H_modal = rotor.transfer_matrix(speed=100.0)
+        >>> np.allclose(H[..., 1], H_modal[[13, 14]][:, [13]])
+        True
+        """
+        rows = np.arange(self.ndof) if rows is None else np.asarray(rows)
+        cols = np.arange(self.ndof) if cols is None else np.asarray(cols)
+        rhs = np.eye(self.ndof)[:, cols]
+
+        freq_resp = np.empty((len(rows), len(cols), len(speed_range)), dtype=complex)
+        for i, Z in enumerate(self._dynamic_stiffness(speed_range, speed)):
+            freq_resp[..., i] = las.splu(Z).solve(rhs)[rows]
+
+        return freq_resp
+
+    def _dynamic_stiffness(self, speed_range, speed=None):
+        """Sparse dynamic stiffness matrices for a frequency range.
+
+        Parameters
+        ----------
+        speed_range : array
+            Array with the frequencies w (rad/s).
+        speed : float, optional
+            Fixed rotor speed (rad/s). Default is None (equal to the frequency).
+
+        Yields
+        ------
+        Z : scipy.sparse.csc_matrix
+            Matrix K(w) + w Kst - w² M + i w (C(w) + w G) for each frequency, with
+            w replaced by the fixed speed in K, Kst, C and G if given.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> Z = next(rotor._dynamic_stiffness([0.0]))
+        >>> np.allclose(Z.toarray(), rotor.K(0))
+        True
+        """
+        M = self.M(sparse=True)
+        Kst = self.Kst(sparse=True)
+        G = self.G(sparse=True)
+        if speed is None:
+            speeds = speed_range
+            K = self.K(speed_range, sparse=True)
+            C = self.C(speed_range, sparse=True)
+        else:
+            speeds = np.full(len(speed_range), speed)
+            K = [self.K(speed, sparse=True)] * len(speed_range)
+            C = [self.C(speed, sparse=True)] * len(speed_range)
+
+        for i, (w, s) in enumerate(zip(speed_range, speeds)):
+            Z = K[i] + s * Kst - w**2 * M + 1j * w * (C[i] + s * G)
+            yield Z.tocsc()
+
+    def _forced_response_direct(self, force, speed_range):
+        """Forced response from the dynamic stiffness matrix.
+
+        The response X(w) = Z(w)^-1 F(w) is obtained with a sparse solve against
+        the force vector for each frequency, without calculating the transfer
+        matrix.
+
+        Parameters
+        ----------
+        force : array
+            Array with shape (ndof, len(speed_range)) with the force for each
+            frequency.
+        speed_range : array
+            Array with the frequencies (rad/s).
+
+        Returns
+        -------
+        forced_resp : array
+            Array with shape (ndof, len(speed_range)).
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> speed = np.array([100.0, 200.0])
+        >>> force = rotor._unbalance_force(3, 10.0, 0.0, speed)
+        >>> X = rotor._forced_response_direct(force, speed)
+        >>> H = rotor.transfer_matrix(speed=200.0)
+        >>> np.allclose(X[:, 1], H @ force[:, 1])
+        True
+        """
+        forced_resp = np.empty((self.ndof, len(speed_range)), dtype=complex)
+        for i, Z in enumerate(self._dynamic_stiffness(speed_range)):
+            forced_resp[:, i] = las.spsolve(Z, force[:, i])
+
+        return forced_resp
+
     def run_forced_response(
         self,
         force=None,
@@ -1533,6 +3462,8 @@ class Rotor(object):
         num_points=10,
         rtol=0.005,
         unbalance=None,
+        method="modal",
+        reduced=None,
     ):
         """Forced response for a mdof system.
 
@@ -1585,6 +3516,21 @@ class Rotor(object):
             Tolerance (relative) for termination. Applied to scipy.optimize.newton to
             calculate the approximated critical speeds.
             Default is 0.005 (0.5%).
+        method : str, optional
+            Method used to calculate the forced response:
+            "modal" - the response is obtained from the frequency response
+            (see Rotor.run_freq_response()).
+            "direct" - the sparse dynamic stiffness matrix is solved against the
+            force vector for each frequency, so the transfer matrix is neither
+            calculated nor stored. This is much faster for large models. The modes
+            argument can not be used with this method.
+            Default is "modal".
+        reduced : ross.ReducedModel, optional
+            Reduced model of this rotor (see ross.guyan(), ross.modal_reduction()
+            and ross.craig_bampton()). If given, the reduced dynamic stiffness
+            matrix is solved against the projected force, whatever the method,
+            and the response is expanded to the rotor dofs.
+            Default is None.
 
         Returns
         -------
@@ -1610,27 +3556,50 @@ class Rotor(object):
         ... )
         >>> response.speed_range.shape
         (61,)
+
+        Solving the dynamic stiffness matrix directly:
+        >>> resp = rotor.run_forced_response(force=force, speed_range=speed, method="direct")
+        >>> abs(resp.forced_resp) # doctest: +ELLIPSIS
+        array([[0.00000000e+00, 5.06073311e-04, 2.10044826e-03, ...
         """
+        self._check_response_method(method, modes, reduced)
+
         if speed_range is None:
             if cluster_points:
                 speed_range = self._clustering_points(
                     num_modes, num_points, modes, rtol
                 )
 
-        freq_resp = self.run_freq_response(
-            speed_range, modes, cluster_points, num_modes, num_points, rtol
-        )
+        self._check_frequency_array(speed_range)
+        forced_resp = self._forced_response(force, speed_range, modes, method, reduced)
+
+        return self._forced_response_results(forced_resp, speed_range, unbalance)
+
+    def _forced_response(
+        self, force, speed_range, modes=None, method="modal", reduced=None
+    ):
+        """Forced response for a speed range (see Rotor.run_forced_response()).
+
+        Returns
+        -------
+        forced_resp : array
+            Array with shape (ndof, len(speed_range)).
+        """
+        if reduced is not None:
+            return reduced._forced_response(force, speed_range)
+        if method == "direct":
+            return self._forced_response_direct(force, speed_range)
 
-        forced_resp = np.zeros((self.ndof, len(freq_resp.speed_range)), dtype=complex)
-        velc_resp = np.zeros((self.ndof, len(freq_resp.speed_range)), dtype=complex)
-        accl_resp = np.zeros((self.ndof, len(freq_resp.speed_range)), dtype=complex)
+        freq_resp = self._freq_response(speed_range, modes)
+        return np.einsum("ijk,jk->ik", freq_resp, force[:, : len(speed_range)])
 
-        for i in range(len(freq_resp.speed_range)):
-            forced_resp[:, i] = freq_resp.freq_resp[..., i] @ force[..., i]
-            velc_resp[:, i] = freq_resp.velc_resp[..., i] @ force[..., i]
-            accl_resp[:, i] = freq_resp.accl_resp[..., i] @ force[..., i]
+    def _forced_response_results(self, forced_resp, speed_range, unbalance=None):
+        """Create the ForcedResponseResults for a forced response array."""
+        speeds = np.asarray(speed_range)
+        velc_resp = 1j * speeds * forced_resp
+        accl_resp = -(speeds**2) * forced_resp
 
-        forced_resp = ForcedResponseResults(
+        return ForcedResponseResults(
             rotor=self,
             forced_resp=forced_resp,
             velc_resp=velc_resp,
@@ -1639,8 +3608,6 @@ class Rotor(object):
             unbalance=unbalance,
         )
 
-        return forced_resp
-
     def _unbalance_force(self, node, magnitude, phase, omega):
         """Calculate unbalance forces.
 
@@ -1680,8 +3647,7 @@ class Rotor(object):
 
         n0 = self.number_dof * node
         n1 = n0 + self.number_dof
-        for i, w in enumerate(omega):
-            F0[n0:n1, i] += w**2 * b0
+        F0[n0:n1, :] = np.outer(b0, np.asarray(omega) ** 2)
 
         return F0
 
@@ -1697,6 +3663,10 @@ class Rotor(object):
         num_modes=12,
         num_points=10,
         rtol=0.005,
+        method="modal",
+        adaptive=False,
+        adaptive_tol=0.1,
+        reduced=None,
     ):
         """Unbalanced response for a mdof system.
 
@@ -1748,6 +3718,21 @@ class Rotor(object):
             Tolerance (relative) for termination. Applied to scipy.optimize.newton to
             calculate the approximated critical speeds.
             Default is 0.005 (0.5%).
+        method : str, optional
+            "modal" or "direct" (see Rotor.run_forced_response()).
+            Default is "modal".
+        adaptive : bool, optional
+            If True and frequency is None, the frequencies are chosen adaptively
+            from 0 to 1.5 times the highest natural frequency at speed = 0: a coarse
+            grid is bisected where the response changes faster than adaptive_tol
+            (see Rotor._adaptive_range()).
+            Default is False.
+        adaptive_tol : float, optional
+            Maximum relative change of the response between adjacent frequencies
+            when adaptive is True. Default is 0.1.
+        reduced : ross.ReducedModel, optional
+            Reduced model of this rotor (see Rotor.run_forced_response()).
+            Default is None.
 
         Returns
         -------
@@ -1814,31 +3799,71 @@ class Rotor(object):
         Speed value must be in speed_range.
         >>> value = 600
         >>> fig = response.plot_deflected_shape(speed=value)
+
+        Choosing the frequencies adaptively:
+        >>> response = rotor.run_unbalance_response(
+        ...     node=3, unbalance_magnitude=10.0, unbalance_phase=0.0, adaptive=True
+        ... )
+        >>> len(response.speed_range) < 1000
+        True
+
+        Using a reduced model with static correction at the unbalance node:
+        >>> reduced = rs.modal_reduction(rotor, num_modes=8, nodes=[3])
+        >>> response = rotor.run_unbalance_response(
+        ...     node=3,
+        ...     unbalance_magnitude=10.0,
+        ...     unbalance_phase=0.0,
+        ...     frequency=speed,
+        ...     reduced=reduced,
+        ... )
+        >>> abs(response.forced_resp) # doctest: +ELLIPSIS
+        array([[0.00000000e+00, 5.06078077e-04, 2.10052702e-03, ...
         """
+
+        def unbalance_force(frequency):
+            force = np.zeros((self.ndof, len(frequency)), dtype=complex)
+            try:
+                for n, m, p in zip(node, unbalance_magnitude, unbalance_phase):
+                    force += self._unbalance_force(n, m, p, frequency)
+            except TypeError:
+                force = self._unbalance_force(
+                    node, unbalance_magnitude, unbalance_phase, frequency
+                )
+            return force
+
+        ub = np.vstack((node, unbalance_magnitude, unbalance_phase))
+
+        if frequency is None and adaptive:
+            self._check_response_method(method, modes, reduced)
+
+            max_frequency = max(self.run_modal(0, reduced=reduced).evalues.imag) * 1.5
+            self._check_frequency_array([0, max_frequency])
+            frequency, forced_resp = self._adaptive_range(
+                lambda w: self._forced_response(
+                    unbalance_force(w), w, modes, method, reduced
+                ),
+                max_frequency,
+                adaptive_tol,
+            )
+            return self._forced_response_results(forced_resp, frequency, ub)
+
         if frequency is None:
             if cluster_points:
                 frequency = self._clustering_points(num_modes, num_points, modes, rtol)
 
-        force = np.zeros((self.ndof, len(frequency)), dtype=complex)
-
-        try:
-            for n, m, p in zip(node, unbalance_magnitude, unbalance_phase):
-                force += self._unbalance_force(n, m, p, frequency)
-        except TypeError:
-            force = self._unbalance_force(
-                node, unbalance_magnitude, unbalance_phase, frequency
-            )
+        force = unbalance_force(frequency)
 
         # fmt: off
-        ub = np.vstack((node, unbalance_magnitude, unbalance_phase))
         forced_response = self.run_forced_response(
-            force, frequency, modes, cluster_points, num_modes, num_points, rtol, ub
+            force, frequency, modes, cluster_points, num_modes, num_points, rtol, ub, method, reduced
         )
         # fmt: on
 
         return forced_response
 
-    def time_response(self, speed, F, t, ic=None):
+    def time_response(
+        self, speed, F, t, ic=None, reduced=None, method="lsim", alpha=-0.05
+    ):
         """Time response for a rotor.
 
         This method returns the time response for a rotor
@@ -1852,6 +3877,23 @@ class Rotor(object):
             Time array. (must have the same length than lti.B matrix)
         ic : array, optional
             The initial conditions on the state vector (zero by default).
+        reduced : ross.ReducedModel, optional
+            Reduced model of this rotor. If given, the reduced system is
+            integrated, ic is projected onto the reduced coordinates and xout is
+            expanded to the rotor dofs.
+            Default is None.
+        method : str, optional
+            Integration method:
+            "lsim" - the continuous state space system is simulated with
+            scipy.signal.lsim().
+            "newmark" - implicit Newmark-beta integration with constant average
+            acceleration (see Rotor._newmark()).
+            "hht" - implicit HHT-alpha integration (see Rotor._newmark()), which
+            damps the spurious high frequency response of the discretization.
+            Default is "lsim".
+        alpha : float, optional
+            HHT-alpha parameter, between -1/3 and 0. Only used if method="hht".
+            Default is -0.05.
 
         Returns
         -------
@@ -1872,8 +3914,229 @@ class Rotor(object):
         >>> rotor.time_response(speed, F, t) # doctest: +ELLIPSIS
         (array([0.        , 0.18518519, 0.37037037, ...
         """
-        lti = self._lti(speed)
-        return signal.lsim(lti, F, t, X0=ic)
+        if method not in ("lsim", "newmark", "hht"):
+            raise ValueError(
+                f"method can be 'lsim', 'newmark' or 'hht'. {method} is not valid."
+            )
+
+        if method == "lsim" and reduced is None:
+            lti = self._lti(speed)
+            return signal.lsim(lti, F, t, X0=ic)
+
+        _, u, v = next(
+            self._time_response_chunks(speed, F, t, ic, reduced, method, alpha)
+        )
+
+        return np.asarray(t), u, np.hstack([u, v])
+
+    def _time_response_chunks(
+        self,
+        speed,
+        F,
+        t,
+        ic=None,
+        reduced=None,
+        method="lsim",
+        alpha=-0.05,
+        chunk_size=None,
+        dofs=None,
+    ):
+        """Time response calculated in chunks of time steps.
+
+        Only the current chunk is kept in memory, so that long simulations can be
+        stored as they are calculated (see Rotor.run_time_response()). With
+        method="lsim", each chunk is simulated starting from the last state of the
+        previous one.
+
+        Parameters
+        ----------
+        speed, F, t, ic, reduced, method, alpha
+            See Rotor.time_response().
+        chunk_size : int, optional
+            Number of time steps in each chunk. Default is len(t) (one chunk).
+        dofs : array, optional
+            Degrees of freedom returned. Default is all.
+
+        Yields
+        ------
+        chunk : slice
+            Time steps of the chunk.
+        u, v : array
+            Displacements and velocities of the dofs, with shape (chunk length,
+            len(dofs)).
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> t = np.linspace(0, 0.1, 101)
+        >>> F = np.zeros((101, rotor.ndof))
+        >>> chunks = rotor._time_response_chunks(0, F, t, chunk_size=40, dofs=[12])
+        >>> [(chunk.start, u.shape) for chunk, u, v in chunks]
+        [(0, (40, 1)), (40, (40, 1)), (80, (21, 1))]
+        """
+        nt = len(t)
+        if chunk_size is None:
+            chunk_size = nt
+        if reduced is not None:
+            self._check_reduced(reduced)
+            if ic is not None:
+                ic = reduced.reduce(ic)
+            T = reduced.T if dofs is None else reduced.T[dofs]
+        elif dofs is None:
+            dofs = slice(None)
+
+        def output(chunk, x, n):
+            u, v = x[:, :n], x[:, n:]
+            if reduced is None:
+                return chunk, u[:, dofs], v[:, dofs]
+            return chunk, u @ T.T, v @ T.T
+
+        if method == "lsim":
+            lti = self._lti(speed) if reduced is None else reduced._lti(speed)
+            n = lti.A.shape[0] // 2
+            start = 0
+            while start < nt:
+                stop = min(start + chunk_size, nt)
+                # chunks after the first one start at the last step of the previous
+                first = max(start - 1, 0)
+                if stop - first < 2:
+                    x = np.zeros((1, 2 * n)) if ic is None else np.atleast_2d(ic)
+                else:
+                    t_chunk = np.asarray(t[first:stop])
+                    if start > 0:
+                        # lsim takes X0 as the state at time 0
+                        t_chunk = t_chunk - t_chunk[0]
+                    _, _, x = signal.lsim(lti, F[first:stop], t_chunk, X0=ic)
+                ic = x[-1]
+                yield output(slice(start, stop), x[start - first :], n)
+                start = stop
+            return
+
+        if reduced is None:
+            M = self.M(sparse=True)
+            K = self.K(speed, sparse=True) + speed * self.Kst(sparse=True)
+            C = self.C(speed, sparse=True) + speed * self.G(sparse=True)
+            force = F
+        else:
+            M = reduced.M()
+            K = reduced.K(speed) + speed * reduced.Kst()
+            C = reduced.C(speed) + speed * reduced.G()
+            force = _ProjectedForce(F, reduced.T)
+
+        n = M.shape[0]
+        alpha = 0.0 if method == "newmark" else alpha
+        for chunk, u, v in self._newmark(M, C, K, force, t, ic, alpha, chunk_size):
+            yield output(chunk, np.hstack([u, v]), n)
+
+    @staticmethod
+    def _newmark(M, C, K, F, t, ic=None, alpha=0.0, chunk_size=None):
+        """Integrate M u'' + C u' + K u = F with the HHT-alpha method.
+
+        The HHT-alpha method (Hilber, Hughes and Taylor) satisfies
+
+            M a(n+1) + (1 + alpha) (C v(n+1) + K u(n+1)) - alpha (C v(n) + K u(n))
+            = (1 + alpha) F(n+1) - alpha F(n)
+
+        with the Newmark-beta updates, beta = (1 - alpha)² / 4 and
+        gamma = 1 / 2 - alpha. It is unconditionally stable and second order
+        accurate, and alpha = 0 is the Newmark constant average acceleration
+        method. The iteration matrix M + (1 + alpha) (gamma dt C + beta dt² K) is
+        factorized once with a sparse LU decomposition and reused for all steps
+        with the same time step.
+
+        Parameters
+        ----------
+        M, C, K : array, scipy.sparse matrix
+            Mass, damping and stiffness matrices.
+        F : array
+            Force array with shape (len(t), ndof). Only one row is read at a time.
+        t : array
+            Time array.
+        ic : array, optional
+            Initial displacements and velocities, with length 2 * ndof.
+            Default is zero.
+        alpha : float, optional
+            HHT-alpha parameter, between -1/3 and 0. Default is 0.
+        chunk_size : int, optional
+            Number of time steps yielded at a time. Default is len(t).
+
+        Yields
+        ------
+        chunk : slice
+            Time steps of the chunk.
+        u, v : array
+            Displacements and velocities, with shape (chunk length, ndof).
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> t = np.linspace(0, 0.1, 101)
+        >>> F = np.zeros((101, rotor.ndof))
+        >>> F[:, 12] = 100.0
+        >>> chunk, u, v = next(rotor._newmark(rotor.M(), rotor.C(0), rotor.K(0), F, t))
+        >>> u.shape
+        (101, 28)
+        """
+        if not -1 / 3 <= alpha <= 0:
+            raise ValueError(f"alpha must be between -1/3 and 0. {alpha} is not valid.")
+
+        beta = (1 - alpha) ** 2 / 4
+        gamma = 0.5 - alpha
+
+        M = sp.csc_matrix(M)
+        C = sp.csc_matrix(C)
+        K = sp.csc_matrix(K)
+        t = np.asarray(t, dtype=float)
+        nt = len(t)
+        ndof = M.shape[0]
+        if chunk_size is None:
+            chunk_size = nt
+
+        u_n = np.zeros(ndof)
+        v_n = np.zeros(ndof)
+        if ic is not None:
+            u_n = np.asarray(ic[:ndof], dtype=float)
+            v_n = np.asarray(ic[ndof:], dtype=float)
+
+        F_n = np.asarray(F[0], dtype=float)
+        a = las.splu(M).solve(F_n - C @ v_n - K @ u_n)
+        # restoring forces C v + K u of the current step
+        f = C @ v_n + K @ u_n
+
+        factorizations = {}
+        for start in range(0, nt, chunk_size):
+            stop = min(start + chunk_size, nt)
+            u = np.empty((stop - start, ndof))
+            v = np.empty((stop - start, ndof))
+            for i, n in enumerate(range(start, stop)):
+                if n > 0:
+                    dt = t[n] - t[n - 1]
+                    # linspace steps differ by round-off only
+                    key = round(dt / (t[-1] - t[0]), 10)
+                    if key not in factorizations:
+                        factorizations[key] = las.splu(
+                            (
+                                M + (1 + alpha) * (gamma * dt * C + beta * dt**2 * K)
+                            ).tocsc()
+                        )
+
+                    u_pred = u_n + dt * v_n + dt**2 * (0.5 - beta) * a
+                    v_pred = v_n + dt * (1 - gamma) * a
+                    f_pred = C @ v_pred + K @ u_pred
+
+                    F_next = np.asarray(F[n], dtype=float)
+                    rhs = (1 + alpha) * (F_next - f_pred) - alpha * (F_n - f)
+                    a = factorizations[key].solve(rhs)
+
+                    u_n = u_pred + beta * dt**2 * a
+                    v_n = v_pred + gamma * dt * a
+                    f = C @ v_n + K @ u_n
+                    F_n = F_next
+
+                u[i] = u_n
+                v[i] = v_n
+
+            yield slice(start, stop), u, v
 
     def plot_rotor(self, nodes=1, check_sld=False, length_units="m", **kwargs):
         """Plot a rotor object.
@@ -2045,7 +4308,14 @@ class Rotor(object):
         return fig
 
     @check_units
-    def run_campbell(self, speed_range, frequencies=6, frequency_type="wd"):
+    def run_campbell(
+        self,
+        speed_range,
+        frequencies=6,
+        frequency_type="wd",
+        mode_tracking=False,
+        n_jobs=None,
+    ):
         """Calculate the Campbell diagram.
 
         This function will calculate the damped natural frequencies
@@ -2065,6 +4335,22 @@ class Rotor(object):
             Choose between displaying results related to the undamped natural
             frequencies ("wn") or damped natural frequencies ("wd").
             The default is "wd".
+        mode_tracking : bool, optional
+            If True, the modes found at the first speed are followed along the
+            speed range by continuation (see Rotor._track_modes()), and each column
+            of the results corresponds to the same mode at all speeds, also where
+            modes cross or veer. Each speed is solved with a few inverse iterations
+            starting from the previous modes.
+            If False, the modes are sorted by frequency at each speed.
+            Default is False.
+        n_jobs : int, optional
+            Number of processes used to calculate the speed range, which is split
+            in contiguous chunks. The rotor is sent once to each process. The same
+            arpack start vector is used for each speed, also in a single process,
+            so that the results do not depend on n_jobs.
+            If -1, all the CPUs are used. It can not be used with
+            mode_tracking=True, since the modes are followed speed by speed.
+            Default is None (a single process).
 
         Returns
         -------
@@ -2084,20 +4370,78 @@ class Rotor(object):
         Diagram with damped natural frequencies
         >>> camp = rotor1.run_campbell(speed)
 
+        Diagram with the modes tracked along the speed range
+        >>> camp = rotor1.run_campbell(speed, mode_tracking=True)
+
+        Diagram calculated with two processes
+        >>> camp = rotor1.run_campbell(speed, n_jobs=2)
+
         Plotting Campbell Diagram
         >>> fig = camp.plot()
         """
-        # store in results [speeds(x axis), frequencies[0] or logdec[1] or
-        # whirl[2](y axis), 3]
         self._check_frequency_array(speed_range)
 
+        if mode_tracking:
+            if n_jobs not in (None, 1):
+                raise ValueError(
+                    "mode_tracking follows the modes speed by speed and can not be "
+                    "used with n_jobs."
+                )
+            results = self._campbell(speed_range, frequencies, frequency_type, True)
+        else:
+            # the same arpack start vector is used for all speeds, so that the
+            # results do not depend on how the speed range is split
+            v0 = np.random.default_rng(0).random(2 * self.ndof)
+            results = np.concatenate(
+                self._map_speed_range(
+                    "_campbell",
+                    speed_range,
+                    n_jobs,
+                    frequencies,
+                    frequency_type,
+                    False,
+                    v0,
+                )
+            )
+
+        results = CampbellResults(
+            speed_range=speed_range,
+            wd=results[..., 0],
+            log_dec=results[..., 1],
+            damping_ratio=results[..., 2],
+            whirl_values=results[..., 3],
+        )
+
+        return results
+
+    def _campbell(
+        self,
+        speed_range,
+        frequencies=6,
+        frequency_type="wd",
+        mode_tracking=False,
+        v0=None,
+    ):
+        """Campbell diagram data for a speed range (see Rotor.run_campbell()).
+
+        Returns
+        -------
+        results : array
+            Array with shape (len(speed_range), frequencies, 6) with the natural
+            frequencies, log dec, damping ratio, whirl values, speed and wn.
+        """
+        # store in results [speeds(x axis), frequencies[0] or logdec[1] or
+        # whirl[2](y axis), 3]
         results = np.zeros([len(speed_range), frequencies, 6])
 
-        for i, w in enumerate(speed_range):
-            modal = self.run_modal(speed=w, num_modes=2 * frequencies)
+        if mode_tracking:
+            modal_results = self._track_modes(speed_range, frequencies)
+        else:
+            modal_results = self._modal_sweep(speed_range, 2 * frequencies, v0)
 
-            if frequency_type == "wd":
-                results[i, :, 0] = modal.wd[:frequencies]
+        for i, (w, modal) in enumerate(zip(speed_range, modal_results)):
+            if frequency_type == "wd" or mode_tracking:
+                results[i, :, 0] = getattr(modal, frequency_type)[:frequencies]
                 results[i, :, 1] = modal.log_dec[:frequencies]
                 results[i, :, 2] = modal.damping_ratio[:frequencies]
                 results[i, :, 3] = modal.whirl_values()[:frequencies]
@@ -2111,16 +4455,104 @@ class Rotor(object):
             results[i, :, 4] = w
             results[i, :, 5] = modal.wn[:frequencies]
 
-        results = CampbellResults(
-            speed_range=speed_range,
-            wd=results[..., 0],
-            log_dec=results[..., 1],
-            damping_ratio=results[..., 2],
-            whirl_values=results[..., 3],
-        )
-
         return results
 
+    def _modal_sweep(self, speed_range, num_modes, v0=None):
+        """Run modal analysis for each speed.
+
+        If v0 is None, each speed starts arpack from the modes of the previous one.
+        Otherwise v0 is used as the start vector for all speeds, and the start
+        vector of the rotor is left unchanged.
+        """
+        run_modal = unchecked(self.run_modal)
+        if v0 is None:
+            for speed in speed_range:
+                yield run_modal(speed=speed, num_modes=num_modes)
+            return
+
+        rotor_v0 = self._v0
+        try:
+            for speed in speed_range:
+                self._v0 = v0.copy()
+                yield run_modal(speed=speed, num_modes=num_modes)
+        finally:
+            self._v0 = rotor_v0
+
+    @contextmanager
+    def _process_pool(self, n_jobs=None):
+        """Pool of processes used by Rotor._map_speed_range().
+
+        The rotor is sent once to each process, when the pool is created, so
+        analyses that map several ranges keep one pool for all of them. The pool
+        works on the rotor as it is when the pool is created.
+
+        Parameters
+        ----------
+        n_jobs : int, optional
+            Number of processes. If -1, all the CPUs are used. If None or 1, no
+            pool is created and None is returned.
+
+        Yields
+        ------
+        executor : concurrent.futures.ProcessPoolExecutor, None
+            The pool, which is shut down when the context is exited.
+        """
+        if n_jobs == -1:
+            n_jobs = os.cpu_count()
+        if n_jobs is None or n_jobs <= 1:
+            yield None
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=n_jobs, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            yield executor
+
+    def _map_speed_range(self, method, speed_range, n_jobs=None, *args, executor=None):
+        """Call a method over chunks of a speed range, possibly in parallel.
+
+        The speed range is split in n_jobs contiguous chunks, and the method is
+        called as method(chunk, *args) for each chunk in a pool of processes.
+        The rotor is sent only once to each process, when the pool is created.
+        The pool is created for this call, unless one is passed as executor
+        (see Rotor._process_pool()).
+
+        Parameters
+        ----------
+        method : str
+            Name of the Rotor method to be called.
+        speed_range : array
+            Array with the speed range.
+        n_jobs : int, optional
+            Number of processes. If -1, all the CPUs are used. If None or 1, the
+            method is called once for the whole speed range in this process.
+        args : optional
+            Additional arguments passed to the method.
+        executor : concurrent.futures.ProcessPoolExecutor, optional
+            Pool created with Rotor._process_pool(n_jobs) for this rotor.
+
+        Returns
+        -------
+        results : list
+            List with the results for each chunk, in the speed range order.
+        """
+        if n_jobs == -1:
+            n_jobs = os.cpu_count()
+        if n_jobs is None or n_jobs <= 1 or len(speed_range) < 2:
+            return [getattr(self, method)(speed_range, *args)]
+
+        if executor is None:
+            with self._process_pool(n_jobs) as executor:
+                return self._map_speed_range(
+                    method, speed_range, n_jobs, *args, executor=executor
+                )
+
+        chunks = np.array_split(speed_range, min(n_jobs, len(speed_range)))
+        futures = [
+            executor.submit(_call_worker, method, chunk, *args) for chunk in chunks
+        ]
+        return [future.result() for future in futures]
+
     def run_ucs(
         self,
         stiffness_range=None,
@@ -2128,6 +4560,7 @@ class Rotor(object):
         num_modes=16,
         num=20,
         synchronous=False,
+        n_jobs=None,
         **kwargs,
     ):
         """Run Undamped Critical Speeds analyzes.
@@ -2136,6 +4569,13 @@ class Rotor(object):
         of stiffness values. If the range is not provided, the bearing
         stiffness at rated speed will be used to create a range.
 
+        The rotor (shaft and disks) is assembled only once and the stiffness
+        matrix for a bearing stiffness k is K(k) = K_shaft + k K_bearings, where
+        K_bearings has ones on the x and y dofs of the bearing nodes. For each
+        stiffness, the eigenvalue problem is solved on the sparse pencil, starting
+        arpack from the eigenvectors of the previous stiffness (and, if
+        synchronous, the speed iteration from the previous synchronous speed).
+
         Parameters
         ----------
         stiffness_range : tuple, optional
@@ -2159,6 +4599,11 @@ class Rotor(object):
             If True a synchronous analysis is carried out and the frequency of
             the first forward model will be equal to the speed.
             Default is False.
+        n_jobs : int, optional
+            Number of processes used to calculate the stiffness range, which is
+            split in contiguous chunks (see Rotor.run_freq_response()).
+            If -1, all the CPUs are used.
+            Default is None (a single process).
 
         Returns
         -------
@@ -2181,44 +4626,24 @@ class Rotor(object):
             )
 
         stiffness_log = np.logspace(*stiffness_range, num=num)
-        # for each pair of eigenvalues calculated we have one wn, and we show only
-        # the forward mode in the plots, therefore we have num_modes / 2 / 2
-        rotor_wn = np.zeros((num_modes // 2 // 2, len(stiffness_log)))
 
         bearings_elements = []  # exclude the seals
         for bearing in self.bearing_elements:
             if not isinstance(bearing, SealElement):
                 bearings_elements.append(bearing)
 
-        for i, k in enumerate(stiffness_log):
-            bearings = [BearingElement(b.n, kxx=k, cxx=0) for b in bearings_elements]
-            rotor = self.__class__(self.shaft_elements, self.disk_elements, bearings)
-            speed = 0
-            if synchronous:
-
-                def wn_diff(x):
-                    """Function to evaluate difference between speed and
-                    natural frequency for the first mode."""
-                    modal = rotor.run_modal(speed=x, num_modes=num_modes)
-                    # get first forward mode
-                    if modal.whirl_direction()[0] == "Forward":
-                        wn0 = modal.wn[0]
-                    else:
-                        wn0 = modal.wn[1]
+        # base assembly with the bearing stiffness pattern on the bearings dofs
+        bearings = [BearingElement(b.n, kxx=0, cxx=0) for b in bearings_elements]
+        rotor = self.__class__(self.shaft_elements, self.disk_elements, bearings)
+        bearing_dofs = np.array(
+            [rotor._node_xy_dofs(b.n) for b in bearings_elements], dtype=int
+        ).ravel()
 
-                    return wn0 - x
-
-                speed = newton(wn_diff, 0)
-            modal = rotor.run_modal(speed=speed, num_modes=num_modes)
-
-            # if sync, select only forward modes
-            if synchronous:
-                rotor_wn[:, i] = modal.wn[modal.whirl_direction() == "Forward"]
-            # if not sync, with speed=0 whirl direction can be confusing, with
-            # two close modes being forward or backward, so we select one mode in
-            # each 2 modes.
-            else:
-                rotor_wn[:, i] = modal.wn[::2]
+        rotor_wn = np.hstack(
+            rotor._map_speed_range(
+                "_ucs_wn", stiffness_log, n_jobs, bearing_dofs, num_modes, synchronous
+            )
+        )
 
         bearing0 = bearings_elements[0]
 
@@ -2254,17 +4679,7 @@ class Rotor(object):
         critical_points_modal = []
 
         for k, speed in zip(intersection_points["x"], intersection_points["y"]):
-            # create bearing
-            bearings = [BearingElement(b.n, kxx=k, cxx=0) for b in bearings_elements]
-            # create rotor
-            rotor_critical = Rotor(
-                shaft_elements=self.shaft_elements,
-                disk_elements=self.disk_elements,
-                bearing_elements=bearings,
-            )
-
-            modal_critical = rotor_critical.run_modal(speed=speed)
-
+            modal_critical = rotor._ucs_modal(k, speed, bearing_dofs)
             critical_points_modal.append(modal_critical)
 
         results = UCSResults(
@@ -2279,21 +4694,147 @@ class Rotor(object):
 
         return results
 
-    def run_level1(self, n=5, stiffness_range=None, num=5, **kwargs):
+    def _ucs_modal(
+        self, stiffness, speed, bearing_dofs, num_modes=12, wn_len=None, wn_only=False
+    ):
+        """Modal analysis with an isotropic stiffness added to the bearing dofs.
+
+        The stiffness matrix is K + stiffness * K_bearings, where K_bearings has
+        ones on the diagonal entries of bearing_dofs, and the eigenvalues are
+        calculated on the sparse pencil (see Rotor._eigs_pencil()). The global
+        matrices are cached, so only the pencil is assembled for each call, and
+        arpack starts from the eigenvectors of the previous call.
+
+        Parameters
+        ----------
+        stiffness : float
+            Bearing stiffness (N/m).
+        speed : float
+            Rotor speed (rad/s).
+        bearing_dofs : array
+            Global dofs where the stiffness is added.
+        num_modes : int, optional
+            Number of eigenvalues calculated. Default is 12.
+        wn_len : int, optional
+            Number of modes in the results. Default is num_modes // 2.
+        wn_only : bool, optional
+            If True, only the natural frequencies are returned, without building
+            the mode shapes. Default is False.
+
+        Returns
+        -------
+        results : ross.ModalResults, array
+            Modal results, or the natural frequencies if wn_only is True.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> modal = rotor._ucs_modal(0.0, 0.0, [])
+        >>> np.allclose(modal.wn, rotor.run_modal(speed=0).wn)
+        True
+        """
+        n = self.ndof
+        K_bearings = sp.csr_matrix(
+            (
+                np.full(len(bearing_dofs), float(stiffness)),
+                (bearing_dofs, bearing_dofs),
+            ),
+            shape=(n, n),
+        )
+        K = self.K(speed, sparse=True) + speed * self.Kst(sparse=True) + K_bearings
+        C = self.C(speed, sparse=True) + speed * self.G(sparse=True)
+        I = sp.identity(n, format="csc")
+
+        P = sp.bmat([[None, I], [-K, -C]], format="csc")
+        Q = sp.block_diag([I, self.M(sparse=True)], format="csc")
+
+        evalues, evectors = self._eigs_pencil(P, Q, num_modes)
+        idx = self._index(evalues)
+        if wn_only:
+            return np.absolute(evalues[idx])[: num_modes // 2]
+
+        if wn_len is None:
+            wn_len = num_modes // 2
+
+        return self._modal_results(speed, evalues[idx], evectors[:, idx], wn_len)
+
+    def _ucs_wn(self, stiffness_range, bearing_dofs, num_modes=16, synchronous=False):
+        """Undamped natural frequencies for a bearing stiffness range.
+
+        The stiffness range is swept in order, so that each eigenvalue problem
+        (and, if synchronous, the speed iteration) starts from the solution of
+        the previous stiffness (see Rotor.run_ucs()).
+
+        Returns
+        -------
+        rotor_wn : array
+            Array with shape (num_modes // 4, len(stiffness_range)).
+        """
+        # for each pair of eigenvalues calculated we have one wn, and we show only
+        # the forward mode in the plots, therefore we have num_modes / 2 / 2
+        rotor_wn = np.zeros((num_modes // 2 // 2, len(stiffness_range)))
+
+        speed = 0
+        for i, k in enumerate(stiffness_range):
+            if synchronous:
+
+                def wn_diff(x):
+                    """Function to evaluate difference between speed and
+                    natural frequency for the first mode."""
+                    modal = self._ucs_modal(k, x, bearing_dofs, num_modes, wn_len=2)
+                    # get first forward mode
+                    if modal.whirl_direction()[0] == "Forward":
+                        wn0 = modal.wn[0]
+                    else:
+                        wn0 = modal.wn[1]
+
+                    return wn0 - x
+
+                speed = newton(wn_diff, speed)
+
+            # if sync, select only forward modes
+            if synchronous:
+                modal = self._ucs_modal(k, speed, bearing_dofs, num_modes)
+                rotor_wn[:, i] = modal.wn[modal.whirl_direction() == "Forward"]
+            # if not sync, with speed=0 whirl direction can be confusing, with
+            # two close modes being forward or backward, so we select one mode in
+            # each 2 modes.
+            else:
+                wn = self._ucs_modal(k, speed, bearing_dofs, num_modes, wn_only=True)
+                rotor_wn[:, i] = wn[::2]
+
+        return rotor_wn
+
+    def run_level1(self, n=5, stiffness_range=None, num=5, num_modes=12, **kwargs):
         """Plot level 1 stability analysis.
 
         This method will plot the stability 1 analysis for a
         given stiffness range.
 
+        A cross coupled stiffness Q (kxy = Q, kyx = -Q) is applied at node n and
+        the log dec of the first forward mode is calculated at the rated speed.
+        The cross coupling changes only two entries of the stiffness matrix, so
+        the rotor pencil is factorized once and each value of Q is a rank 2
+        update of it (see _CrossCoupledPencil). The first forward mode is
+        identified with a modal analysis at the first value of Q and then tracked
+        along Q by inverse iteration, starting from the eigenpair of the previous
+        value, which makes dense Q grids cheap. If the log dec changes sign
+        within the range, the cross coupled stiffness Q0 where it is zero is
+        found with brentq().
+
         Parameters
         ----------
         n : int
-            Number of steps in the range.
+            Node where the cross coupled stiffness is applied.
             Default is 5.
         stiffness_range : tuple, optional
             Tuple with (start, end) for stiffness range.
-            This will be used to create an evenly numbers spaced evenly on a log scale
-            to create a better visualization (see np.logspace).
+        num : int, optional
+            Number of cross coupled stiffness values in the range.
+            Default is 5.
+        num_modes : int, optional
+            Number of modes calculated to identify the first forward mode.
+            Default is 12.
         kwargs : optional
             Additional key word arguments can be passed to change the plot layout only
             (e.g. width=1000, height=800, ...).
@@ -2335,35 +4876,77 @@ class Rotor(object):
         if stiffness_range is None:
             if self.rated_w is not None:
                 bearing = self.bearing_elements[0]
-                k = bearing.kxx.interpolated(self.rated_w)
+                k = bearing.kxx_interpolated(self.rated_w)
                 k = int(np.log10(k))
-                stiffness_range = (k - 3, k + 3)
+                stiffness_range = (10.0 ** (k - 3), 10.0 ** (k + 3))
             else:
-                stiffness_range = (6, 11)
+                stiffness_range = (1e6, 1e11)
 
         stiffness = np.linspace(*stiffness_range, num)
-        log_dec = np.zeros(len(stiffness))
+        evalues = np.zeros(len(stiffness), dtype=complex)
 
         # set rotor speed to mcs
         speed = self.rated_w
-        modal = self.run_modal(speed=speed)
+        pencil = _CrossCoupledPencil(self, n, speed)
+
+        def first_forward(Q):
+            w, v = self._eigs_pencil(pencil.update(Q), pencil.Q, num_modes)
+            idx = self._index(w)
+            w, v = w[idx], v[:, idx]
+            modal = self._modal_results(speed, w, v, num_modes // 2)
+            mode = np.flatnonzero(modal.whirl_direction() != "Backward")[0]
+            pencil.factorize(w[mode])
+            return w[mode], v[:, mode]
+
+        evalue, evector = first_forward(stiffness[0])
+
+        # the log dec has the sign of -evalue.real, real parts within the round
+        # off error of undamped modes are not taken as a change of sign
+        def sign(evalue):
+            return np.sign(evalue.real) * (abs(evalue.real) > 1e-8 * abs(evalue))
 
+        bracket = None
         for i, Q in enumerate(stiffness):
-            bearings = [copy(b) for b in self.bearing_elements]
-            cross_coupling = BearingElement(n=n, kxx=0, cxx=0, kxy=Q, kyx=-Q)
-            bearings.append(cross_coupling)
+            previous = evalue, evector
+            evalue, evector = pencil.track(Q, evalue, evector)
+            if pencil.backward(evector):
+                # the tracked mode became backward, start from the first forward
+                evalue, evector = pencil.track(Q, *first_forward(Q))
+            evalues[i] = evalue
+            if bracket is None and i > 0 and sign(previous[0]) * sign(evalue) < 0:
+                bracket = i - 1, previous
 
-            rotor = self.__class__(self.shaft_elements, self.disk_elements, bearings)
+        log_dec = -2 * np.pi * evalues.real / np.abs(evalues.imag)
 
-            modal = rotor.run_modal(speed=speed)
-            non_backward = modal.whirl_direction() != "Backward"
-            log_dec[i] = modal.log_dec[non_backward][0]
+        # cross coupled stiffness where the log dec is zero
+        q0 = None
+        if bracket is not None:
+            i, pair = bracket
+            pair = list(pair)
+
+            def real_part(Q):
+                pair[:] = pencil.track(Q, *pair)
+                return pair[0].real
 
-        results = Level1Results(stiffness, log_dec)
+            q0 = brentq(real_part, stiffness[i], stiffness[i + 1], rtol=1e-10)
+
+        results = Level1Results(stiffness, log_dec, q0)
 
         return results
 
-    def run_time_response(self, speed, F, t):
+    def run_time_response(
+        self,
+        speed,
+        F,
+        t,
+        reduced=None,
+        method="lsim",
+        alpha=-0.05,
+        out=None,
+        probe=None,
+        chunk_size=None,
+        file=None,
+    ):
         """Calculate the time response.
 
         This function will take a rotor object and calculate its time response
@@ -2383,6 +4966,43 @@ class Rotor(object):
             Each column corresponds to a dof and each row to a time.
         t : array
             Time array.
+        reduced : ross.ReducedModel, optional
+            Reduced model of this rotor (see ross.guyan(), ross.modal_reduction()
+            and ross.craig_bampton()). If given, the reduced system is integrated
+            and the response is expanded to the rotor dofs.
+            Default is None.
+        method : str, optional
+            Integration method, "lsim", "newmark" or "hht" (see
+            Rotor.time_response()). The implicit methods work on M, C + speed G
+            and K + speed Kst directly, reusing one sparse factorization for all
+            time steps, so they are suited to long simulations of large models.
+            Default is "lsim".
+        alpha : float, optional
+            HHT-alpha parameter, between -1/3 and 0. Only used if method="hht".
+            Default is -0.05.
+        out : int, list, optional
+            Global degrees of freedom for which the displacements are stored.
+            Default is None (all dofs, or only the probe dofs if probe is given).
+        probe : list, optional
+            List with tuples (node, orientation angle[, tag]), as used by
+            TimeResponseResults.plot_1d(). The x and y dofs of the probe nodes are
+            stored.
+            Default is None.
+        chunk_size : int, optional
+            Number of time steps calculated and stored at a time. Only one chunk
+            of the response is kept in memory while it is calculated.
+            Default is None (all time steps at once).
+        file : str, pathlib.Path, optional
+            .npy file where the stored displacements are written as they are
+            calculated, as a memory map with one row per stored dof. The results
+            read it lazily, so that simulations with millions of time steps run
+            in bounded memory. The file can be opened again with
+            np.load(file, mmap_mode="r").
+            Default is None (the response is kept in memory).
+
+        If out, probe, chunk_size or file are given, only the displacements of the
+        stored dofs are kept (results.yout has one column per stored dof and
+        results.xout is None).
 
         Returns
         -------
@@ -2405,18 +5025,83 @@ class Rotor(object):
         >>> dof = 13
         >>> response.yout[:, dof] # doctest: +ELLIPSIS
         array([ 0.00000000e+00,  1.86686693e-07,  8.39130663e-07, ...
+        >>> # implicit integration with the Newmark method:
+        >>> response = rotor.run_time_response(speed, F, t, method="newmark")
+        >>> response.yout.shape
+        (1000, 28)
         >>> # plot time response for a given probe:
         >>> fig1 = response.plot_1d(probe=[probe1])
         >>> # plot orbit response - plotting 2D nodal orbit:
         >>> fig2 = response.plot_2d(node=node)
         >>> # plot orbit response - plotting 3D orbits - full rotor model:
         >>> fig3 = response.plot_3d()
+
+        Storing only the probe dofs in a file, in chunks of 200 time steps:
+        >>> from tempfile import tempdir
+        >>> from pathlib import Path
+        >>> file = Path(tempdir) / "time_response.npy"
+        >>> response = rotor.run_time_response(
+        ...     speed, F, t, method="newmark", probe=[probe1], chunk_size=200, file=file
+        ... )
+        >>> response.dofs
+        array([12, 13])
+        >>> response.yout.shape
+        (1000, 2)
+        >>> fig1 = response.plot_1d(probe=[probe1])
         """
-        t_, yout, xout = self.time_response(speed, F, t)
+        if out is None and probe is None and chunk_size is None and file is None:
+            t_, yout, xout = self.time_response(
+                speed, F, t, reduced=reduced, method=method, alpha=alpha
+            )
+            return TimeResponseResults(self, t, yout, xout)
 
-        results = TimeResponseResults(self, t, yout, xout)
+        if method not in ("lsim", "newmark", "hht"):
+            raise ValueError(
+                f"method can be 'lsim', 'newmark' or 'hht'. {method} is not valid."
+            )
 
-        return results
+        if out is None and probe is None:
+            dofs = np.arange(self.ndof)
+        else:
+            dofs = set() if out is None else set(np.atleast_1d(out).tolist())
+            for p in [] if probe is None else probe:
+                dofs.update(self._node_xy_dofs(p[0]))
+            dofs = np.array(sorted(dofs), dtype=int)
+
+        # one row per dof, so that reading the response of a dof is contiguous
+        shape = (len(dofs), len(t))
+        if file is None:
+            store = np.empty(shape)
+        else:
+            store = np.lib.format.open_memmap(file, mode="w+", shape=shape)
+
+        for chunk, u, v in self._time_response_chunks(
+            speed, F, t, None, reduced, method, alpha, chunk_size, dofs
+        ):
+            store[:, chunk] = u.T
+
+        if file is not None:
+            store.flush()
+
+        return TimeResponseResults(self, t, store.T, None, dofs=dofs)
+
+    def _node_xy_dofs(self, node):
+        """Global x and y dofs of a node, including link nodes.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> rotor._node_xy_dofs(3)
+        (12, 13)
+        """
+        fix_dof = 0
+        if node in self.link_nodes:
+            fix_dof = (node - self.nodes[-1] - 1) * self.number_dof // 2
+
+        dofx = self.number_dof * node - fix_dof
+        dofy = self.number_dof * node + 1 - fix_dof
+
+        return dofx, dofy
 
     def run_misalignment(self, coupling="flex", **kwargs):
         """Run an analyzes with misalignment.
@@ -2505,9 +5190,9 @@ class Rotor(object):
         """
 
         if coupling == "flex" or coupling == None:
-            defect = MisalignmentFlex(**kwargs)
+            defect = defects.MisalignmentFlex(**kwargs)
         elif coupling == "rigid":
-            defect = MisalignmentRigid(**kwargs)
+            defect = defects.MisalignmentRigid(**kwargs)
         else:
             raise Exception("Check the choosed coupling type!")
 
@@ -2562,7 +5247,7 @@ class Rotor(object):
         >>> # fig.show()
         """
 
-        defect = Rubbing(**kwargs)
+        defect = defects.Rubbing(**kwargs)
         defect.run(self)
         return defect
 
@@ -2604,7 +5289,7 @@ class Rotor(object):
         >>> fig = response.plot_dfft(probe=[probe1, probe2], range_freq=[0, 100], yaxis_type="log")
         >>> # fig.show()
         """
-        defect = Crack(**kwargs)
+        defect = defects.Crack(**kwargs)
         defect.run(self)
         return defect
 
@@ -2726,18 +5411,36 @@ class Rotor(object):
             **parameters,
         )
 
-    def run_static(self):
+    def run_static(self, force=None, gravity=True):
         """Run static analysis.
 
         Static analysis calculates free-body diagram, deformed shaft, shearing
         force diagram and bending moment diagram.
 
+        The bearings are taken as rigid supports in the x and y directions, which
+        are eliminated from the shaft stiffness matrix (a bearing linked to
+        another shaft node ties the displacements of both nodes). The reduced
+        stiffness matrix is factorized only once, with a banded Cholesky
+        factorization (see Rotor._static_solve()), and all the load cases are
+        solved with the same factorization.
+
         Available plotting methods:
             .plot_deformation()
             .plot_bending_moment()
             .plot_shearing_force()
             .plot_free_body_diagram()
 
+        Parameters
+        ----------
+        force : array, optional
+            Additional static forces applied to the rotor (e.g. misalignment
+            loads), with shape (ndof,) for one load case or (n_cases, ndof) for
+            several load cases. Forces on link nodes are not taken into account.
+            Default is None.
+        gravity : bool, optional
+            If True, the weight of the shaft and disks is added to every load
+            case. Default is True.
+
         Attributes
         ----------
         shaft_weight: float
@@ -2757,11 +5460,14 @@ class Rotor(object):
         Bm: array
             Bending moment vector
 
+        The attributes refer to the last load case.
+
         Returns
         -------
-        results : ross.StaticResults
+        results : ross.StaticResults, list
             For more information on attributes and methods available see:
-            :py:class:`ross.StaticResults`
+            :py:class:`ross.StaticResults`. If force has several load cases,
+            a list with the results of each case is returned.
 
         Raises
         ------
@@ -2778,6 +5484,13 @@ class Rotor(object):
         >>> rotor.bearing_forces_tag # doctest: +ELLIPSIS
         {'Bearing 0': 432...
 
+        Several load cases, with an additional vertical force at node 3
+        >>> force = np.zeros((2, rotor.ndof))
+        >>> force[1, 13] = -100.0
+        >>> static_cases = rotor.run_static(force)
+        >>> [round(sum(static.bearing_forces.values())) for static in static_cases]
+        [865, 965]
+
         Plotting static deformation
         >>> fig = static.plot_deformation()
 
@@ -2793,40 +5506,155 @@ class Rotor(object):
         if not len(self.df_bearings):
             raise ValueError("Rotor has no bearings")
 
-        aux_brg = []
-        aux_brg_1 = []
+        # shaft nodes dofs (the dofs of link nodes come after them)
+        n = self.number_dof * len(self.nodes)
+        K = self._cached_matrix(
+            "K_shaft",
+            lambda sparse: self._assemble(
+                [elm.K() for elm in self.shaft_elements], group="shaft", sparse=sparse
+            ),
+            sparse=True,
+        )[:n, :n]
+        M = self._cached_matrix(
+            "M_shaft",
+            lambda sparse: self._assemble(
+                [elm.M() for elm in self.shaft_elements], group="shaft", sparse=sparse
+            ),
+            sparse=True,
+        )[:n, :n]
+
+        # gravity aceleration vector
+        g = -9.8065 if gravity else 0.0
+        gravity_vector = np.zeros(n)
+        gravity_vector[1 :: self.number_dof] = g
+        weight = M @ gravity_vector
+        for disk in self.disk_elements:
+            weight[self.number_dof * disk.n + 1] += disk.m * g
+
+        single_case = force is None or np.ndim(force) == 1
+        force = np.zeros((1, n)) if force is None else np.atleast_2d(force)[:, :n]
+        loads = weight + force
+
+        # calculates u, for [K]*(u) = (F)
+        displacements = self._static_solve(K, loads.T).T
+        nodal_forces = (K @ displacements.T).T
+
+        results = [
+            self._static_results(displacement, nodal_force, load, g)
+            for displacement, nodal_force, load in zip(
+                displacements, nodal_forces, loads
+            )
+        ]
+
+        return results[0] if single_case else results
+
+    def _static_solve(self, K, F):
+        """Solve the static problem with the bearings as rigid supports.
+
+        The x and y dofs of the bearing nodes are eliminated from the problem
+        (and the axial and torsional dofs, for 6 dof models), or merged with the
+        dofs of the linked node if the bearing is linked to another shaft node.
+        The reduced matrix is reordered with reverse Cuthill-McKee to minimize its
+        bandwidth and factorized with a banded Cholesky factorization. If the
+        stiffness matrix is not symmetric, a sparse LU factorization is used.
+
+        Parameters
+        ----------
+        K : scipy.sparse matrix
+            Stiffness matrix of the shaft nodes dofs.
+        F : array
+            Load array with shape (K.shape[0], n_cases).
+
+        Returns
+        -------
+        displacement : array
+            Displacement array with the same shape as F.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> F = np.zeros((rotor.ndof, 1))
+        >>> F[13] = -100.0
+        >>> u = rotor._static_solve(rotor.K(0, sparse=True), F)
+        >>> u[[0, 1, 24, 25], 0]
+        array([0., 0., 0., 0.])
+        """
+        n = K.shape[0]
+        nd = self.number_dof
+        directions = [0, 1] if nd == 4 else [0, 1, 2, 5]
+
+        # each dof is eliminated (merged with the ground) or merged with the
+        # dof of a linked node
+        ground = n
+        parent = np.arange(n + 1)
+
+        def find(dof):
+            while parent[dof] != dof:
+                dof = parent[dof]
+            return dof
+
         for elm in self.bearing_elements:
-            if not isinstance(elm, SealElement):
-                if elm.n not in self.nodes:
-                    pass
-                elif elm.n_link in self.nodes:
-                    aux_brg.append(
-                        BearingElement(n=elm.n, n_link=elm.n_link, kxx=1e20, cxx=0)
-                    )
-                    aux_brg_1.append(
-                        BearingElement(n=elm.n, n_link=elm.n_link, kxx=0, cxx=0)
-                    )
-                else:
-                    aux_brg.append(BearingElement(n=elm.n, kxx=1e20, cxx=0))
-                    aux_brg_1.append(BearingElement(n=elm.n, kxx=0, cxx=0))
+            if isinstance(elm, SealElement) or elm.n not in self.nodes:
+                continue
+            linked = elm.n_link is not None and elm.n_link in self.nodes
+            for k in directions:
+                a = find(nd * elm.n + k)
+                b = find(nd * elm.n_link + k if linked else ground)
+                if a == ground:
+                    a, b = b, a
+                parent[a] = b
+
+        roots = np.array([find(dof) for dof in range(n)])
+        free = roots != ground
+        index = np.unique(roots[free], return_inverse=True)[1]
+        T = sp.csr_matrix(
+            (np.ones(free.sum()), (np.flatnonzero(free), index)),
+            shape=(n, index.max() + 1),
+        )
 
-        aux_rotor = Rotor(self.shaft_elements, self.disk_elements, aux_brg)
-        aux_rotor_1 = Rotor(self.shaft_elements, self.disk_elements, aux_brg_1)
+        K_r = (T.T @ K @ T).tocsr()
+        F_r = T.T @ F
 
-        aux_K = aux_rotor.K(0)
+        if abs(K_r - K_r.T).max() > 1e-10 * abs(K_r).max():
+            return T @ las.splu(K_r.tocsc()).solve(F_r)
 
-        # gravity aceleration vector
-        g = -9.8065
-        gravity = np.zeros(len(aux_rotor.M()))
-        gravity[1 :: self.number_dof] = g
-        weight = aux_rotor.M() @ gravity
+        perm = reverse_cuthill_mckee(K_r, symmetric_mode=True)
+        K_r = K_r[perm][:, perm].tocoo()
+        upper = K_r.row <= K_r.col
+        rows, cols, data = K_r.row[upper], K_r.col[upper], K_r.data[upper]
+        u = np.max(cols - rows)
+        ab = np.zeros((u + 1, K_r.shape[0]))
+        ab[u + rows - cols, cols] = data
 
-        # calculates u, for [K]*(u) = (F)
-        displacement = (la.solve(aux_K, weight)).flatten()
-        displacement_y = displacement[1 :: self.number_dof]
+        try:
+            cb = la.cholesky_banded(ab)
+        except la.LinAlgError:
+            raise ValueError("The rotor is not statically supported by the bearings.")
+
+        displacement = np.empty_like(F_r)
+        displacement[perm] = la.cho_solve_banded((cb, False), F_r[perm])
+
+        return T @ displacement
+
+    def _static_results(self, displacement, nodal_forces, load, g):
+        """Free-body, shearing force and bending moment diagrams of a load case.
+
+        Parameters
+        ----------
+        displacement : array
+            Displacement of the shaft nodes dofs.
+        nodal_forces : array
+            Internal forces of the shaft, K @ displacement.
+        load : array
+            Applied loads (weight and additional forces).
+        g : float
+            Gravity acceleration in the y direction.
 
-        # calculate forces
-        nodal_forces = aux_rotor_1.K(0) @ displacement
+        Returns
+        -------
+        results : ross.StaticResults
+        """
+        displacement_y = displacement[1 :: self.number_dof]
 
         bearing_force_nodal = {}
         disk_force_nodal = {}
@@ -2848,21 +5676,22 @@ class Rotor(object):
             nodal_shaft_weight[sh.n_l] += g * sh.m * (1 - sh.beam_cg / sh.L)
 
         elm_weight[-1, 1] = 0
-        aux_nodal_forces = nodal_forces[: self.number_dof * (self.nodes[-1] + 1)]
 
         reaction_forces = (
-            nodal_forces[1 :: self.number_dof] - weight[1 :: self.number_dof]
+            nodal_forces[1 :: self.number_dof] - load[1 :: self.number_dof]
         )
 
-        for bearing in aux_rotor.bearing_elements:
+        for bearing in self.bearing_elements:
+            if isinstance(bearing, SealElement) or bearing.n not in self.nodes:
+                continue
             bearing_force_nodal[f"node_{bearing.n:d}"] = reaction_forces[bearing.n]
             bearing_force_tag[f"{bearing.tag}"] = reaction_forces[bearing.n]
 
-        for disk in aux_rotor.disk_elements:
+        for disk in self.disk_elements:
             disk_force_nodal[f"node_{disk.n:d}"] = -disk.m * g
             disk_force_tag[f"{disk.tag}"] = -disk.m * g
 
-        nodal_forces_y = aux_nodal_forces[1 :: self.number_dof] - nodal_shaft_weight
+        nodal_forces_y = nodal_forces[1 :: self.number_dof] - nodal_shaft_weight
         elm_forces_y = np.zeros_like(elm_weight)
         elm_forces_y[:, 0] = nodal_forces_y[:-1]
         elm_forces_y[-1, 1] = -nodal_forces_y[-1]
@@ -3484,6 +6313,7 @@ class CoAxialRotor(Rotor):
         self.Ip = Ip_sh + Ip_dsk
 
         self._v0 = None  # used to call eigs
+        self._modal_cache = None  # see Rotor.enable_modal_cache()
 
         # number of dofs
         self.ndof = int(
@@ -3579,6 +6409,8 @@ class CoAxialRotor(Rotor):
                 df.loc[df.tag == elm.tag].index[0], "dof_global_index"
             ] = elm.dof_global_index
 
+        self._set_assembly_indexes()
+
         # define positions for disks
         for disk in disk_elements:
             z_pos = nodes_pos[disk.n]
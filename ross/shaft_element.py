@@ -8,13 +8,14 @@ import os
 from pathlib import Path
 
 import numpy as np
-import toml
-from plotly import graph_objects as go
 
 from ross.element import Element
 from ross.materials import Material, steel
 from ross.units import Q_, check_units
-from ross.utils import read_table_file
+from ross.utils import LazyModule, lazy_plotly, read_table_file
+
+go = lazy_plotly("plotly.graph_objects")
+toml = LazyModule("toml")
 
 __all__ = ["ShaftElement", "ShaftElement6DoF"]
 
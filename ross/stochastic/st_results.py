@@ -14,9 +14,11 @@ from plotly import express as px
 from plotly import graph_objects as go
 from plotly.subplots import make_subplots
 
-from ross.plotly_theme import tableau_colors
+from ross.plotly_theme import set_ross_template, tableau_colors
 from ross.units import Q_
 
+set_ross_template()
+
 # set Plotly palette of colors
 colors1 = px.colors.qualitative.Dark24
 colors2 = px.colors.qualitative.Light24
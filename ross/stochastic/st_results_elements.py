@@ -10,7 +10,9 @@ from plotly import io as pio
 from plotly.subplots import make_subplots
 from scipy.stats import gaussian_kde
 
-from ross.plotly_theme import tableau_colors
+from ross.plotly_theme import set_ross_template, tableau_colors
+
+set_ross_template()
 
 
 def plot_histogram(
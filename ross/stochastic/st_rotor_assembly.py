@@ -572,10 +572,12 @@ class ST_Rotor(object):
                 num_modes,
                 num_points,
                 rtol,
+                inp=inp,
+                out=out,
             )
-            freq_resp[:, i] = results.freq_resp[inp, out, :]
-            velc_resp[:, i] = results.velc_resp[inp, out, :]
-            accl_resp[:, i] = results.accl_resp[inp, out, :]
+            freq_resp[:, i] = results.freq_resp[0, 0, :]
+            velc_resp[:, i] = results.velc_resp[0, 0, :]
+            accl_resp[:, i] = results.accl_resp[0, 0, :]
 
         results = ST_FrequencyResponseResults(
             speed_range, freq_resp, velc_resp, accl_resp
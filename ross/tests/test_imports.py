@@ -0,0 +1,34 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import ross as rs
+
+
+def test_lazy_imports():
+    code = (
+        "import sys, ross\n"
+        "rotor = ross.rotor_example()\n"
+        "rotor.run_modal(speed=0)\n"
+        "lazy = ['pandas', 'plotly', 'pint', 'scipy.signal', 'ross.defects']\n"
+        "print(','.join(m for m in lazy if m in sys.modules))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(rs.__file__).parent.parent,
+    ).stdout
+    assert output.strip() == ""
+
+
+def test_lazy_attributes():
+    from ross.defects import Crack
+
+    assert rs.Crack is Crack
+    assert "Crack" in dir(rs)
+    with pytest.raises(AttributeError):
+        rs.not_a_ross_attribute
@@ -0,0 +1,197 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from scipy import linalg as la
+
+from ross.bearing_seal_element import BearingElement
+from ross.disk_element import DiskElement
+from ross.materials import steel
+from ross.reduction import ReducedModel, craig_bampton, guyan, modal_reduction
+from ross.rotor_assembly import Rotor, rotor_example
+from ross.shaft_element import ShaftElement
+
+
+@pytest.fixture
+def rotor():
+    # damped rotor with 12 shaft elements, 2 disks and 2 bearings
+    shaft_elem = [
+        ShaftElement(0.125, 0, 0.05, material=steel, gyroscopic=True) for _ in range(12)
+    ]
+    disk0 = DiskElement.from_geometry(4, steel, 0.07, 0.05, 0.28)
+    disk1 = DiskElement.from_geometry(8, steel, 0.07, 0.05, 0.35)
+    bearing0 = BearingElement(0, kxx=1e6, kyy=1.2e6, cxx=1e3, cyy=1e3)
+    bearing1 = BearingElement(12, kxx=1e6, kyy=1.2e6, cxx=1e3, cyy=1e3)
+
+    return Rotor(shaft_elem, [disk0, disk1], [bearing0, bearing1])
+
+
+@pytest.fixture
+def reduced_models(rotor):
+    return [
+        guyan(rotor, nodes=[0, 2, 4, 6, 8, 10, 12]),
+        modal_reduction(rotor, num_modes=12, nodes=[6]),
+        craig_bampton(rotor, num_modes=12),
+    ]
+
+
+def test_guyan(rotor):
+    reduced = guyan(rotor)
+
+    assert isinstance(reduced, ReducedModel)
+    assert reduced.method == "guyan"
+    assert_allclose(
+        reduced.dofs, [0, 1, 2, 3, 16, 17, 18, 19, 32, 33, 34, 35, 48, 49, 50, 51]
+    )
+    assert reduced.ndof == 16
+    assert reduced.T.shape == (rotor.ndof, 16)
+    # master dofs are kept as physical coordinates
+    assert_allclose(reduced.T[reduced.dofs], np.eye(16))
+    # static condensation is exact for static loads on the master dofs
+    F = np.zeros(rotor.ndof)
+    F[[16, 33]] = 100.0
+    x = np.linalg.solve(rotor.K(0), F)
+    x_r = np.linalg.solve(reduced.K(0), reduced.T.T @ F)
+    assert_allclose(reduced.expand(x_r), x, rtol=1e-8, atol=1e-14)
+
+
+def test_modal_reduction(rotor):
+    reduced = modal_reduction(rotor, num_modes=8, nodes=[6])
+
+    assert reduced.method == "modal"
+    assert reduced.dofs is None
+    assert reduced.ndof == 12
+    assert_allclose(reduced.M(), np.eye(12), atol=1e-10)
+
+    without_correction = modal_reduction(rotor, num_modes=8, static_correction=False)
+    assert without_correction.ndof == 8
+
+    # the static correction makes the static response to loads at node 6 exact
+    F = np.zeros(rotor.ndof)
+    F[24] = 100.0
+    x = np.linalg.solve(rotor.K(0), F)
+    x_r = np.linalg.solve(reduced.K(0), reduced.T.T @ F)
+    assert_allclose(reduced.expand(x_r), x, rtol=1e-6, atol=1e-14)
+
+
+def test_modal_reduction_cross_coupled(rotor):
+    bearings = [
+        BearingElement(n, kxx=1e6, kyy=1.2e6, kxy=2e5, kyx=-2e5, cxx=1e3)
+        for n in (0, 12)
+    ]
+    rotor = Rotor(rotor.shaft_elements, rotor.disk_elements, bearings)
+    reduced = modal_reduction(rotor, num_modes=8, static_correction=False)
+
+    # the basis is made of the modes of the symmetric part of the stiffness
+    K = rotor.K(0)
+    K_sym = (K + K.T) / 2
+    w = la.eigh(K_sym, rotor.M(), eigvals_only=True)[:8]
+    assert_allclose(reduced.T.T @ K_sym @ reduced.T, np.diag(w), atol=1e-6 * w[-1])
+    assert_allclose(reduced.M(), np.eye(8), atol=1e-10)
+
+
+def test_craig_bampton(rotor):
+    reduced = craig_bampton(rotor, num_modes=10)
+
+    assert reduced.method == "craig_bampton"
+    assert_allclose(reduced.dofs, [0, 1, 2, 3, 48, 49, 50, 51])
+    assert reduced.ndof == 18
+    assert_allclose(reduced.T[reduced.dofs, :8], np.eye(8))
+    assert_allclose(reduced.T[reduced.dofs, 8:], 0)
+
+
+def test_reduced_modal(rotor, reduced_models):
+    modal = rotor.run_modal(speed=200.0)
+
+    for reduced in reduced_models:
+        reduced_modal = rotor.run_modal(speed=200.0, reduced=reduced)
+        assert reduced_modal.evectors.shape == (2 * rotor.ndof, 12)
+        assert_allclose(reduced_modal.wd[:4], modal.wd[:4], rtol=1e-3)
+        assert_allclose(
+            reduced_modal.damping_ratio[:4], modal.damping_ratio[:4], rtol=1e-2
+        )
+        # expanded mode shapes
+        for mode in range(4):
+            u = reduced_modal.evectors[: rotor.ndof, mode]
+            v = modal.evectors[: rotor.ndof, mode]
+            assert rotor._mac(u, v) > 0.999
+
+    with pytest.raises(ValueError):
+        rotor.run_modal(speed=0, reduced=reduced_models[0], num_modes=100)
+
+
+def test_reduced_freq_response(rotor, reduced_models):
+    speed_range = np.linspace(0, 500, 31)
+    inp = [24, 25]
+    out = [16, 24, 32]
+    response = rotor.run_freq_response(
+        speed_range=speed_range, method="direct", inp=inp, out=out
+    )
+
+    for reduced in reduced_models:
+        reduced_response = rotor.run_freq_response(
+            speed_range=speed_range, inp=inp, out=out, reduced=reduced
+        )
+        assert reduced_response.freq_resp.shape == (2, 3, 31)
+        assert_allclose(
+            reduced_response.freq_resp,
+            response.freq_resp,
+            rtol=0,
+            atol=1e-2 * abs(response.freq_resp).max(),
+        )
+
+    with pytest.raises(ValueError):
+        rotor.run_freq_response(
+            speed_range=speed_range, modes=[0, 1], reduced=reduced_models[0]
+        )
+
+
+def test_reduced_unbalance_response(rotor, reduced_models):
+    frequency = np.linspace(0, 300, 31)
+    response = rotor.run_unbalance_response(
+        node=6,
+        unbalance_magnitude=0.001,
+        unbalance_phase=0.0,
+        frequency=frequency,
+        method="direct",
+    )
+
+    for reduced in reduced_models:
+        reduced_response = rotor.run_unbalance_response(
+            node=6,
+            unbalance_magnitude=0.001,
+            unbalance_phase=0.0,
+            frequency=frequency,
+            reduced=reduced,
+        )
+        assert reduced_response.forced_resp.shape == (rotor.ndof, 31)
+        assert_allclose(
+            reduced_response.forced_resp,
+            response.forced_resp,
+            rtol=0,
+            atol=1e-2 * abs(response.forced_resp).max(),
+        )
+
+
+def test_reduced_time_response(rotor, reduced_models):
+    size = 500
+    t = np.linspace(0, 1, size)
+    F = np.zeros((size, rotor.ndof))
+    F[:, 24] = 10 * np.cos(50 * t)
+    F[:, 25] = 10 * np.sin(50 * t)
+    response = rotor.run_time_response(200.0, F, t)
+
+    for reduced in reduced_models:
+        reduced_response = rotor.run_time_response(200.0, F, t, reduced=reduced)
+        assert reduced_response.yout.shape == (size, rotor.ndof)
+        assert reduced_response.xout.shape == (size, 2 * rotor.ndof)
+        assert_allclose(
+            reduced_response.yout,
+            response.yout,
+            rtol=0,
+            atol=2e-2 * abs(response.yout).max(),
+        )
+
+
+def test_reduced_model_from_other_rotor(reduced_models):
+    with pytest.raises(ValueError):
+        rotor_example().run_modal(speed=0, reduced=reduced_models[0])
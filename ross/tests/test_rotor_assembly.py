@@ -1,15 +1,19 @@
 import pickle
+import warnings
+from copy import deepcopy
 from pathlib import Path
 from tempfile import tempdir
 
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose, assert_almost_equal, assert_equal
+from scipy.sparse.linalg import LinearOperator
 
 from ross.bearing_seal_element import *
 from ross.disk_element import *
 from ross.materials import Material, steel
 from ross.point_mass import *
+from ross.results import FrequencyResponseResults, TimeResponseResults
 from ross.rotor_assembly import *
 from ross.shaft_element import *
 from ross.units import Q_
@@ -461,6 +465,65 @@ def test_campbell(rotor4):
     assert_allclose(camp_calculated, camp_desired)
 
 
+def test_campbell_mode_tracking():
+    rotor = rotor_example()
+    speed = np.linspace(0, 4000, 41)
+    camp = rotor.run_campbell(speed, mode_tracking=True)
+    camp_sorted = rotor.run_campbell(speed)
+
+    for i in [0, 20, 40]:
+        evalues = rotor.run_modal(speed[i], sparse=False).evalues
+        wd = evalues.imag[evalues.imag > 0]
+        for w in camp.wd[i]:
+            assert np.min(np.abs(wd - w)) < 1e-6 * w
+
+    # the first forward mode crosses the second backward mode around 2600 rad/s
+    assert np.all(np.diff(camp.wd[:, 3]) > 0)
+    assert np.all(np.diff(camp.wd[:, 4]) < 0)
+    assert not np.all(np.diff(camp_sorted.wd[:, 3]) > 0)
+    assert_allclose(np.sort(camp.wd[:, :5], axis=1), camp_sorted.wd[:, :5])
+
+
+def test_parallel_speed_range(rotor4):
+    speed = np.linspace(0, 500, 11)
+    rotor = deepcopy(rotor4)
+    camp = rotor4.run_campbell(speed)
+    # the start vector of the rotor is not changed by run_campbell
+    rotor._v0 = None
+    camp_parallel = rotor.run_campbell(speed, n_jobs=3)
+    assert rotor._v0 is None
+    assert_equal(camp_parallel.wd, camp.wd)
+    assert_equal(camp_parallel.log_dec, camp.log_dec)
+    assert_equal(camp_parallel.whirl_values, camp.whirl_values)
+
+    # isotropic bearings, with degenerate forward and backward pairs
+    rotor = rotor_example()
+    speed = np.linspace(0, 1000, 31)
+    camp = rotor.run_campbell(speed)
+    camp_parallel = rotor.run_campbell(speed, n_jobs=2)
+    assert_equal(camp_parallel.wd, camp.wd)
+    assert_equal(camp_parallel.whirl_values, camp.whirl_values)
+
+    response = rotor4.run_freq_response(speed)
+    response_parallel = rotor4.run_freq_response(speed, n_jobs=-1)
+    assert_equal(response_parallel.freq_resp, response.freq_resp)
+    assert_equal(response_parallel.velc_resp, response.velc_resp)
+    assert_equal(response_parallel.accl_resp, response.accl_resp)
+
+    # the adaptive range keeps one pool for all the refinement passes. The
+    # frequency range comes from a modal analysis with a random arpack start, so
+    # the points agree only to round-off, which is amplified at the peaks.
+    response = rotor4.run_freq_response(adaptive=True, inp=9, out=9, method="direct")
+    response_parallel = rotor4.run_freq_response(
+        adaptive=True, inp=9, out=9, method="direct", n_jobs=2
+    )
+    assert_allclose(response_parallel.speed_range, response.speed_range)
+    assert_allclose(response_parallel.freq_resp, response.freq_resp, rtol=1e-5)
+
+    with pytest.raises(ValueError):
+        rotor4.run_campbell(speed, mode_tracking=True, n_jobs=2)
+
+
 @pytest.mark.skip(reason="Needs investigation. It fails depending on system.")
 def test_freq_response(rotor4):
     magdb_exp = np.array(
@@ -601,18 +664,185 @@ def test_freq_response_w_force(rotor4):
     assert_allclose(mag[:4, :4], mag_exp_2_unb)
 
 
+def test_freq_response_direct(rotor4, rotor_6dof):
+    # the 6 dof rotor has rigid body modes at zero frequency
+    for rotor, omega in [
+        (rotor_6dof, np.linspace(150.0, 450.0, 3)),
+        (rotor4, np.linspace(0.0, 450.0, 4)),
+    ]:
+        modal = rotor.run_freq_response(speed_range=omega)
+        direct = rotor.run_freq_response(speed_range=omega, method="direct")
+        scale = np.abs(modal.freq_resp).max()
+        assert_allclose(direct.freq_resp, modal.freq_resp, atol=1e-7 * scale)
+        assert_allclose(direct.accl_resp, -(omega**2) * direct.freq_resp)
+
+    H = rotor4._freq_response_direct(omega, rows=[0, 8, 20], cols=[8, 9])
+    assert H.shape == (3, 2, 4)
+    assert_allclose(H, direct.freq_resp[np.ix_([0, 8, 20], [8, 9])])
+
+    with pytest.raises(ValueError):
+        rotor4.run_freq_response(speed_range=omega, modes=[0, 1], method="direct")
+
+
+def test_freq_response_subset(rotor4, tmp_path):
+    omega = np.linspace(0.0, 450.0, 4)
+    full = rotor4.run_freq_response(speed_range=omega)
+    assert_allclose(full.velc_resp, 1j * omega * full.freq_resp)
+    assert_allclose(full.accl_resp, -(omega**2) * full.freq_resp)
+
+    for method in ["modal", "direct"]:
+        sub = rotor4.run_freq_response(
+            speed_range=omega, method=method, inp=[8, 9], out=8
+        )
+        assert sub.freq_resp.shape == (2, 1, 4)
+        scale = np.abs(full.freq_resp).max()
+        assert_allclose(
+            sub.freq_resp, full.freq_resp[[8, 9]][:, [8]], atol=1e-7 * scale
+        )
+        assert_allclose(
+            sub._response(9, 8, "accl"), full.accl_resp[9, 8], atol=1e-7 * scale
+        )
+
+    fig = sub.plot(inp=9, out=8, amplitude_units="m/s/N")
+    assert_allclose(fig.data[0]["y"], np.abs(full.velc_resp[9, 8]), rtol=1e-6)
+    with pytest.raises(ValueError):
+        sub.plot(inp=8, out=9)
+
+    file = tmp_path / "freq_resp.toml"
+    sub.save(file)
+    loaded = FrequencyResponseResults.load(file)
+    assert loaded.freq_resp.shape == (2, 1, 4)
+    assert_equal(loaded.inp, [8, 9])
+    assert_equal(loaded.out, [8])
+
+
+def test_freq_response_fixed_speed(rotor4):
+    speed = 300.0
+    omega = np.linspace(0.0, 600.0, 7)
+    modal = rotor4.run_freq_response(speed_range=omega, speed=speed)
+    direct = rotor4.run_freq_response(speed_range=omega, speed=speed, method="direct")
+    scale = np.abs(modal.freq_resp).max()
+    assert modal.freq_resp.shape == (rotor4.ndof, rotor4.ndof, 7)
+    assert_allclose(direct.freq_resp, modal.freq_resp, atol=1e-7 * scale)
+
+    # reference with the inverse of the right eigenvectors
+    lti = rotor4._lti(speed)
+    evalues, psi = rotor4._eigen(speed, sparse=False)
+    psi_inv = np.linalg.inv(psi)
+    for i, w in enumerate(omega):
+        H = lti.C @ psi @ np.diag(1 / (1j * w - evalues)) @ psi_inv @ lti.B
+        assert_allclose(modal.freq_resp[..., i], H, atol=1e-9 * scale)
+
+    # at the rotor speed the result is the usual transfer matrix
+    H = rotor4._transfer_function(speed, [speed], modes=[0, 1], rows=[8], cols=[8])
+    assert_allclose(H[..., 0], rotor4.transfer_matrix(speed, modes=[0, 1])[[8]][:, [8]])
+
+
+def test_modal_cache(rotor3):
+    assert rotor3.modal_cache_info() is None
+
+    rotor3.enable_modal_cache(maxsize=2)
+    modal = rotor3.run_modal(speed=0)
+    cached = rotor3.run_modal(speed=0.0)
+    assert cached.evectors is modal.evectors
+    # callers get their own copy of the results
+    cached.speed = 1.0
+    assert rotor3.run_modal(speed=0).speed == 0
+    assert rotor3.run_modal(speed=0, sparse=False).evectors is not modal.evectors
+    rotor3.run_modal(speed=100.0)
+    info = rotor3.modal_cache_info()
+    assert (info["hits"], info["misses"], info["size"]) == (2, 3, 2)
+    assert rotor3.run_modal(speed=0).evectors is not modal.evectors  # evicted
+
+    # modifying an element discards the cache
+    modal = rotor3.run_modal(speed=0)
+    rotor3.bearing_elements[0].tag = "changed"
+    assert rotor3.run_modal(speed=0).evectors is not modal.evectors
+
+    rotor3.enable_modal_cache(maxsize=100, max_bytes=modal.evectors.nbytes * 4)
+    for speed in [0, 100, 200, 300, 400, 0, 400]:
+        rotor3.run_modal(speed)
+    info = rotor3.modal_cache_info()
+    assert info["hits"] == 1  # speed 0 is discarded because of the memory limit
+    assert info["size"] < 5
+    assert info["nbytes"] <= info["max_bytes"]
+
+    rotor3.disable_modal_cache()
+    assert rotor3.modal_cache_info() is None
+
+
 def test_mesh_convergence(rotor3):
-    rotor3.convergence(n_eigval=0, err_max=1e-08)
-    modal3 = rotor3.run_modal(speed=0)
+    results = rotor3.convergence(n_eigval=0, err_max=1e-08, richardson=False)
+    refined = results.rotors[-1]
+    # only the sparse matrices are cached, the dense ones are built from them
+    assert ("M", True) in refined._matrix_cache
+    assert ("M", False) not in refined._matrix_cache
+    assert_equal(refined.M(), refined.M(sparse=True).toarray())
+    modal = refined.run_modal(speed=0)
+
+    # the rotor is not modified
+    assert len(rotor3.shaft_elements) == 6
+    assert rotor3.disk_elements[0].n == 2
+    assert rotor3.disk_elements[0].n_l == 2
+    # the disks of the refined rotor are moved to the new node numbers
+    assert list(refined.df_disks.n) == [32, 64]
+    assert list(refined.df_disks.n_l) == [32, 64]
+
+    assert_allclose(results.el_num, [12, 24, 48, 96])
+    assert_allclose(len(refined.shaft_elements), 96, atol=0)
+    assert_allclose(modal.wn[0], 82.653037335, atol=1e-02)
+    assert_allclose(refined.shaft_elements[0].L, 0.015625, atol=1e-06)
+    assert_allclose(refined.disk_elements[0].n, 32, atol=0)
+    assert_allclose(refined.disk_elements[1].n, 64, atol=0)
+    assert_allclose(refined.bearing_elements[0].n, 0, atol=0)
+    assert_allclose(refined.bearing_elements[1].n, 96, atol=0)
+    assert results.error_arr[-1] <= 1e-08 * 100
+
+    # shared element matrices give the same matrices as a new assembly
+    new_rotor = Rotor(
+        refined.shaft_elements, refined.disk_elements, refined.bearing_elements
+    )
+    assert_allclose(refined.M(), new_rotor.M())
+    assert_allclose(refined.K(0), new_rotor.K(0))
+    assert_allclose(refined.G(), new_rotor.G())
+
+    # richardson extrapolation stops before the finest level
+    extrapolated = rotor3.convergence(n_eigval=0, err_max=1e-08)
+    assert_allclose(extrapolated.el_num, [12, 24, 48])
+    assert_allclose(extrapolated.extrapolated, modal.wn[0], rtol=1e-8)
+    assert_allclose(extrapolated.eigv_arr, results.eigv_arr[:3], rtol=1e-8)
+
+    parallel = rotor3.convergence(n_eigval=0, err_max=1e-08, n_jobs=2)
+    assert_allclose(parallel.el_num, extrapolated.el_num)
+    assert_allclose(parallel.eigv_arr, extrapolated.eigv_arr, rtol=1e-8)
+
+
+def test_adaptive_refinement():
+    shaft_elem = [
+        ShaftElement(L, 0, o_d, material=steel)
+        for L, o_d in [(0.1, 0.05), (0.3, 0.05), (0.1, 0.08), (0.2, 0.05), (0.4, 0.05)]
+    ]
+    disk0 = DiskElement.from_geometry(2, steel, 0.07, 0.05, 0.28)
+    disk1 = DiskElement.from_geometry(4, steel, 0.07, 0.05, 0.35)
+    bearings = [BearingElement(n, kxx=1e7, kyy=8e6, cxx=2e3) for n in (0, 5)]
+    rotor = Rotor(shaft_elem, [disk0, disk1], bearings)
+
+    modes = [0, 2, 4]
+    reference = rotor._refined_rotor(16).run_modal(speed=0).wn[modes]
+
+    refined = rotor.adaptive_refinement(modes=modes, rtol=1e-4)
+    error = abs(refined.run_modal(speed=0).wn[modes] / reference - 1)
+    assert len(rotor.shaft_elements) == 5
+    assert np.all(error < 1e-4)
 
-    assert_allclose(len(rotor3.shaft_elements), 96, atol=0)
-    assert_allclose(modal3.wn[0], 82.653037335, atol=1e-02)
-    assert_allclose(rotor3.shaft_elements[0].L, 0.015625, atol=1e-06)
-    assert_allclose(rotor3.disk_elements[0].n, 32, atol=0)
-    assert_allclose(rotor3.disk_elements[1].n, 64, atol=0)
-    assert_allclose(rotor3.bearing_elements[0].n, 0, atol=0)
-    assert_allclose(rotor3.bearing_elements[1].n, 96, atol=0)
-    assert rotor3.error_arr[-1] <= 1e-08 * 100
+    # uniform refinement needs more dofs for the same accuracy
+    uniform = rotor._refined_rotor(2)
+    uniform_error = abs(uniform.run_modal(speed=0).wn[modes] / reference - 1)
+    assert np.max(uniform_error) > 1e-4
+    assert refined.ndof < uniform.ndof
+
+    with pytest.warns(UserWarning):
+        rotor.adaptive_refinement(modes=modes, rtol=1e-8, max_iter=1)
 
 
 def test_static_analysis_rotor3(rotor3):
@@ -623,13 +853,13 @@ def test_static_analysis_rotor3(rotor3):
 
     expected_deformation = np.array(
         [
-            -4.942745e-18,
+            0.0,
             -4.512491e-04,
             -7.884209e-04,
             -9.181142e-04,
             -8.085602e-04,
             -4.687889e-04,
-            -5.561716e-18,
+            0.0,
         ]
     )
 
@@ -952,13 +1182,13 @@ def test_static_bearing_with_disks(rotor3):
     assert_almost_equal(static.bearing_forces["node_0"], 504.08103349786404)
     expected_deformation = np.array(
         [
-            -5.04081033e-18,
+            0.0,
             -4.51249080e-04,
             -7.88420862e-04,
             -9.18114186e-04,
             -8.08560214e-04,
             -4.68788883e-04,
-            -5.56171636e-18,
+            0.0,
         ]
     )
 
@@ -969,6 +1199,45 @@ def test_static_bearing_with_disks(rotor3):
     assert_allclose(fig.data[1]["y"], expected_deformation)
 
 
+def test_static_load_cases(rotor3):
+    force = np.zeros((3, rotor3.ndof))
+    force[1, 13] = -100.0
+    force[2, 13] = -100.0
+    force[2, 17] = 50.0
+
+    static = rotor3.run_static()
+    static_cases = rotor3.run_static(force)
+    assert len(static_cases) == 3
+    assert_allclose(static_cases[0].deformation, static.deformation)
+
+    # superposition of the weight and the additional forces
+    static_force = rotor3.run_static(force[1], gravity=False)
+    assert_allclose(
+        static_cases[1].deformation,
+        static.deformation + static_force.deformation,
+        rtol=1e-10,
+    )
+    assert_allclose(sum(static_force.bearing_forces.values()), 100.0)
+    assert_allclose(
+        sum(static_cases[2].bearing_forces.values()), rotor3.m * 9.8065 + 50
+    )
+
+
+def test_static_linked_bearing(rotor3):
+    # bearing linking two shaft nodes, the displacements of both nodes are equal
+    bearings = rotor3.bearing_elements + [
+        BearingElement(3, n_link=5, kxx=1e6, cxx=0, tag="Link")
+    ]
+    rotor = Rotor(rotor3.shaft_elements, rotor3.disk_elements, bearings)
+    static = rotor.run_static()
+
+    assert static.deformation[3] == static.deformation[5]
+    assert static.deformation[0] == static.deformation[6] == 0
+    # the linked bearing force is internal
+    reactions = static.bearing_forces["node_0"] + static.bearing_forces["node_6"]
+    assert_allclose(reactions, rotor.m * 9.8065)
+
+
 def test_run_critical_speed(rotor5, rotor6):
     results5 = rotor5.run_critical_speed(num_modes=12, rtol=0.005)
     results6 = rotor6.run_critical_speed(num_modes=12, rtol=0.005)
@@ -1029,6 +1298,18 @@ def test_run_critical_speed(rotor5, rotor6):
     assert_almost_equal(results6.log_dec, log_dec6, decimal=4)
     assert_almost_equal(results6.damping_ratio, damping_ratio6, decimal=4)
 
+    assert results5.iterations.shape == (6, 2)
+    assert (results5.iterations > 0).all()
+    # wn and wd iterations of the undamped rotor share the eigenvalue solutions
+    assert results5.eigen_solves < results5.iterations.sum() + 6
+    assert 0 < results5.eigen_time <= results5.total_time
+
+    results6 = rotor6.run_critical_speed(speed_range=(100, 240))
+    assert_almost_equal(results6._wd, wd6[2:], decimal=4)
+    assert_almost_equal(results6.log_dec, log_dec6[2:], decimal=4)
+    assert_almost_equal(results6.damping_ratio, damping_ratio6[2:], decimal=4)
+    assert results6.iterations.shape == (len(wd6) - 2, 2)
+
 
 @pytest.fixture
 def coaxrotor():
@@ -1443,6 +1724,116 @@ def test_unbalance(rotor7):
     assert_allclose(data["Probe 1 - Node 0"], phase_expected, rtol=1e-4)
 
 
+def test_unbalance_direct(rotor7, rotor_6dof):
+    frequency = np.array([50.0, 100.0, 400.0])
+    for rotor in [rotor7, rotor_6dof]:
+        args = ([0, 3], [1.0, 0.5], [0.0, np.pi / 3], frequency)
+        modal = rotor.run_unbalance_response(*args)
+        direct = rotor.run_unbalance_response(*args, method="direct")
+        scale = np.abs(modal.forced_resp).max()
+        assert_allclose(direct.forced_resp, modal.forced_resp, atol=1e-7 * scale)
+        assert_allclose(direct.accl_resp, modal.accl_resp, atol=1e-7 * scale * 400**2)
+
+    force = rotor7._unbalance_force(3, 0.5, np.pi / 3, frequency)
+    assert_allclose(force[13], -0.5j * np.exp(1j * np.pi / 3) * frequency**2)
+    with pytest.raises(ValueError):
+        rotor7.run_forced_response(force, frequency, modes=[0, 1], method="direct")
+
+
+def test_adaptive_frequency_range(rotor7):
+    adaptive = rotor7.run_unbalance_response(
+        2, 1.0, 0.0, adaptive=True, method="direct"
+    )
+    w = adaptive.speed_range
+    assert len(w) < 500
+    assert np.all(np.diff(w) > 0)
+
+    dense = rotor7.run_unbalance_response(
+        2, 1.0, 0.0, np.linspace(0, w[-1], 5001), method="direct"
+    )
+    peak = np.abs(dense.forced_resp[9]).max()
+    assert_allclose(np.abs(adaptive.forced_resp[9]).max(), peak, rtol=1e-2)
+    # responses calculated while refining are the same as for a fixed range
+    fixed = rotor7.run_unbalance_response(2, 1.0, 0.0, w, method="direct")
+    assert_allclose(fixed.forced_resp, adaptive.forced_resp, atol=1e-6 * peak)
+
+    frf = rotor7.run_freq_response(adaptive=True, inp=9, out=9, method="direct")
+    assert len(frf.speed_range) < 500
+    assert frf.freq_resp.shape == (1, 1, len(frf.speed_range))
+
+
+def test_time_response_implicit(rotor7):
+    size = 4000
+    t = np.linspace(0, 1, size)
+    F = np.zeros((size, rotor7.ndof))
+    F[:, 8] = 10 * np.sin(50 * t) ** 2
+    F[:, 9] = 10 * np.sin(50 * t) * np.sin(30 * t)
+    # initial displacement from a static load on the disk
+    load = np.zeros(rotor7.ndof)
+    load[8] = 100.0
+    ic = np.concatenate([np.linalg.solve(rotor7.K(0), load), np.zeros(rotor7.ndof)])
+
+    t_, yout, xout = rotor7.time_response(200.0, F, t, ic=ic)
+    peak = abs(yout).max()
+    for method in ["newmark", "hht"]:
+        response = rotor7.run_time_response(200.0, F, t, method=method)
+        assert response.yout.shape == (size, rotor7.ndof)
+        assert response.xout.shape == (size, 2 * rotor7.ndof)
+        _, yout_implicit, xout_implicit = rotor7.time_response(
+            200.0, F, t, ic=ic, method=method
+        )
+        assert_allclose(yout_implicit, yout, rtol=0, atol=5e-3 * peak)
+        assert_allclose(xout_implicit[:, : rotor7.ndof], yout_implicit)
+
+    with pytest.raises(ValueError):
+        rotor7.run_time_response(200.0, F, t, method="euler")
+    with pytest.raises(ValueError):
+        rotor7.run_time_response(200.0, F, t, method="hht", alpha=-0.5)
+
+
+def test_time_response_storage(rotor7, tmp_path):
+    size = 500
+    t = np.linspace(0, 0.5, size)
+    F = np.zeros((size, rotor7.ndof))
+    F[:, 8] = 10 * np.sin(50 * t) ** 2
+    probe = [(2, 0), (4, np.pi / 2)]
+
+    for method in ["lsim", "newmark"]:
+        full = rotor7.run_time_response(200.0, F, t, method=method)
+        file = tmp_path / f"{method}.npy"
+        response = rotor7.run_time_response(
+            200.0, F, t, method=method, out=1, probe=probe, chunk_size=64, file=file
+        )
+        assert_equal(response.dofs, [1, 8, 9, 16, 17])
+        assert response.xout is None
+        assert isinstance(response.yout, np.memmap)
+        assert_allclose(
+            response.yout, full.yout[:, response.dofs], atol=1e-9 * abs(full.yout).max()
+        )
+        assert_allclose(np.load(file, mmap_mode="r"), response.yout.T)
+
+        fig = response.plot_1d(probe=probe)
+        expected = full.plot_1d(probe=probe)
+        assert_allclose(fig.data[1].y, expected.data[1].y, atol=1e-12)
+        fig = response.plot_3d()
+        assert len(fig.data) == 3
+        with pytest.raises(ValueError):
+            response.plot_2d(node=3)
+
+        # results with stored dofs are saved without xout
+        file = tmp_path / f"{method}.toml"
+        response.save(file)
+        loaded = TimeResponseResults.load(file)
+        assert loaded.xout is None
+        assert_equal(loaded.dofs, response.dofs)
+        assert_allclose(loaded.yout, response.yout)
+
+    full = rotor7.run_time_response(200.0, F, t)
+    response = rotor7.run_time_response(200.0, F, t, chunk_size=100)
+    assert_equal(response.dofs, np.arange(rotor7.ndof))
+    assert_allclose(response.yout, full.yout, atol=1e-9 * abs(full.yout).max())
+
+
 def test_deflected_shape(rotor7):
     # change to asymmetric stiffness to it is easier to get the major axis at the same place
     bearing0 = BearingElement(0, kxx=1e6, kyy=2e6, cxx=1e3, cyy=1e3)
@@ -1688,6 +2079,170 @@ def test_modal_6dof(rotor_6dof):
     assert_almost_equal(modal.wd[:6], wd, decimal=2)
 
 
+def test_sparse_matrices(rotor3, rotor_6dof):
+    for rotor in [rotor3, rotor_6dof]:
+        assert_allclose(rotor.M(sparse=True).toarray(), rotor.M())
+        assert_allclose(rotor.K(100, sparse=True).toarray(), rotor.K(100))
+        assert_allclose(rotor.C(100, sparse=True).toarray(), rotor.C(100))
+        assert_allclose(rotor.G(sparse=True).toarray(), rotor.G())
+        assert_allclose(rotor.Kst(sparse=True).toarray(), rotor.Kst())
+
+    # the mass matrix is banded, so most of it is not stored
+    assert rotor3.M(sparse=True).nnz < 0.5 * rotor3.ndof**2
+
+    A = rotor3.A(speed=100, sparse=True)
+    A_dense = rotor3.A(speed=100)
+    # A is kept in factored form, M^-1 K and M^-1 C are never formed
+    assert isinstance(A, LinearOperator)
+    x = np.random.default_rng(0).random(2 * rotor3.ndof)
+    assert_allclose(A @ x, A_dense @ x, rtol=1e-8, atol=1e-8 * abs(A_dense @ x).max())
+    assert_allclose(A.solve(A_dense @ x), x, rtol=1e-6)
+
+    evalues, _ = rotor3._eigen(speed=100, A=A)
+    evalues_dense, _ = rotor3._eigen(speed=100)
+    assert_allclose(evalues, evalues_dense, rtol=1e-6)
+
+    lti = rotor3._lti(speed=100, sparse=True)
+    lti_dense = rotor3._lti(speed=100)
+    assert_allclose(lti.B, lti_dense.B, atol=1e-6 * abs(lti_dense.B).max())
+
+
+def test_batch_matrices(rotor3, rotor_6dof):
+    frequency = np.linspace(0, 500, 7)
+    for rotor in [rotor3, rotor_6dof]:
+        K = rotor.K(frequency)
+        C = rotor.C(frequency)
+        K_sparse = rotor.K(frequency, sparse=True)
+        assert K.shape == (7, rotor.ndof, rotor.ndof)
+        for i, f in enumerate(frequency):
+            assert_allclose(K[i], rotor.K(f))
+            assert_allclose(C[i], rotor.C(f))
+            assert_allclose(K_sparse[i].toarray(), rotor.K(f))
+
+    bearing = BearingElement(
+        n=0,
+        kxx=[1e6, 2e6],
+        kyy=[0.8e6, 1e6],
+        kxy=[1e3, 2e3],
+        cxx=[1e3, 2e3],
+        frequency=[0, 100],
+        n_link=1,
+    )
+    K = bearing.K(frequency)
+    assert K.shape == (7, 4, 4)
+    for i, f in enumerate(frequency):
+        assert_allclose(K[i], bearing.K(f))
+
+
+def test_lazy_dataframes(rotor3):
+    rotor = Rotor(rotor3.shaft_elements, rotor3.disk_elements, rotor3.bearing_elements)
+    assert "df" not in rotor.__dict__
+    assert_allclose(rotor.nodes_pos, rotor3.nodes_pos)
+    assert_allclose(rotor.nodes_o_d, [0.05] * 7)
+    assert rotor.shaft_elements_length == [0.25] * 6
+
+    assert list(rotor.df_shaft["nodes_pos_l"]) == rotor.nodes_pos[:-1]
+    assert "df" in rotor.__dict__
+    df_disks = rotor.df[rotor.df.type == "DiskElement"]
+    assert list(df_disks["nodes_pos_l"]) == [0.5, 1.0]
+
+    with pytest.raises(AttributeError):
+        rotor.df_missing
+
+    # a bearing that is not linked to the shaft fails at construction
+    bearings = [
+        BearingElement(0, n_link=7, kxx=1e6, cxx=0, tag="b0"),
+        BearingElement(6, kxx=1e6, cxx=0, tag="b6"),
+        BearingElement(7, kxx=1e6, cxx=0, tag="b7"),
+        BearingElement(8, kxx=1e6, cxx=0, tag="b8"),
+    ]
+    point_masses = [PointMass(7, m=1.0), PointMass(8, m=1.0)]
+    with pytest.raises(ValueError, match="not connected to the rotor"):
+        Rotor(rotor3.shaft_elements, [], bearings, point_masses)
+
+
+def test_matrix_cache(rotor3):
+    rotor = deepcopy(rotor3)
+    M = rotor.M()
+    K = rotor.K(0)
+
+    # cached matrices are returned as copies
+    rotor.M()[0, 0] = 0
+    assert_allclose(rotor.M(), M)
+
+    # changing an element invalidates the cache
+    disk = rotor.disk_elements[0]
+    disk.m = 2 * disk.m
+    M_new = rotor.M()
+    dof = disk.dof_global_index["x_2"]
+    assert_allclose(M_new[dof, dof] - M[dof, dof], disk.m / 2)
+
+    # frequency dependent elements are assembled on every call
+    bearing = rotor.bearing_elements[0]
+    bearing.kxx_interpolated = lambda frequency: 2e6
+    dof = bearing.dof_global_index["x_0"]
+    assert_allclose(rotor.K(0)[dof, dof] - K[dof, dof], 2e6 - 1e6)
+
+    # untracked changes are picked up after clearing the cache
+    shaft = rotor.shaft_elements[0]
+    M_shaft = rotor.M()
+    shaft.material.rho = 2 * shaft.material.rho
+    assert_allclose(rotor.M(), M_shaft)
+    rotor.clear_cache()
+    assert not np.allclose(rotor.M(), M_shaft)
+
+
+def test_modal_pencil(rotor3, rotor_6dof):
+    for rotor, speed in [(rotor3, 0), (rotor3, 500), (rotor_6dof, 250)]:
+        modal = rotor.run_modal(speed, sparse=False)
+        modal_pencil = rotor.run_modal(speed, pencil=True)
+        assert_allclose(
+            modal_pencil.evalues[:6], modal.evalues[:6], rtol=1e-6, atol=1e-3
+        )
+        assert_allclose(modal_pencil.wn, modal.wn[:6], rtol=1e-6, atol=1e-3)
+        # log dec is not meaningful for the rigid body modes of the 6 dof rotor
+        flexible = modal.wn[:6] > 1
+        assert_allclose(
+            modal_pencil.log_dec[flexible], modal.log_dec[:6][flexible], atol=1e-6
+        )
+
+        # eigenvectors of the pencil are eigenvectors of A
+        A = rotor.A(speed)
+        for lam, v in zip(modal_pencil.evalues, modal_pencil.evectors.T):
+            residual = np.linalg.norm(A @ v - lam * v)
+            assert residual < 1e-10 * np.linalg.norm(A) * np.linalg.norm(v)
+
+
+def test_modal_freq_band(rotor3, rotor_6dof):
+    for rotor, speed in [(rotor3, 0), (rotor3, 500), (rotor_6dof, 250)]:
+        evalues = rotor.run_modal(speed, sparse=False).evalues
+        wd = np.sort(evalues.imag[evalues.imag > 0])
+        for band in [(50, 1500), (200, 5000), (1000, 2000)]:
+            for num_modes in [4, 12]:
+                modal_band = rotor.run_modal(speed, num_modes=num_modes, freq_band=band)
+                expected = wd[(wd >= band[0]) & (wd <= band[1])]
+                assert_allclose(modal_band.wd, expected, rtol=1e-6)
+                assert len(modal_band.evalues) == 2 * len(expected)
+
+    modal = rotor3.run_modal(
+        Q_(0, "RPM"), freq_band=Q_((5000, 10000), "RPM"), num_modes=6
+    )
+    assert np.all((modal.wd >= Q_(5000, "RPM").to("rad/s").m) & (modal.wd <= 1048))
+
+    # heavily damped modes in the band, the coverage is not guaranteed
+    bearings = [BearingElement(n, kxx=1e6, kyy=8e5, cxx=1e3) for n in (0, 6)]
+    rotor = Rotor(rotor3.shaft_elements, rotor3.disk_elements, bearings)
+    evalues = rotor.run_modal(0, sparse=False).evalues
+    wd = np.sort(evalues.imag[(evalues.imag >= 200) & (evalues.imag <= 800)])
+    with pytest.warns(UserWarning, match="Heavily damped modes"):
+        modal_band = rotor.run_modal(0, num_modes=4, freq_band=(200, 800))
+    assert_allclose(modal_band.wd, wd, rtol=1e-6)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        modal_band = rotor.run_modal(0, num_modes=12, freq_band=(200, 800))
+    assert_allclose(modal_band.wd, wd, rtol=1e-6)
+
+
 @pytest.fixture
 def rotor8():
     #  Rotor with damping
@@ -1790,6 +2345,60 @@ def test_ucs_rotor9(rotor9):
     assert_allclose(fig.data[0]["x"], expected_x)
 
 
+def test_ucs_parallel(rotor8):
+    ucs_results = rotor8.run_ucs()
+    ucs_parallel = rotor8.run_ucs(n_jobs=2)
+    assert_allclose(ucs_parallel.wn, ucs_results.wn)
+    assert_allclose(
+        ucs_parallel.intersection_points["x"], ucs_results.intersection_points["x"]
+    )
+
+
+def test_ucs_synchronous(rotor7):
+    ucs_results = rotor7.run_ucs(stiffness_range=(6, 8), num=5, synchronous=True)
+
+    # first forward natural frequency equal to the speed
+    for k, wn in zip(ucs_results.stiffness_log, ucs_results.wn[0]):
+        bearings = [BearingElement(n, kxx=k, cxx=0) for n in (0, 6)]
+        rotor = Rotor(rotor7.shaft_elements, rotor7.disk_elements, bearings)
+        modal = rotor.run_modal(speed=wn)
+        forward = modal.wn[modal.whirl_direction() == "Forward"]
+        assert_allclose(forward[0], wn, rtol=1e-6)
+
+
+def test_level1():
+    shaft_elem = [
+        ShaftElement(0.125, 0, 0.05, material=steel, gyroscopic=True) for _ in range(12)
+    ]
+    disk0 = DiskElement.from_geometry(4, steel, 0.07, 0.05, 0.28)
+    disk1 = DiskElement.from_geometry(8, steel, 0.07, 0.05, 0.35)
+    bearings = [
+        BearingElement(n, kxx=1e6, kyy=1.2e6, cxx=1e3, cyy=1e3) for n in (0, 12)
+    ]
+    rotor = Rotor(shaft_elem, [disk0, disk1], bearings, rated_w=300.0)
+
+    level1 = rotor.run_level1(n=6, stiffness_range=(0, 2e5), num=9)
+
+    def first_forward_log_dec(Q):
+        cross_coupling = BearingElement(n=6, kxx=0, cxx=0, kxy=Q, kyx=-Q)
+        rotor_q = Rotor(shaft_elem, [disk0, disk1], bearings + [cross_coupling])
+        modal = rotor_q.run_modal(speed=300.0)
+        return modal.log_dec[modal.whirl_direction() != "Backward"][0]
+
+    expected = [first_forward_log_dec(Q) for Q in level1.stiffness_range]
+    assert_allclose(level1.log_dec, expected, rtol=1e-6)
+    assert 2.5e4 < level1.q0 < 5e4
+    assert_allclose(first_forward_log_dec(level1.q0), 0, atol=1e-8)
+
+    # dense grid with the same threshold
+    dense = rotor.run_level1(n=6, stiffness_range=(0, 2e5), num=401)
+    assert_allclose(dense.q0, level1.q0, rtol=1e-8)
+
+    # no change of sign within the range
+    level1 = rotor.run_level1(n=6, stiffness_range=(0, 1e4), num=5)
+    assert level1.q0 is None
+
+
 def test_pickle(rotor8):
     rotor8_pickled = pickle.loads(pickle.dumps(rotor8))
     assert rotor8 == rotor8_pickled
@@ -1,10 +1,11 @@
 import pickle
 from collections import namedtuple
 
+import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
-from ross.units import Q_, check_units
+from ross.units import Q_, check_units, unchecked
 
 
 def test_new_units_loaded():
@@ -225,3 +226,24 @@ def test_unit_Q_conversion(auxiliary_function):
     results_dict = {k: v for k, v in zip(arguments.keys(), results)}
     for arg, actual in results_dict.items():
         assert_allclose(actual, arguments[arg].expected_converted_value)
+
+
+def test_units_fast_path():
+    @check_units
+    def func(speed, L=None, name=None):
+        return speed, L, name
+
+    array = np.array([1.0, 2.0])
+    speed, L, name = func(array, L=0.5, name="shaft")
+    assert speed is array
+    assert L == 0.5
+    assert name == "shaft"
+
+    # lists are still converted to arrays and quantities to the base unit
+    speed, L, _ = func([1, 2], L=Q_(1, "inch"))
+    assert_allclose(speed, [1, 2])
+    assert isinstance(speed, np.ndarray)
+    assert_allclose(L, 0.0254)
+
+    # undecorated entry point
+    assert unchecked(func)(Q_(1, "RPM"))[0] == Q_(1, "RPM")
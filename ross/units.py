@@ -1,24 +1,79 @@
 """This module deals with units conversion in the ROSS library."""
 import inspect
 import warnings
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 
-import pint
+import numpy as np
+
+from ross.utils import LazyModule
+
+pint = LazyModule("pint")
 
 new_units_path = Path(__file__).parent / "new_units.txt"
-ureg = pint.get_application_registry()
-if isinstance(ureg.get(), pint.registry.LazyRegistry):
-    ureg = pint.UnitRegistry()
-    ureg.load_definitions(str(new_units_path))
-    # set ureg to make pickle possible
-    pint.set_application_registry(ureg)
 
-Q_ = ureg.Quantity
 
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore")
-    pint.Quantity([])
+@lru_cache(maxsize=None)
+def get_unit_registry():
+    """Return the pint unit registry used by ross.
+
+    pint and the registry definitions take a considerable time to load, so the
+    registry is only created the first time a quantity is needed.
+
+    Returns
+    -------
+    ureg : pint.UnitRegistry
+        Unit registry with the units defined in new_units.txt.
+    """
+    ureg = pint.get_application_registry()
+    if isinstance(ureg.get(), pint.registry.LazyRegistry):
+        ureg = pint.UnitRegistry()
+        ureg.load_definitions(str(new_units_path))
+        # set ureg to make pickle possible
+        pint.set_application_registry(ureg)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        pint.Quantity([])
+
+    return ureg
+
+
+class _QuantityType(type):
+    """Forward the use of Q_ to the Quantity class of the unit registry."""
+
+    def __call__(cls, *args, **kwargs):
+        return get_unit_registry().Quantity(*args, **kwargs)
+
+    def __instancecheck__(cls, instance):
+        return isinstance(instance, get_unit_registry().Quantity)
+
+    def __getattr__(cls, name):
+        return getattr(get_unit_registry().Quantity, name)
+
+
+class Q_(metaclass=_QuantityType):
+    """Quantity of the ross unit registry.
+
+    Calling Q_ returns a pint.Quantity created with the registry returned by
+    get_unit_registry().
+
+    Examples
+    --------
+    >>> speed = Q_(1000, "RPM")
+    >>> speed.to("rad/s").m # doctest: +ELLIPSIS
+    104.71...
+    >>> isinstance(speed, Q_)
+    True
+    """
+
+
+def __getattr__(name):
+    if name == "ureg":
+        return get_unit_registry()
+
+    raise AttributeError(f"module 'ross.units' has no attribute '{name}'")
+
 
 __all__ = ["Q_", "check_units"]
 
@@ -38,6 +93,7 @@ units = {
     "o_d": "meter",
     "speed": "radian/second",
     "frequency": "radian/second",
+    "freq_band": "radian/second",
     "m": "kg",
     "mx": "kg",
     "my": "kg",
@@ -110,51 +166,96 @@ def check_units(func):
     0.0127
     """
 
+    args_units = [_arg_unit(arg_name) for arg_name in inspect.getfullargspec(func)[0]]
+
     @wraps(func)
     def inner(*args, **kwargs):
-        base_unit_args = []
-        args_names = inspect.getfullargspec(func)[0]
-
-        for arg_name, arg_value in zip(args_names, args):
-            names = arg_name.split("_")
-            if arg_name not in names:
-                names.append(arg_name)
-            for name in names:
-                if name in units and arg_value is not None:
-                    # For now, we only return the magnitude for the converted Quantity
-                    # If pint is fully adopted by ross in the future, and we have all Quantities
-                    # using it, we could remove this, which would allows us to use pint in its full capability
-                    try:
-                        base_unit_args.append(arg_value.to(units[name]).m)
-                    except AttributeError:
-                        try:
-                            base_unit_args.append(Q_(arg_value, units[name]).m)
-                        except TypeError:
-                            # Handle erros that we get with bool for example
-                            base_unit_args.append(arg_value)
-                    break
-            else:
-                base_unit_args.append(arg_value)
-
-        base_unit_kwargs = {}
-        for k, v in kwargs.items():
-            names = k.split("_")
-            if k not in names:
-                names.append(k)
-            for name in names:
-                if name in units and v is not None:
-                    try:
-                        base_unit_kwargs[k] = v.to(units[name]).m
-                    except AttributeError:
-                        try:
-                            base_unit_kwargs[k] = Q_(v, units[name]).m
-                        except TypeError:
-                            # Handle erros that we get with bool for example
-                            base_unit_kwargs[k] = v
-                    break
-            else:
-                base_unit_kwargs[k] = v
+        base_unit_args = [
+            _to_base_unit(arg_value, unit) for arg_value, unit in zip(args, args_units)
+        ]
+        # arguments passed to *args are not checked
+        base_unit_args.extend(args[len(args_units) :])
+
+        base_unit_kwargs = {
+            k: _to_base_unit(v, _arg_unit(k)) for k, v in kwargs.items()
+        }
 
         return func(*base_unit_args, **base_unit_kwargs)
 
     return inner
+
+
+@lru_cache(maxsize=None)
+def _arg_unit(arg_name):
+    """Return the default unit for an argument name.
+
+    The argument name is split on '_' and the first name found in the units
+    dictionary is used. None is returned if there is no unit for the argument.
+    """
+    names = arg_name.split("_")
+    if arg_name not in names:
+        names.append(arg_name)
+    for name in names:
+        if name in units:
+            return units[name]
+
+    return None
+
+
+def _to_base_unit(value, unit):
+    """Convert a value to the default unit.
+
+    Plain floats, ints and numpy arrays are already considered to be in the
+    default unit and are returned without creating a pint.Quantity.
+    """
+    if unit is None or value is None:
+        return value
+
+    if type(value) in (float, int) or isinstance(value, (np.floating, np.ndarray)):
+        return value
+
+    # For now, we only return the magnitude for the converted Quantity
+    # If pint is fully adopted by ross in the future, and we have all Quantities
+    # using it, we could remove this, which would allows us to use pint in its full capability
+    try:
+        return value.to(unit).m
+    except AttributeError:
+        try:
+            return Q_(value, unit).m
+        except TypeError:
+            # Handle erros that we get with bool for example
+            return value
+
+
+def unchecked(method):
+    """Return a function or method without the check_units wrapper.
+
+    This is used inside the library to call decorated methods in loops, when the
+    arguments are known to be in the default units already.
+
+    Parameters
+    ----------
+    method : callable
+        Function or bound method decorated with check_units.
+
+    Returns
+    -------
+    unchecked_method : callable
+        The undecorated function (bound to the same instance if a bound method
+        is given).
+
+    Examples
+    --------
+    >>> from ross.bearing_seal_element import bearing_example
+    >>> bearing = bearing_example()
+    >>> unchecked(bearing.K)(0)
+    array([[1000000.,       0.],
+           [      0.,  800000.]])
+    """
+    func = getattr(method, "__func__", method)
+    func = getattr(func, "__wrapped__", func)
+
+    if hasattr(method, "__self__"):
+        return func.__get__(method.__self__)
+
+    return func
@@ -1,8 +1,71 @@
 import re
+from importlib import import_module
 
 import numpy as np
-import pandas as pd
-from plotly import graph_objects as go
+
+
+class LazyModule:
+    """Module that is only imported on the first access to one of its attributes.
+
+    This is used for the dependencies that are not needed to build a rotor and
+    run the analyses (plotly, pandas, etc.), so that ``import ross`` stays fast.
+
+    Parameters
+    ----------
+    name : str
+        Name of the module (e.g. "plotly.graph_objects").
+    on_import : callable, optional
+        Function called once, right after the module is imported.
+
+    Examples
+    --------
+    >>> pd = LazyModule("pandas")
+    >>> pd.DataFrame({"a": [1]}).shape
+    (1, 1)
+    """
+
+    def __init__(self, name, on_import=None):
+        self._name = name
+        self._on_import = on_import
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            module = import_module(self._name)
+            if self._on_import is not None:
+                self._on_import()
+            self._module = module
+
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        return f"<lazy module '{self._name}'>"
+
+
+def _set_plotly_template():
+    import_module("ross.plotly_theme").set_ross_template()
+
+
+def lazy_plotly(name):
+    """Lazy import for plotly modules.
+
+    The ROSS template is registered as the plotly default template before the
+    first use of the module.
+
+    Parameters
+    ----------
+    name : str
+        Name of the plotly module (e.g. "plotly.graph_objects").
+
+    Returns
+    -------
+    module : LazyModule
+    """
+    return LazyModule(name, on_import=_set_plotly_template)
+
+
+pd = LazyModule("pandas")
+go = lazy_plotly("plotly.graph_objects")
 
 
 class DataNotFoundError(Exception):
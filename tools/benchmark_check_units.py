@@ -0,0 +1,107 @@
+"""Micro-benchmark for the check_units decorator.
+
+Compares the per-call overhead of the previous implementation (argument
+names and units resolved on every call, a pint.Quantity created for every
+value) with the current one and with the undecorated entry point.
+
+Usage:
+    python tools/benchmark_check_units.py
+"""
+import inspect
+import sys
+import timeit
+from functools import wraps
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+from ross.bearing_seal_element import bearing_example
+from ross.units import Q_, check_units, unchecked, units
+
+
+def legacy_check_units(func):
+    """check_units as it was before the fast path was added."""
+
+    @wraps(func)
+    def inner(*args, **kwargs):
+        base_unit_args = []
+        args_names = inspect.getfullargspec(func)[0]
+
+        for arg_name, arg_value in zip(args_names, args):
+            names = arg_name.split("_")
+            if arg_name not in names:
+                names.append(arg_name)
+            for name in names:
+                if name in units and arg_value is not None:
+                    try:
+                        base_unit_args.append(arg_value.to(units[name]).m)
+                    except AttributeError:
+                        try:
+                            base_unit_args.append(Q_(arg_value, units[name]).m)
+                        except TypeError:
+                            base_unit_args.append(arg_value)
+                    break
+            else:
+                base_unit_args.append(arg_value)
+
+        base_unit_kwargs = {}
+        for k, v in kwargs.items():
+            names = k.split("_")
+            if k not in names:
+                names.append(k)
+            for name in names:
+                if name in units and v is not None:
+                    try:
+                        base_unit_kwargs[k] = v.to(units[name]).m
+                    except AttributeError:
+                        try:
+                            base_unit_kwargs[k] = Q_(v, units[name]).m
+                        except TypeError:
+                            base_unit_kwargs[k] = v
+                    break
+            else:
+                base_unit_kwargs[k] = v
+
+        return func(*base_unit_args, **base_unit_kwargs)
+
+    return inner
+
+
+def _eigen(self, speed, num_modes=12, frequency=None, sparse=True, A=None):
+    return speed
+
+
+def per_call(stmt, number=20000):
+    """Return the best time per call in microseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+if __name__ == "__main__":
+    legacy = legacy_check_units(_eigen)
+    current = check_units(_eigen)
+
+    print("Decorator overhead (us per call) for a Rotor._eigen like signature")
+    print(f"{'':25}{'legacy':>10}{'current':>10}{'unchecked':>10}")
+    for label, args, kwargs in [
+        ("float", (None, 100.0), {}),
+        ("float + kwargs", (None, 100.0), dict(num_modes=12, frequency=100.0)),
+        ("ndarray", (None, np.ones(3)), {}),
+        ("pint.Quantity", (None, Q_(1000, "RPM")), {}),
+    ]:
+        times = [
+            per_call(lambda: f(*args, **kwargs))
+            for f in (legacy, current, unchecked(current))
+        ]
+        print(f"{label:25}" + "".join(f"{t:10.2f}" for t in times))
+
+    bearing = bearing_example()
+    legacy_K = legacy_check_units(unchecked(type(bearing).K))
+    print("\nBearingElement.K(100.0) (us per call)")
+    print(f"{'legacy':>10}{'current':>10}{'unchecked':>10}")
+    times = [
+        per_call(lambda: legacy_K(bearing, 100.0), number=5000),
+        per_call(lambda: bearing.K(100.0), number=5000),
+        per_call(lambda: unchecked(bearing.K)(100.0), number=5000),
+    ]
+    print("".join(f"{t:10.2f}" for t in times))
@@ -0,0 +1,71 @@
+"""Benchmark for the time taken by ``import ross``.
+
+Each measurement runs ``import ross`` in a new interpreter and the best time is
+compared with the budget. The script exits with status 1 if the budget is
+exceeded or if one of the modules that should be loaded on first use (plotly,
+pandas, pint, ...) is imported by ``import ross``.
+
+Usage:
+    python tools/benchmark_import.py [--budget SECONDS] [--repeat N]
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+# import-time budget in seconds (best of the runs), measured on a laptop
+# class machine with warm caches
+BUDGET = 0.5
+
+# modules that must only be imported on first use
+LAZY_MODULES = [
+    "pandas",
+    "plotly",
+    "pint",
+    "toml",
+    "scipy.io",
+    "scipy.signal",
+    "ross.defects",
+    "ross.fluid_flow",
+]
+
+CODE = """
+import sys, time
+t0 = time.perf_counter()
+import ross
+t1 = time.perf_counter()
+print(t1 - t0)
+print(",".join(m for m in {modules} if m in sys.modules))
+"""
+
+
+def measure(repeat):
+    """Return the best import time and the lazy modules that were imported."""
+    times = []
+    loaded = set()
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", CODE.format(modules=LAZY_MODULES)],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent.parent,
+        ).stdout.split("\n")
+        times.append(float(output[0]))
+        loaded.update(m for m in output[1].split(",") if m)
+
+    return min(times), sorted(loaded)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--budget", type=float, default=BUDGET)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    best, loaded = measure(args.repeat)
+    print(f"import ross: {best:.3f} s (budget {args.budget:.3f} s)")
+    if loaded:
+        print(f"modules that should be lazy but were imported: {', '.join(loaded)}")
+
+    sys.exit(int(best > args.budget or bool(loaded)))